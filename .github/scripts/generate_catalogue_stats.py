@@ -11,6 +11,11 @@ from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
+try:
+	import orjson
+except ImportError:
+	orjson = None
+
 
 def parse_args() -> argparse.Namespace:
 	parser = argparse.ArgumentParser(
@@ -38,8 +43,15 @@ def parse_args() -> argparse.Namespace:
 
 
 def load_json(path: Path) -> dict[str, Any]:
-	with path.open("r", encoding="utf-8") as handle:
-		data = json.load(handle)
+	content = path.read_bytes()
+	data = None
+	if orjson is not None:
+		try:
+			data = orjson.loads(content)
+		except orjson.JSONDecodeError:
+			pass
+	if data is None:
+		data = json.loads(content)
 	if not isinstance(data, dict):
 		raise ValueError(f"Expected JSON object in {path}")
 	return data
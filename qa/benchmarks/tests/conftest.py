@@ -8,6 +8,9 @@ from typing import Callable
 import openeo
 import pytest
 import requests
+from apex_algorithm_qa_tools.benchmarks.openeo import deselect_by_backend_filter
+from apex_algorithm_qa_tools.benchmarks.orchestrator import BenchmarkOrchestrator, ItemRequest
+from apex_algorithm_qa_tools.benchmarks.runners.factory import create_benchmark_runner
 
 # TODO: how to make sure the logging/printing from this plugin is actually visible by default?
 _log = logging.getLogger(__name__)
@@ -51,6 +54,35 @@ def pytest_addoption(parser):
         type=int,
         help="Maximum time in minutes a batch job is allowed to run before the test fails due to timeout.",
     )
+    parser.addoption(
+        "--job-duration-history",
+        metavar="LOCATION",
+        action="store",
+        default=None,
+        help="Parquet metrics dataset (local path or 's3://bucket/key') with earlier runs,"
+        " to estimate job durations from and adapt job status polling to.",
+    )
+    parser.addoption(
+        "--concurrent-jobs",
+        action="store_true",
+        help="Run the jobs of all selected benchmarks concurrently in the background (instead of one by one).",
+    )
+    parser.addoption(
+        "--max-jobs-per-backend",
+        metavar="N",
+        action="store",
+        default=4,
+        type=int,
+        help="Maximum number of concurrent jobs per backend (with `--concurrent-jobs`).",
+    )
+    parser.addoption(
+        "--result-download",
+        action="store",
+        choices=["all", "reference"],
+        default="all",
+        help="Which result assets to download: all of them, or only the ones with reference data"
+        " (unless overridden with the scenario's `download` reference option).",
+    )
     parser.addoption(
         "--upload-benchmark-report",
         action="store_true",
@@ -82,6 +114,8 @@ def pytest_collection_modifyitems(session, config, items):
     """
     Pytest hook to filter/reorder collected test items.
     """
+    deselect_by_backend_filter(config=config, items=items)
+
     # Optionally, select a random subset of benchmarks to run.
     # based on https://alexwlchan.net/til/2024/run-random-subset-of-tests-in-pytest/
     subset_size = config.getoption("--random-subset")
@@ -92,4 +126,39 @@ def pytest_collection_modifyitems(session, config, items):
             selected_ids = set(item.nodeid for item in selected)
             deselected = [item for item in items if item.nodeid not in selected_ids]
             config.hook.pytest_deselected(items=deselected)
-            items[:] = selected
\ No newline at end of file
+            items[:] = selected
+
+
+_ORCHESTRATOR = pytest.StashKey[BenchmarkOrchestrator]()
+
+
+def pytest_collection_finish(session):
+    """
+    Pytest hook called after collection: in `--concurrent-jobs` mode,
+    start running the jobs of all selected benchmarks in the background.
+    """
+    config = session.config
+    if not config.getoption("--concurrent-jobs") or config.getoption("--collect-only"):
+        return
+    orchestrator = BenchmarkOrchestrator(
+        create_runner=create_benchmark_runner,
+        max_jobs_per_backend=config.getoption("--max-jobs-per-backend"),
+        max_minutes=config.getoption("--maximum-job-time-in-minutes"),
+    )
+    config.stash[_ORCHESTRATOR] = orchestrator
+    for item in session.items:
+        scenario = item.callspec.params.get("scenario") if hasattr(item, "callspec") else None
+        if scenario is not None:
+            orchestrator.submit(scenario=scenario, request=ItemRequest(item))
+
+
+def pytest_sessionfinish(session):
+    orchestrator = session.config.stash.get(_ORCHESTRATOR, None)
+    if orchestrator:
+        orchestrator.shutdown()
+
+
+@pytest.fixture
+def benchmark_orchestrator(request) -> BenchmarkOrchestrator | None:
+    """Benchmark orchestrator (in `--concurrent-jobs` mode), or None."""
+    return request.config.stash.get(_ORCHESTRATOR, None)
@@ -6,17 +6,20 @@ import pytest
 from apex_algorithm_qa_tools.scenarios import (
     BenchmarkScenario,
     download_reference_data,
-    get_benchmark_scenarios,
+    get_scenario_index,
 )
-from openeo.testing.results import assert_job_results_allclose
 
+from apex_algorithm_qa_tools.benchmarks.compare import collect_metrics_from_comparison, compare_job_results
+from apex_algorithm_qa_tools.benchmarks.fingerprint import match_reference_fingerprints
 from apex_algorithm_qa_tools.benchmarks.runners.factory import (
     create_benchmark_runner
 )
 
 from apex_algorithm_qa_tools.benchmarks.common import (
     analyse_results_comparison_exception, 
+    collect_metrics_from_download_stats,
     collect_metrics_from_job_metadata, 
+    collect_metrics_from_poll_stats,
     collect_metrics_from_results_metadata
 )
 
@@ -28,7 +31,7 @@ _log = logging.getLogger(__name__)
     [
         # Use scenario id as parameterization id to give nicer test names.
         pytest.param(uc, id=uc.id)
-        for uc in get_benchmark_scenarios()
+        for uc in get_scenario_index()
     ],
 )
 def test_run_benchmark(
@@ -38,15 +41,22 @@ def test_run_benchmark(
     track_phase,
     upload_assets_on_fail,
     request,
+    benchmark_orchestrator,
 ):
     track_metric("scenario_id", scenario.id)
     track_metric("scenario_type", scenario.type)
 
     with track_phase(phase="connect"):
-        runner = create_benchmark_runner(
-            request=request,
-            scenario=scenario,
-        )
+        runner = None
+        if benchmark_orchestrator:
+            # Job is run in the background: runner just waits for (and replays) each step.
+            # Note: None if the benchmark was not submitted (e.g. not selected at collection time).
+            runner = benchmark_orchestrator.get_runner(request)
+        if runner is None:
+            runner = create_benchmark_runner(
+                request=request,
+                scenario=scenario,
+            )
 
     report_path = None
     if request.config.getoption("--upload-benchmark-report"):
@@ -95,7 +105,11 @@ def test_run_benchmark(
 
     with track_phase(phase="run-job"):
         max_minutes = request.config.getoption("--maximum-job-time-in-minutes")
-        runner.run_job(max_minutes=max_minutes)
+        try:
+            runner.run_job(max_minutes=max_minutes)
+        finally:
+            if runner.poll_stats:
+                collect_metrics_from_poll_stats(runner.poll_stats, track_metric=track_metric)
 
     with track_phase(phase="collect-metadata"):
         artifacts = runner.collect_artifacts()
@@ -117,7 +131,11 @@ def test_run_benchmark(
 
     with track_phase(phase="download-actual"):
         actual_dir = tmp_path / "actual"
-        paths = runner.download_actual(actual_dir=actual_dir)
+        try:
+            paths = runner.download_actual(actual_dir=actual_dir)
+        finally:
+            if runner.download_stats:
+                collect_metrics_from_download_stats(runner.download_stats, track_metric=track_metric)
         # Upload assets on failure
         upload_assets_on_fail(*paths)
 
@@ -129,8 +147,23 @@ def test_run_benchmark(
     }
     actual_s3_urls = {k: v for k, v in actual_s3_urls.items() if v is not None}
 
+    tolerances = dict(
+        rtol=scenario.reference_options.get("rtol", 1e-3),
+        atol=scenario.reference_options.get("atol", 1),
+        pixel_tolerance=scenario.reference_options.get("pixel_tolerance", 1),
+    )
+
     with track_phase(phase="download-reference"):
-        reference_dir = download_reference_data(scenario=scenario, reference_dir=tmp_path / "reference")
+        # Tiered comparison: reference files with a fingerprint matching the actual results
+        # do not have to be downloaded and compared in full.
+        fingerprint_matches = match_reference_fingerprints(scenario=scenario, actual_dir=actual_dir, **tolerances)
+        reference_hashes = {}
+        reference_dir = download_reference_data(
+            scenario=scenario,
+            reference_dir=tmp_path / "reference",
+            hashes=reference_hashes,
+            skip=fingerprint_matches.keys(),
+        )
 
     if report_path is not None:
         report = json.loads(report_path.read_text())
@@ -152,6 +185,8 @@ def test_run_benchmark(
                 size_str += f" (actual: {actual_counterpart.stat().st_size / 1024:.1f} kb)"
             ref_files[str(rel)] = size_str
         report["reference_files"] = ref_files
+        if fingerprint_matches:
+            report["fingerprint_matched_files"] = sorted(fingerprint_matches)
         if actual_s3_urls:
             report["actual_data"] = actual_s3_urls
         report_path.write_text(json.dumps(report, indent=2))
@@ -162,21 +197,25 @@ def test_run_benchmark(
 
     with track_phase(phase="compare", describe_exception=analyse_results_comparison_exception):
         # Compare actual results with reference data
+        # (skipping files that are identical to the reference, based on content hashes,
+        # or that already matched the reference fingerprint)
+        comparison = compare_job_results(
+            actual=actual_dir,
+            expected=reference_dir,
+            actual_hashes={s.path.name: s.sha256 for s in runner.download_stats or [] if s.sha256},
+            expected_hashes=reference_hashes,
+            fingerprint_matches=fingerprint_matches,
+            **tolerances,
+        )
+        collect_metrics_from_comparison(comparison, track_metric=track_metric)
         try:
-            assert_job_results_allclose(
-                actual=actual_dir,
-                expected=reference_dir,
-                tmp_path=tmp_path,
-                rtol=scenario.reference_options.get("rtol", 1e-3),
-                atol=scenario.reference_options.get("atol", 1),
-                pixel_tolerance=scenario.reference_options.get("pixel_tolerance", 1),
-            )
+            comparison.raise_for_issues()
         except AssertionError as e:
             msg = str(e)
             if scenario.reference_data:
                 msg += "\n\nReference data URLs:"
-                for name, url in scenario.reference_data.items():
-                    msg += f"\n  {name}: {url}"
+                for name, source in scenario.get_reference_sources().items():
+                    msg += f"\n  {name}: {source.href}"
             if actual_s3_urls:
                 msg += "\n\nActual data S3 URLs (uploaded on failure):"
                 for name, url in actual_s3_urls.items():
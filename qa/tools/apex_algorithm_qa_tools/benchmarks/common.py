@@ -1,14 +1,23 @@
 from __future__ import annotations
 
 import dataclasses
+import fnmatch
+import glob
+import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 from typing import Union
-from urllib.parse import urlparse
 
 from apex_algorithm_qa_tools.pytest.pytest_track_metrics import MetricsTracker
+from apex_algorithm_qa_tools.benchmarks.polling import DURATION_METRIC, PollStats
 from apex_algorithm_qa_tools.benchmarks.runners.base import BenchmarkJobMetadata, BenchmarkResults
-import requests
+from apex_algorithm_qa_tools.downloads import DownloadStats
+from apex_algorithm_qa_tools.scenarios import BenchmarkScenario
+
+_log = logging.getLogger(__name__)
+
+# File name of the job result metadata (always downloaded)
+JOB_RESULTS_FILENAME = "job-results.json"
 
 
 @dataclasses.dataclass
@@ -21,6 +30,47 @@ class BenchmarkExecutionArtifacts:
     paths: list[Path]
 
 
+@dataclasses.dataclass(frozen=True)
+class ResultDownloadPolicy:
+    """
+    Selection of result assets to download, based on the relative path of the downloaded file:
+    all assets (`patterns` is None) or only the ones matching one of the given glob patterns.
+    The job result metadata (`job-results.json`) is always downloaded.
+    """
+
+    patterns: tuple[str, ...] | None = None
+
+    def accepts(self, path: str) -> bool:
+        if self.patterns is None or path == JOB_RESULTS_FILENAME:
+            return True
+        return any(fnmatch.fnmatchcase(path, pattern) for pattern in self.patterns)
+
+    @classmethod
+    def from_scenario(cls, scenario: BenchmarkScenario, *, default: str = "all") -> ResultDownloadPolicy:
+        """
+        Build policy from the scenario's "download" reference option
+        ("all", "reference" or a list of glob patterns), falling back to the given default.
+        With "reference", only assets that have reference data are downloaded.
+        """
+        policy = scenario.reference_options.get("download", default)
+        if policy == "all":
+            return cls()
+        elif policy == "reference":
+            if not scenario.reference_data:
+                _log.info(f"No reference data for {scenario.id=}: downloading all result assets")
+                return cls()
+            return cls(patterns=tuple(glob.escape(path) for path in scenario.reference_data))
+        elif isinstance(policy, list):
+            return cls(patterns=tuple(policy))
+        raise ValueError(f"Invalid result download policy {policy!r} for {scenario.id=}")
+
+
+def get_result_download_policy(scenario: BenchmarkScenario, request) -> ResultDownloadPolicy:
+    """Get result download policy for a benchmark scenario (with default from the `--result-download` option)."""
+    default = request.config.getoption("--result-download", default=None) or "all"
+    return ResultDownloadPolicy.from_scenario(scenario, default=default)
+
+
 def ensure_safe_relative_target(base_dir: Path, relative_path: str) -> Path:
     """Resolve a relative path under base_dir and reject path traversal."""
 
@@ -51,6 +101,26 @@ def collect_metrics_from_job_metadata(
             track_metric(f"usage:{usage_metric.name}:{usage_metric.unit}", usage_metric.value)
 
 
+def collect_metrics_from_poll_stats(poll_stats: PollStats, track_metric: MetricsTracker):
+    track_metric("poll:count", poll_stats.count)
+    track_metric("poll:overshoot_seconds", poll_stats.overshoot_seconds)
+    track_metric(DURATION_METRIC, poll_stats.duration_seconds)
+
+
+def collect_metrics_from_download_stats(download_stats: Iterable[DownloadStats], track_metric: MetricsTracker):
+    # Note: total download time is covered by the "download-actual" phase duration
+    downloaded = [s for s in download_stats if not s.skipped]
+    skipped = [s for s in download_stats if s.skipped]
+    for stats in downloaded:
+        track_metric(f"download:asset:{stats.name}:bytes", stats.size)
+        track_metric(f"download:asset:{stats.name}:megabytes_per_second", stats.bytes_per_second / 1e6)
+    track_metric("download:total:assets", len(downloaded))
+    track_metric("download:total:bytes", sum(s.size for s in downloaded))
+    if skipped:
+        track_metric("download:skipped:assets", len(skipped))
+        track_metric("download:skipped:bytes", sum(s.size for s in skipped))
+
+
 def collect_metrics_from_results_metadata(results_metadata: BenchmarkResults, track_metric: MetricsTracker):
     proj_shape_area_mpx = []
     proj_shape_area_km2 = []
@@ -78,17 +148,3 @@ def analyse_results_comparison_exception(exc: Exception) -> Union[str, None]:
         if "Differing 'derived_from' links" in str(exc):
             return "derived_from-change"
 
-
-def download_file(href: str, target: Path, user_token: str | None = None):
-    parsed = urlparse(href)
-    target.parent.mkdir(parents=True, exist_ok=True)
-
-    if parsed.scheme in {"http", "https"}:
-        headers = {"Authorization": f"Bearer {user_token}"} if user_token else None
-        with requests.get(href, headers=headers, stream=True) as response:
-            response.raise_for_status()
-            with target.open("wb") as fh:
-                for chunk in response.iter_content(chunk_size=1024 * 64):
-                    fh.write(chunk)
-    else:
-        raise ValueError(f"Unsupported URL scheme in href: {href!r}")
@@ -0,0 +1,248 @@
+"""
+Comparison of actual benchmark results with reference data:
+like `openeo.testing.results.assert_job_results_allclose()`,
+but skipping byte-identical files (based on content hashes)
+and comparing the remaining files in parallel (in separate processes).
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import multiprocessing
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List, Mapping
+
+from apex_algorithm_qa_tools.benchmarks.common import JOB_RESULTS_FILENAME
+from apex_algorithm_qa_tools.benchmarks.raster_compare import (
+    GEOTIFF_SUFFIXES,
+    NETCDF_SUFFIXES,
+    compare_rasters_windowed,
+    get_decoded_size,
+)
+from apex_algorithm_qa_tools.downloads import CHUNK_SIZE
+from apex_algorithm_qa_tools.pytest.pytest_track_metrics import MetricsTracker
+from apex_algorithm_qa_tools.reference_cache import link_or_copy
+
+_log = logging.getLogger(__name__)
+
+# Minimum decoded raster size (bytes) to compare rasters window by window (instead of loading them fully in memory)
+DEFAULT_WINDOWED_MIN_SIZE = 256 * 1024 * 1024
+
+
+def file_sha256(path: Path) -> str:
+    """Compute SHA-256 hex digest of a file (streaming)."""
+    hasher = hashlib.sha256()
+    with path.open("rb") as f:
+        while chunk := f.read(CHUNK_SIZE):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+@dataclasses.dataclass(frozen=True)
+class FileComparison:
+    name: str
+    # Whether actual and expected file are byte-identical (in which case no detailed comparison was done)
+    identical: bool
+    issues: List[str]
+    # Comparison duration in seconds (including hashing)
+    seconds: float
+    # Whether only the fingerprints (summary statistics) were compared (see `match_reference_fingerprints()`)
+    fingerprint_match: bool = False
+
+
+@dataclasses.dataclass(frozen=True)
+class JobResultsComparison:
+    # Issues not related to a single file (e.g. file set mismatch)
+    issues: List[str]
+    files: List[FileComparison]
+
+    def get_issues(self) -> List[str]:
+        """All issues, formatted like `assert_job_results_allclose()`."""
+        issues = list(self.issues)
+        for file in self.files:
+            if file.issues:
+                if file.name == JOB_RESULTS_FILENAME:
+                    issues.append(f"Issues for metadata file {file.name!r}:")
+                else:
+                    issues.append(f"Issues for file {file.name!r}:")
+                issues.extend(file.issues)
+        return issues
+
+    def raise_for_issues(self):
+        """Raise AssertionError (like `assert_job_results_allclose()`) if there are issues."""
+        issues = self.get_issues()
+        if issues:
+            raise AssertionError("\n".join(issues))
+
+
+def _compare_file(
+    actual: Path,
+    expected: Path,
+    *,
+    rtol: float,
+    atol: float,
+    pixel_tolerance: float,
+    windowed_min_size: int | None = None,
+) -> List[str]:
+    """Detailed comparison of a single result file (same logic as `assert_job_results_allclose()`)."""
+    suffix = expected.suffix.lower()
+    if (
+        expected.name != JOB_RESULTS_FILENAME
+        and windowed_min_size is not None
+        and suffix in GEOTIFF_SUFFIXES | NETCDF_SUFFIXES
+        and max(get_decoded_size(actual), get_decoded_size(expected)) >= windowed_min_size
+    ):
+        _log.info(f"Comparing large raster {expected.name!r} window by window")
+        return compare_rasters_windowed(
+            actual=actual, expected=expected, rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance
+        )
+
+    # Note: using the per-file building blocks of `assert_job_results_allclose()`,
+    # to compare files independently (and in parallel).
+    # These are not part of the public openeo API: fall back on the public function if they are not available.
+    try:
+        from openeo.testing.results import (
+            _compare_job_result_metadata,
+            _compare_xarray_dataarray,
+            _compare_xarray_datasets,
+        )
+    except ImportError as e:
+        _log.warning(f"Falling back on `assert_job_results_allclose()` to compare {expected.name!r}: {e!r}")
+        return _compare_file_allclose(actual, expected, rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance)
+
+    if expected.name == JOB_RESULTS_FILENAME:
+        return _compare_job_result_metadata(actual=actual, expected=expected)
+    elif suffix in NETCDF_SUFFIXES:
+        return _compare_xarray_datasets(
+            actual=actual, expected=expected, rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance
+        )
+    elif suffix in GEOTIFF_SUFFIXES:
+        return _compare_xarray_dataarray(
+            actual=actual, expected=expected, rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance
+        )
+    _log.warning(f"Unhandled job result asset {expected.name!r}")
+    return []
+
+
+def _compare_file_allclose(
+    actual: Path, expected: Path, *, rtol: float, atol: float, pixel_tolerance: float
+) -> List[str]:
+    """
+    Compare a single result file with the public `assert_job_results_allclose()`,
+    applied to result directories containing just that file.
+    """
+    from openeo.testing.results import assert_job_results_allclose
+
+    with tempfile.TemporaryDirectory(prefix="compare-") as tmp:
+        actual_dir = Path(tmp) / "actual"
+        expected_dir = Path(tmp) / "expected"
+        for directory, path in [(actual_dir, actual), (expected_dir, expected)]:
+            directory.mkdir()
+            link_or_copy(path, directory / expected.name)
+        try:
+            assert_job_results_allclose(
+                actual=actual_dir,
+                expected=expected_dir,
+                rtol=rtol,
+                atol=atol,
+                pixel_tolerance=pixel_tolerance,
+                tmp_path=Path(tmp),
+            )
+        except AssertionError as e:
+            # Strip the "Issues for file ..." header (note: issues can be multi-line, so not split in lines)
+            return str(e).split("\n", 1)[1:]
+    return []
+
+
+def _timed_compare_file(actual: Path, expected: Path, **kwargs) -> FileComparison:
+    start = time.monotonic()
+    issues = _compare_file(actual, expected, **kwargs)
+    return FileComparison(name=expected.name, identical=False, issues=issues, seconds=time.monotonic() - start)
+
+
+def compare_job_results(
+    actual: Path,
+    expected: Path,
+    *,
+    rtol: float = 1e-6,
+    atol: float = 1e-6,
+    pixel_tolerance: float = 0.0,
+    actual_hashes: Mapping[str, str] | None = None,
+    expected_hashes: Mapping[str, str] | None = None,
+    max_workers: int | None = None,
+    windowed_min_size: int | None = DEFAULT_WINDOWED_MIN_SIZE,
+    fingerprint_matches: Mapping[str, FileComparison] | None = None,
+) -> JobResultsComparison:
+    """
+    Compare actual job results with expected ones (directories with downloaded assets and metadata).
+
+    Files with identical content hash are considered equal without further comparison,
+    other files are compared in detail, in parallel processes (when there are multiple).
+
+    :param actual_hashes: known SHA-256 hashes of the actual files, by file name (e.g. computed while downloading).
+        Hashes of other files are computed when necessary.
+    :param expected_hashes: known SHA-256 hashes of the expected files, by file name.
+    :param max_workers: maximum number of parallel comparison processes (default: number of CPUs)
+    :param windowed_min_size: minimum decoded raster size (bytes, see `get_decoded_size()`)
+        to compare rasters window by window, with bounded memory usage (see `compare_rasters_windowed()`).
+        None to disable.
+    :param fingerprint_matches: files (by name) that were already found to match the reference
+        based on their fingerprints (see `match_reference_fingerprints()`),
+        and are therefore not expected in the `expected` directory.
+    """
+    actual_filenames = set(p.name for p in actual.glob("*") if p.is_file())
+    expected_filenames = set(p.name for p in expected.glob("*") if p.is_file())
+    files: Dict[str, FileComparison] = {}
+    for match in (fingerprint_matches or {}).values():
+        files[match.name] = match
+    expected_filenames.update(files)
+    issues = []
+    if len(actual_filenames) == 0 or len(expected_filenames) == 0:
+        _log.warning(f"Empty actual/expected listing: {actual_filenames=} {expected_filenames=}")
+    if actual_filenames != expected_filenames:
+        issues.append(f"File set mismatch: {actual_filenames} != {expected_filenames}")
+
+    to_compare = []
+    for name in sorted(expected_filenames.intersection(actual_filenames).difference(files)):
+        start = time.monotonic()
+        actual_hash = (actual_hashes or {}).get(name) or file_sha256(actual / name)
+        expected_hash = (expected_hashes or {}).get(name) or file_sha256(expected / name)
+        if actual_hash == expected_hash:
+            _log.info(f"Job result file {name!r} is identical to reference: skipping detailed comparison")
+            files[name] = FileComparison(name=name, identical=True, issues=[], seconds=time.monotonic() - start)
+        else:
+            to_compare.append(name)
+
+    kwargs = dict(rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance, windowed_min_size=windowed_min_size)
+    if len(to_compare) == 1:
+        name = to_compare[0]
+        files[name] = _timed_compare_file(actual / name, expected / name, **kwargs)
+    elif to_compare:
+        max_workers = min(len(to_compare), max_workers or os.cpu_count() or 1)
+        _log.info(f"Comparing {len(to_compare)} job result files with {max_workers} processes")
+        # Note: "spawn" instead of "fork", as the (pytest) process might be running other threads.
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = {
+                name: executor.submit(_timed_compare_file, actual / name, expected / name, **kwargs)
+                for name in to_compare
+            }
+            for name, future in futures.items():
+                files[name] = future.result()
+
+    return JobResultsComparison(issues=issues, files=[files[name] for name in sorted(files)])
+
+
+def collect_metrics_from_comparison(comparison: JobResultsComparison, track_metric: MetricsTracker):
+    for file in comparison.files:
+        track_metric(f"compare:file:{file.name}:seconds", file.seconds)
+    track_metric("compare:identical_files", sum(f.identical for f in comparison.files))
+    track_metric("compare:fingerprint_matched_files", sum(f.fingerprint_match for f in comparison.files))
+    track_metric("compare:compared_files", sum(not (f.identical or f.fingerprint_match) for f in comparison.files))
@@ -0,0 +1,412 @@
+"""
+Statistical fingerprints of raster result files (GeoTIFF, NetCDF):
+the raster geometry (shape, data type, CRS and geotransform or coordinates)
+and per band (or NetCDF variable) the value count, nodata fraction, min/max/mean/std and a coarse histogram.
+
+Fingerprints of reference data are stored as sidecar JSON files
+(generated with `python -m apex_algorithm_qa_tools.benchmarks.fingerprint`),
+so that actual results can be checked against the reference
+without downloading and comparing the full reference data,
+unless the fingerprints diverge beyond tolerance.
+"""
+
+from __future__ import annotations
+
+import argparse
+import dataclasses
+import hashlib
+import json
+import logging
+import math
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+import numpy
+import requests
+
+from apex_algorithm_qa_tools.benchmarks.compare import FileComparison
+from apex_algorithm_qa_tools.benchmarks.raster_compare import (
+    DEFAULT_WINDOW_SIZE,
+    GEOTIFF_SUFFIXES,
+    NETCDF_SUFFIXES,
+    array_windows,
+    geotiff_windows,
+)
+from apex_algorithm_qa_tools.common import json_loads, load_json
+from apex_algorithm_qa_tools.downloads import DEFAULT_TIMEOUT, create_session
+from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
+
+_log = logging.getLogger(__name__)
+
+FINGERPRINT_VERSION = 1
+
+# Suffix of fingerprint sidecar files (e.g. "openEO.tif.fingerprint.json")
+FINGERPRINT_SUFFIX = ".fingerprint.json"
+
+DEFAULT_HISTOGRAM_BINS = 16
+
+
+@dataclasses.dataclass(frozen=True)
+class BandFingerprint:
+    # Total number of values (including nodata)
+    count: int
+    nodata_fraction: float
+    # Statistics of the valid (non-nodata) values (None if there are none)
+    min: float | None
+    max: float | None
+    mean: float | None
+    std: float | None
+    # Histogram of the valid values: bin edges and counts per bin
+    histogram_edges: List[float]
+    histogram: List[int]
+
+    @property
+    def valid_count(self) -> int:
+        return self.count - round(self.nodata_fraction * self.count)
+
+
+@dataclasses.dataclass(frozen=True)
+class Fingerprint:
+    # Band fingerprints, by band name (GeoTIFF band index, or NetCDF variable name)
+    bands: Dict[str, BandFingerprint]
+    # Raster geometry (JSON compatible), e.g. shape, data types, CRS and geotransform of a GeoTIFF,
+    # or dimensions and coordinate hashes of a NetCDF file
+    geometry: Dict[str, Any]
+
+    def to_dict(self) -> dict:
+        return {
+            "version": FINGERPRINT_VERSION,
+            "geometry": self.geometry,
+            "bands": {name: dataclasses.asdict(band) for name, band in self.bands.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Fingerprint:
+        if data.get("version") != FINGERPRINT_VERSION:
+            raise ValueError(f"Unsupported fingerprint version: {data.get('version')!r}")
+        return cls(
+            bands={name: BandFingerprint(**band) for name, band in data["bands"].items()},
+            geometry=data["geometry"],
+        )
+
+    def get_histogram_edges(self) -> Dict[str, List[float]]:
+        """Histogram bin edges by band name (e.g. to compute a comparable fingerprint of other data)."""
+        return {name: band.histogram_edges for name, band in self.bands.items()}
+
+
+class _BandAccumulator:
+    """
+    Streaming accumulation of band statistics in a single pass:
+    statistics of each window are computed with vectorized numpy operations
+    and merged into the running totals (Chan et al. for mean and variance).
+
+    :param nodata: nodata value (in addition to NaN)
+    :param edges: histogram bin edges (None: no histogram)
+    """
+
+    def __init__(self, *, nodata: float | None = None, edges: Sequence[float] | None = None):
+        self.nodata = nodata
+        self.edges = numpy.asarray(edges, dtype=numpy.float64) if edges else None
+        self.count = 0
+        self.nodata_count = 0
+        self.valid_count = 0
+        self.min = math.inf
+        self.max = -math.inf
+        self.mean = 0.0
+        # Sum of squared differences from the mean
+        self.m2 = 0.0
+        self.histogram = numpy.zeros(len(self.edges) - 1 if self.edges is not None else 0, dtype=numpy.int64)
+
+    def update(self, values: numpy.ndarray):
+        values = numpy.asarray(values).astype(numpy.float64, copy=False).ravel()
+        self.count += values.size
+        nodata = numpy.isnan(values)
+        if self.nodata is not None and not math.isnan(self.nodata):
+            nodata |= values == self.nodata
+        valid = values[~nodata]
+        self.nodata_count += values.size - valid.size
+        if valid.size == 0:
+            return
+        mean = float(valid.mean())
+        m2 = float(numpy.square(valid - mean).sum())
+        total = self.valid_count + valid.size
+        delta = mean - self.mean
+        self.mean += delta * valid.size / total
+        self.m2 += m2 + delta * delta * self.valid_count * valid.size / total
+        self.valid_count = total
+        self.min = min(self.min, float(valid.min()))
+        self.max = max(self.max, float(valid.max()))
+        if self.edges is not None:
+            self.histogram += numpy.histogram(valid, bins=self.edges)[0]
+
+    def get_histogram_edges(self, bins: int) -> List[float]:
+        """Histogram bin edges covering the accumulated value range."""
+        if self.valid_count == 0:
+            return []
+        elif self.min == self.max:
+            return [self.min, self.max]
+        return numpy.linspace(self.min, self.max, bins + 1).tolist()
+
+    def get_fingerprint(self) -> BandFingerprint:
+        has_valid = self.valid_count > 0
+        return BandFingerprint(
+            count=self.count,
+            nodata_fraction=self.nodata_count / self.count if self.count else 0.0,
+            min=self.min if has_valid else None,
+            max=self.max if has_valid else None,
+            mean=self.mean if has_valid else None,
+            std=math.sqrt(self.m2 / self.valid_count) if has_valid else None,
+            histogram_edges=self.edges.tolist() if self.edges is not None else [],
+            histogram=self.histogram.tolist(),
+        )
+
+
+def _scan_geotiff(
+    path: Path, *, edges: Mapping[str, Sequence[float]], window_size: int
+) -> Tuple[Dict[str, Any], Dict[str, _BandAccumulator]]:
+    import rasterio
+
+    with rasterio.open(path) as dataset:
+        geometry = {
+            "shape": [dataset.count, dataset.height, dataset.width],
+            "dtypes": list(dataset.dtypes),
+            "crs": dataset.crs.to_wkt() if dataset.crs else None,
+            "transform": list(dataset.transform)[:6],
+        }
+        accumulators = {
+            str(b): _BandAccumulator(nodata=dataset.nodatavals[b - 1], edges=edges.get(str(b))) for b in dataset.indexes
+        }
+        for window in geotiff_windows(dataset, window_size=window_size):
+            for accumulator, values in zip(accumulators.values(), dataset.read(window=window)):
+                accumulator.update(values)
+    return geometry, accumulators
+
+
+def _hash_values(values: numpy.ndarray) -> str:
+    """SHA-256 hash of array values (and data type and shape)."""
+    hasher = hashlib.sha256(f"{values.dtype.str}{values.shape}".encode("utf8"))
+    if values.dtype.kind == "O":
+        hasher.update(repr(values.tolist()).encode("utf8"))
+    else:
+        hasher.update(numpy.ascontiguousarray(values).tobytes())
+    return hasher.hexdigest()
+
+
+def _scan_netcdf(
+    path: Path, *, edges: Mapping[str, Sequence[float]], window_size: int
+) -> Tuple[Dict[str, Any], Dict[str, _BandAccumulator]]:
+    import xarray
+
+    accumulators = {}
+    # Note: data is loaded lazily (only the indexed windows are read from disk), nodata is decoded to NaN
+    with xarray.open_dataset(path) as dataset:
+        grid_mappings = {v.attrs.get("grid_mapping") for v in dataset.data_vars.values()}
+        grid_mappings = grid_mappings.intersection(dataset.variables)
+        geometry = {
+            "variables": {
+                str(name): {"dims": [str(d) for d in v.dims], "shape": list(v.shape), "dtype": v.dtype.str}
+                for name, v in dataset.data_vars.items()
+            },
+            "coordinates": {str(name): _hash_values(c.values) for name, c in dataset.coords.items()},
+            "crs": {
+                str(name): dataset[name].attrs.get("crs_wkt") or dataset[name].attrs.get("spatial_ref")
+                for name in sorted(grid_mappings, key=str)
+            },
+        }
+        for name in sorted(dataset.data_vars, key=str):
+            variable = dataset[name]
+            if not numpy.issubdtype(variable.dtype, numpy.number):
+                continue
+            accumulator = accumulators[str(name)] = _BandAccumulator(edges=edges.get(str(name)))
+            for key in array_windows(variable, window_size=window_size):
+                accumulator.update(variable[key].values)
+    return geometry, accumulators
+
+
+def compute_fingerprint(
+    path: Path,
+    *,
+    edges: Mapping[str, Sequence[float]] | None = None,
+    bins: int = DEFAULT_HISTOGRAM_BINS,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> Fingerprint:
+    """
+    Compute fingerprint of a raster file (GeoTIFF or NetCDF), streaming the data window by window.
+
+    :param edges: histogram bin edges per band, e.g. from the reference fingerprint,
+        to compute a comparable fingerprint in a single pass.
+        If not given, bin edges are derived from the value range of each band (in a first pass).
+    :param bins: number of histogram bins (when bin edges are derived from the value range)
+    :param window_size: target number of values (per band) per window
+    """
+    suffix = path.suffix.lower()
+    if suffix in GEOTIFF_SUFFIXES:
+        scan = _scan_geotiff
+    elif suffix in NETCDF_SUFFIXES:
+        scan = _scan_netcdf
+    else:
+        raise ValueError(f"Unsupported raster file type: {path}")
+    if edges is None:
+        _, ranges = scan(path, edges={}, window_size=window_size)
+        edges = {name: accumulator.get_histogram_edges(bins) for name, accumulator in ranges.items()}
+    geometry, accumulators = scan(path, edges=edges, window_size=window_size)
+    return Fingerprint(
+        bands={name: accumulator.get_fingerprint() for name, accumulator in accumulators.items()},
+        geometry=geometry,
+    )
+
+
+def _compare_band_fingerprints(
+    actual: BandFingerprint, expected: BandFingerprint, *, rtol: float, atol: float, pixel_tolerance: float
+) -> List[str]:
+    if actual.count != expected.count:
+        return [f"Value count mismatch: {actual.count} != {expected.count}"]
+    issues = []
+    if actual.valid_count != expected.valid_count:
+        issues.append(f"Nodata fraction mismatch: {actual.nodata_fraction} != {expected.nodata_fraction}")
+    for stat in ["min", "max", "mean", "std"]:
+        a = getattr(actual, stat)
+        e = getattr(expected, stat)
+        if a is None or e is None:
+            if a != e:
+                issues.append(f"Statistic {stat!r} mismatch: {a} != {e}")
+        elif abs(a - e) > atol + rtol * abs(e):
+            issues.append(f"Statistic {stat!r} mismatch: {a} != {e}")
+    if actual.histogram_edges != expected.histogram_edges:
+        issues.append("Histogram bin edges mismatch")
+    elif expected.valid_count:
+        # Number of values in a different bin (or outside the bins)
+        moved = (
+            sum(abs(a - e) for a, e in zip(actual.histogram, expected.histogram))
+            + (actual.valid_count - sum(actual.histogram))
+            + (expected.valid_count - sum(expected.histogram))
+        ) / 2
+        percentage = moved / expected.valid_count * 100
+        if percentage > pixel_tolerance:
+            issues.append(f"Fraction of values in different histogram bins: {percentage}% > {pixel_tolerance}%")
+    return issues
+
+
+def compare_fingerprints(
+    actual: Fingerprint,
+    expected: Fingerprint,
+    *,
+    rtol: float = 1e-6,
+    atol: float = 1e-6,
+    pixel_tolerance: float = 0.0,
+) -> List[str]:
+    """
+    Compare fingerprints of actual and expected data, with the tolerance semantics of the full comparison:
+    statistics may differ by `atol + rtol * |expected|`,
+    and at most `pixel_tolerance` percent of the values may end up in a different histogram bin.
+    The raster geometry (shape, data type, CRS, geotransform or coordinates) must be identical.
+
+    Note that matching fingerprints do not guarantee matching pixels (e.g. shuffled values),
+    it's a cheap check that the data did not change significantly.
+
+    :return: list of issues (empty if no issues)
+    """
+    issues = []
+    for key in sorted(set(actual.geometry).union(expected.geometry)):
+        a = actual.geometry.get(key)
+        e = expected.geometry.get(key)
+        if a != e:
+            issues.append(f"Geometry mismatch ({key}): {a} != {e}")
+    if set(actual.bands) != set(expected.bands):
+        issues.append(f"Band set mismatch: {sorted(actual.bands)} != {sorted(expected.bands)}")
+    for name in sorted(set(actual.bands).intersection(expected.bands)):
+        band_issues = _compare_band_fingerprints(
+            actual.bands[name], expected.bands[name], rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance
+        )
+        if band_issues:
+            issues.append(f"Issues for band {name!r}:")
+            issues.extend(band_issues)
+    return issues
+
+
+def get_fingerprint_path(path: Path) -> Path:
+    """Path of the fingerprint sidecar file of given file."""
+    return path.with_name(path.name + FINGERPRINT_SUFFIX)
+
+
+def write_fingerprint(path: Path, **kwargs) -> Path:
+    """Compute fingerprint of given raster file and write it to a sidecar JSON file (returned)."""
+    fingerprint_path = get_fingerprint_path(path)
+    fingerprint = compute_fingerprint(path, **kwargs)
+    fingerprint_path.write_text(json.dumps(fingerprint.to_dict(), indent=2))
+    return fingerprint_path
+
+
+def load_fingerprint(href: str, *, session: requests.Session | None = None) -> Fingerprint:
+    """Load fingerprint sidecar file from URL (HTTP(S) or file://)."""
+    if href.startswith("file://"):
+        data = load_json(href[7:])
+    else:
+        resp = (session or requests).get(href, timeout=DEFAULT_TIMEOUT)
+        resp.raise_for_status()
+        data = json_loads(resp.content)
+    return Fingerprint.from_dict(data)
+
+
+def match_reference_fingerprints(
+    scenario: BenchmarkScenario,
+    actual_dir: Path,
+    *,
+    rtol: float = 1e-6,
+    atol: float = 1e-6,
+    pixel_tolerance: float = 0.0,
+) -> Dict[str, FileComparison]:
+    """
+    First tier of the result comparison: compare the fingerprints of actual result files
+    with the fingerprint sidecars of the reference data (`fingerprint` field of the reference data entries).
+
+    Files without fingerprint, or for which the fingerprint check fails, are not considered.
+
+    :return: comparison of the files with matching fingerprints, by (relative) reference data path.
+        These reference files do not have to be downloaded and compared in full.
+    """
+    sources = {
+        path: source
+        for path, source in scenario.get_reference_sources().items()
+        if source.fingerprint and (actual_dir / path).is_file()
+    }
+    matches = {}
+    if not sources:
+        return matches
+    with create_session() as session:
+        for path, source in sources.items():
+            start = time.monotonic()
+            try:
+                expected = load_fingerprint(source.fingerprint, session=session)
+                actual = compute_fingerprint(actual_dir / path, edges=expected.get_histogram_edges())
+            except Exception as e:
+                _log.warning(f"Failed to check fingerprint of {path!r}: {e!r}")
+                continue
+            issues = compare_fingerprints(actual, expected, rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance)
+            if issues:
+                _log.info(f"Fingerprint of {path!r} diverges from reference (full comparison needed): {issues}")
+            else:
+                _log.info(f"Fingerprint of {path!r} matches reference: skipping full comparison")
+                matches[path] = FileComparison(
+                    name=Path(path).name,
+                    identical=False,
+                    issues=[],
+                    seconds=time.monotonic() - start,
+                    fingerprint_match=True,
+                )
+    return matches
+
+
+def main():
+    """Generate fingerprint sidecar files for reference data files."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("paths", nargs="+", type=Path, help="Raster files (GeoTIFF or NetCDF)")
+    parser.add_argument("--bins", type=int, default=DEFAULT_HISTOGRAM_BINS, help="Number of histogram bins")
+    args = parser.parse_args()
+    for path in args.paths:
+        print(write_fingerprint(path, bins=args.bins))
+
+
+if __name__ == "__main__":
+    main()
@@ -6,7 +6,6 @@ import logging
 import mimetypes
 import os
 import re
-import time
 import urllib
 from pathlib import Path
 from urllib.parse import urlparse
@@ -21,13 +20,16 @@ from ogc_api_processes_client.models.input_value_no_object import InputValueNoOb
 from stac_pydantic.collection import Collection
 
 from apex_algorithm_qa_tools.benchmarks.auth import get_token_with_client_credentials, get_token_with_device_flow
+from apex_algorithm_qa_tools.benchmarks.polling import JobPoller
 from apex_algorithm_qa_tools.benchmarks.common import (
+    JOB_RESULTS_FILENAME,
     BenchmarkJobMetadata,
-    download_file,
+    ResultDownloadPolicy,
     ensure_safe_relative_target,
     to_jsonable,
 )
 from apex_algorithm_qa_tools.benchmarks.runners.base import BenchmarkResults
+from apex_algorithm_qa_tools.downloads import DownloadTask, ParallelDownloader
 from apex_algorithm_qa_tools.scenarios.ogc import OGCAPIBenchmarkScenario, OGCAPIResults
 
 from httpx import get as http_get, Response as HTTPXResponse
@@ -142,9 +144,11 @@ def run_ogc_job(
     user_token: str,
     job: dict,
     max_minutes: int | None,
+    poller: JobPoller | None = None,
 ) -> str:
     headers = _get_job_headers(user_token=user_token)
-    deadline = time.monotonic() + max_minutes * 60 if max_minutes else None
+    poller = poller or JobPoller()
+    poller.set_time_limit(max_minutes * 60 if max_minutes else None)
 
     # Execute the job
     content = api_client.execute_simple(process_id=scenario.application, execute=job, _headers=headers)
@@ -153,10 +157,9 @@ def run_ogc_job(
     # Check the status
     status = StatusCode.ACCEPTED
     while status not in _TERMINAL_JOB_STATUSES:
-        if deadline is not None and time.monotonic() > deadline:
-            raise TimeoutError(f"Batch job {job_id} exceeded maximum allowed time of {max_minutes} minutes")
-        time.sleep(5)
-        status = api_client.get_status(job_id=job_id).status
+        poller.raise_if_aborted(job=f"Batch job {job_id}", stop_job=lambda: api_client.dismiss(job_id=job_id, _headers=headers))
+        poller.wait()
+        status = poller.poll(lambda: api_client.get_status(job_id=job_id).status)
         _log.info(f"Job {job_id} is still running with status {status}...")
 
     # Check for job failure
@@ -326,18 +329,24 @@ def download_ogc_results(
     actual_dir: Path,
     user_token: str | None = None,
     details: OGCAPIResults | None = None,
+    downloader: ParallelDownloader | None = None,
+    policy: ResultDownloadPolicy | None = None,
 ) -> list[Path]:
     actual_dir.mkdir(parents=True, exist_ok=True)
+    downloader = downloader or ParallelDownloader()
+    policy = policy or ResultDownloadPolicy()
+    headers = {"Authorization": f"Bearer {user_token}"} if user_token else None
     paths: list[Path] = []
+    downloads: list[DownloadTask] = []
+    skipped: list[DownloadTask] = []
 
     _log.info(f"Downloading {len(results_metadata.assets)} OGC API results to {actual_dir=}")
-    results_path = actual_dir / "job-results.json"
+    results_path = actual_dir / JOB_RESULTS_FILENAME
     results_path.write_text(json.dumps(dataclasses.asdict(results_metadata), indent=2), encoding="utf8")
     paths.append(results_path)
 
     for output_name, output_data in sorted(results_metadata.assets.items()):
         output_data = to_jsonable(output_data)
-        _log.debug(f"Downloading OGC API result '{output_name}' to {actual_dir=}")
         if isinstance(output_data, dict):
             ref = _extract_download_link_from_asset(output_data)
             mimetype = output_data.get("type")
@@ -347,19 +356,25 @@ def download_ogc_results(
 
             file_name = _resolve_output_filename(output_name=output_name, href=ref, mimetype=mimetype)
             target = ensure_safe_relative_target(actual_dir, file_name)
-            target.parent.mkdir(parents=True, exist_ok=True)
-            download_file(
-                ref,
-                target,
-                user_token=user_token,
+            task = DownloadTask(
+                url=ref, path=target, name=output_name, headers=headers, size=output_data.get("file:size")
             )
-            paths.append(target)
+            if policy.accepts(file_name):
+                downloads.append(task)
+                paths.append(target)
+            else:
+                skipped.append(task)
+        elif not policy.accepts(f"{output_name}.json"):
+            _log.info(f"Result '{output_name}' not selected by download policy, skipping.")
         else:
             target = ensure_safe_relative_target(actual_dir, f"{output_name}.json")
             target.parent.mkdir(parents=True, exist_ok=True)
             target.write_text(json.dumps(output_data, indent=2), encoding="utf8")
             paths.append(target)
 
+    # Download the actual result files concurrently
+    downloader.download_all(downloads)
+    downloader.skip_all(skipped)
     return paths
 
 
@@ -1,3 +1,4 @@
+import json
 import logging
 import os
 import re
@@ -7,7 +8,14 @@ import pytest
 import requests
 import urllib
 from pathlib import Path
-import signal
+
+from openeo.rest import JobFailedException, OpenEoApiPlainError, OpenEoClientException
+from openeo.rest.job import DEFAULT_JOB_RESULTS_FILENAME
+
+from apex_algorithm_qa_tools.benchmarks.common import ResultDownloadPolicy
+from apex_algorithm_qa_tools.benchmarks.polling import JobPoller
+from apex_algorithm_qa_tools.downloads import DownloadTask, ParallelDownloader
+from apex_algorithm_qa_tools.scenarios.common import get_scenario_index
 
 _log = logging.getLogger(__name__)
 
@@ -47,12 +55,35 @@ def _get_client_credentials_env_var(url: str) -> str:
     raise ValueError(f"Unsupported backend: {url=} ({hostname=})")
 
 
+def deselect_by_backend_filter(config, items: list) -> None:
+    """
+    Deselect collected benchmark test items with an openEO scenario
+    of which the backend does not match the `--backend-filter` regex.
+    """
+    backend_filter = config.getoption("--backend-filter")
+    if not backend_filter:
+        return
+    matching = {s.id for s in get_scenario_index().filter_backend(backend_filter)}
+    selected = []
+    deselected = []
+    for item in items:
+        scenario = item.callspec.params.get("scenario") if hasattr(item, "callspec") else None
+        if scenario is not None and scenario.type == "openeo" and scenario.id not in matching:
+            deselected.append(item)
+        else:
+            selected.append(item)
+    if deselected:
+        _log.info(f"Deselecting {len(deselected)} benchmarks not matching backend filter {backend_filter!r}")
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
 def get_openeo_backend(scenario, request):
     # Check if a backend override has been provided via cli options.
     override_backend = request.config.getoption("--override-backend")
     backend_filter = request.config.getoption("--backend-filter")
     if backend_filter and not re.match(backend_filter, scenario.backend):
-        # TODO apply filter during scenario retrieval, but seems to be hard to retrieve cli param
+        # Normally already deselected at collection time (see `deselect_by_backend_filter`)
         pytest.skip(
             f"skipping scenario {scenario.id} because backend "
             f"{scenario.backend} does not match filter {backend_filter!r}"
@@ -103,25 +134,98 @@ def create_openeo_job(*, connection, scenario):
     )
 
 
-def run_openeo_job(*, job, max_minutes: int | None):
-    if max_minutes:
+_OPENEO_RUNNING_STATUSES = {"submitted", "created", "queued", "running"}
 
-        def _timeout_handler(signum, frame):
-            raise TimeoutError(f"Batch job {job.job_id} exceeded maximum allowed time of {max_minutes} minutes")
+# Maximum number of soft errors (e.g. temporary connection glitches) while polling job status
+_SOFT_ERROR_MAX = 10
 
-        old_handler = signal.signal(signal.SIGALRM, _timeout_handler)
-        signal.alarm(max_minutes * 60)
-    try:
-        job.start_and_wait()
-    finally:
-        if max_minutes:
-            signal.alarm(0)
-            signal.signal(signal.SIGALRM, old_handler)
+
+def run_openeo_job(*, job, max_minutes: int | None, poller: JobPoller | None = None):
+    """
+    Start the batch job and wait for it to finish, polling the status following the poller's policy.
+    Like `BatchJob.start_and_wait()`, but with a custom polling schedule
+    and a time limit (`max_minutes`) on which the job is stopped.
+    """
+    poller = poller or JobPoller()
+    poller.set_time_limit(max_minutes * 60 if max_minutes else None)
+    job.start()
+    soft_errors = 0
+    while True:
+        poller.raise_if_aborted(job=f"Batch job {job.job_id}", stop_job=job.stop)
+        poller.wait()
+        try:
+            status = poller.poll(lambda: job.describe().get("status", "N/A"))
+        except (requests.ConnectionError, OpenEoApiPlainError) as e:
+            if isinstance(e, OpenEoApiPlainError) and e.http_status_code not in {502, 503}:
+                raise
+            soft_errors += 1
+            if soft_errors > _SOFT_ERROR_MAX:
+                raise OpenEoClientException("Excessive soft errors") from e
+            _log.warning(f"Soft error while polling status of job {job.job_id!r}: {e!r}")
+            continue
+        _log.info(f"Job {job.job_id!r}: {status} (after {poller.elapsed:.0f}s)")
+        if status not in _OPENEO_RUNNING_STATUSES:
+            break
+
+    if status != "finished":
+        _log.error(f"Batch job {job.job_id!r} failed. Error logs: {job.logs(level=logging.ERROR)}")
+        raise JobFailedException(
+            f"Batch job {job.job_id!r} didn't finish successfully. Status: {status} (after {poller.elapsed:.0f}s).",
+            job=job,
+        )
 
 
 def collect_openeo_metadata(*, job):
     return job.get_results()
 
 
-def download_openeo_results(*, results, actual_dir: Path):
-    return results.download_files(target=actual_dir, include_stac_metadata=True)
+def _get_asset_auth(asset):
+    """Backend authentication for downloading a result asset (only for the backend itself, not external storage)."""
+    connection = asset.job.connection
+    backend_host = urllib.parse.urlparse(connection.root_url).netloc
+    if urllib.parse.urlparse(asset.href).netloc == backend_host:
+        return connection.auth
+    return None
+
+
+def _get_asset_filename(asset) -> str:
+    """
+    File name to download a result asset to: the asset name if it already looks like a file name
+    (the common case), otherwise a sanitized combination of asset name and file name from the asset URL.
+    """
+    if re.fullmatch(r"[\w.-]+\.[a-zA-Z0-9]{1,10}", asset.name):
+        return asset.name
+    basename = urllib.parse.urlparse(asset.href).path.rstrip("/").split("/")[-1]
+    filename = f"{asset.name}-{basename}" if basename else asset.name
+    return re.sub(r"[^\w.-]", "_", filename)
+
+
+def download_openeo_results(
+    *,
+    results,
+    actual_dir: Path,
+    downloader: ParallelDownloader | None = None,
+    policy: ResultDownloadPolicy | None = None,
+) -> list[Path]:
+    """
+    Download result assets (those selected by the download policy, all by default)
+    and the result metadata (like `JobResults.download_files()`), but with concurrent downloads.
+    """
+    downloader = downloader or ParallelDownloader()
+    policy = policy or ResultDownloadPolicy()
+    actual_dir.mkdir(parents=True, exist_ok=True)
+    downloads = [
+        DownloadTask(
+            url=asset.href,
+            path=actual_dir / _get_asset_filename(asset),
+            name=asset.key,
+            auth=_get_asset_auth(asset),
+            size=asset.metadata.get("file:size"),
+        )
+        for asset in results.get_assets()
+    ]
+    paths = downloader.download_all(t for t in downloads if policy.accepts(t.path.name))
+    downloader.skip_all(t for t in downloads if not policy.accepts(t.path.name))
+    metadata_path = actual_dir / DEFAULT_JOB_RESULTS_FILENAME
+    metadata_path.write_text(json.dumps(results.get_metadata()))
+    return paths + [metadata_path]
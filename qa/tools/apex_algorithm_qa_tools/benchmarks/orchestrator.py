@@ -0,0 +1,223 @@
+"""
+Orchestration of benchmark runs: run the (remote) jobs of multiple benchmark scenarios concurrently
+in the background, while the benchmark tests themselves still run one by one.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict
+
+from apex_algorithm_qa_tools.benchmarks.runners.base import BenchmarkRunner, BenchmarkRunnerArtifacts
+from apex_algorithm_qa_tools.scenarios import BenchmarkScenario
+from apex_algorithm_qa_tools.scenarios.index import get_backend_host
+
+_log = logging.getLogger(__name__)
+
+
+class ItemRequest:
+    """
+    Minimal stand-in for the pytest `FixtureRequest` of a collected test item
+    (as far as benchmark runners need it), to set up runners before the test itself runs.
+    """
+
+    def __init__(self, item):
+        self.node = item
+        self.session = item.session
+        self.config = item.config
+
+
+class _StepFailed(Exception):
+    pass
+
+
+class _OrchestratedJob:
+    """Background execution of all steps of a benchmark runner, with a future per step."""
+
+    STEPS = ["connect", "create-job", "run-job", "collect-metadata", "download-actual"]
+
+    def __init__(
+        self,
+        *,
+        scenario: BenchmarkScenario,
+        request,
+        create_runner: Callable[..., BenchmarkRunner],
+        staging_dir: Path,
+    ):
+        self.scenario = scenario
+        self.request = request
+        self.staging_dir = staging_dir
+        self._create_runner = create_runner
+        self._steps: Dict[str, concurrent.futures.Future] = {step: concurrent.futures.Future() for step in self.STEPS}
+
+    def _step(self, step: str, fun: Callable[[], Any]) -> Any:
+        future = self._steps[step]
+        if not future.set_running_or_notify_cancel():
+            raise _StepFailed(step)
+        try:
+            result = fun()
+        except BaseException as e:
+            # Also capture pytest outcomes (e.g. `pytest.skip()` from the runner set up)
+            future.set_exception(e)
+            raise _StepFailed(step) from e
+        future.set_result(result)
+        return result
+
+    def run(self, *, max_minutes: int | None = None):
+        try:
+            runner = self._step("connect", lambda: self._create_runner(scenario=self.scenario, request=self.request))
+            self._step("create-job", runner.create_job)
+            self._step("run-job", lambda: runner.run_job(max_minutes=max_minutes))
+            self._step("collect-metadata", runner.collect_artifacts)
+            self._step("download-actual", lambda: runner.download_actual(actual_dir=self.staging_dir))
+            _log.info(f"Orchestrated benchmark {self.scenario.id!r}: all steps done")
+        except _StepFailed as e:
+            _log.warning(f"Orchestrated benchmark {self.scenario.id!r}: failed at step {e}")
+        finally:
+            self.cancel()
+
+    def cancel(self):
+        """Cancel steps that did not start yet."""
+        for future in self._steps.values():
+            future.cancel()
+
+    def abort(self):
+        """Cancel steps that did not start yet, and stop the job if it is running."""
+        self.cancel()
+        connect = self._steps["connect"]
+        if connect.done() and not connect.cancelled() and connect.exception() is None:
+            connect.result().cancel()
+
+    def wait(self, step: str) -> Any:
+        """Wait for given step, and return its result (or raise its exception)."""
+        return self._steps[step].result()
+
+
+class OrchestratedRunner(BenchmarkRunner):
+    """
+    Benchmark runner of which the actual work is done in the background by a `BenchmarkOrchestrator`:
+    the runner methods just wait for the corresponding step and replay its result (or exception),
+    so that benchmark tests behave the same as with a plain runner.
+    """
+
+    def __init__(self, *, job: _OrchestratedJob, request):
+        super().__init__(scenario=job.scenario, request=request)
+        self._job = job
+
+    def create_job(self):
+        self._job.wait("create-job")
+
+    def run_job(self, *, max_minutes: int | None):
+        # Note: `max_minutes` is handled by the orchestrator
+        try:
+            self._job.wait("run-job")
+        finally:
+            self.poll_stats = self._job.wait("connect").poll_stats
+
+    def cancel(self):
+        self._job.abort()
+
+    def collect_artifacts(self) -> BenchmarkRunnerArtifacts:
+        return self._job.wait("collect-metadata")
+
+    def download_actual(self, *, actual_dir: Path) -> list[Path]:
+        # Move results (downloaded in a staging directory) to the requested location.
+        paths = []
+        try:
+            staged = self._job.wait("download-actual")
+        finally:
+            self.download_stats = self._job.wait("connect").download_stats
+        for path in staged:
+            target = actual_dir / Path(path).relative_to(self._job.staging_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(path, target)
+            paths.append(target)
+        return paths
+
+
+class BenchmarkOrchestrator:
+    """
+    Run benchmark scenarios in the background, as soon as they are submitted:
+    set up the runner, create and run the job, collect the metadata and download the results
+    (so that artifacts are harvested as soon as a job finishes).
+    The number of concurrent runs is limited per backend (host).
+
+    Benchmark tests get an `OrchestratedRunner` (with `get_runner()`) that waits for these background steps.
+
+    :param create_runner: benchmark runner factory (e.g. `create_benchmark_runner`)
+    :param max_jobs_per_backend: maximum number of concurrent runs per backend host
+    :param max_minutes: maximum job time in minutes (passed to `BenchmarkRunner.run_job()`)
+    :param staging_root: directory to download results to, before moving them to the test's directory
+    """
+
+    def __init__(
+        self,
+        *,
+        create_runner: Callable[..., BenchmarkRunner],
+        max_jobs_per_backend: int = 4,
+        max_minutes: int | None = None,
+        staging_root: Path | None = None,
+    ):
+        self._create_runner = create_runner
+        self.max_jobs_per_backend = max_jobs_per_backend
+        self.max_minutes = max_minutes
+        self._own_staging_root = staging_root is None
+        self._staging_root = Path(staging_root or tempfile.mkdtemp(prefix="apex-benchmarks-"))
+        self._executors: Dict[str, concurrent.futures.ThreadPoolExecutor] = {}
+        self._jobs: Dict[str, _OrchestratedJob] = {}
+
+    @staticmethod
+    def _get_backend(scenario: BenchmarkScenario, request) -> str:
+        if scenario.type == "openeo":
+            backend = request.config.getoption("--override-backend", default=None) or scenario.backend
+        else:
+            backend = getattr(scenario, "endpoint", None) or ""
+        return get_backend_host(backend) or backend
+
+    def submit(self, scenario: BenchmarkScenario, request):
+        """
+        Start running a benchmark scenario in the background.
+
+        :param request: (stand-in for) the pytest request of the benchmark test (see `ItemRequest`)
+        """
+        key = request.node.nodeid
+        if key in self._jobs:
+            raise ValueError(f"Benchmark {key!r} already submitted")
+        backend = self._get_backend(scenario, request)
+        if backend not in self._executors:
+            self._executors[backend] = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_jobs_per_backend, thread_name_prefix=f"benchmark-{backend}"
+            )
+        job = _OrchestratedJob(
+            scenario=scenario,
+            request=request,
+            create_runner=self._create_runner,
+            staging_dir=Path(tempfile.mkdtemp(prefix=f"{scenario.id}-", dir=self._staging_root)),
+        )
+        self._jobs[key] = job
+        _log.info(f"Submitting benchmark {key!r} (backend {backend!r})")
+        self._executors[backend].submit(job.run, max_minutes=self.max_minutes)
+
+    def get_runner(self, request) -> OrchestratedRunner | None:
+        """
+        Get runner for given benchmark test (waiting for the runner set up in the background),
+        or None if it was not submitted.
+        """
+        job = self._jobs.get(request.node.nodeid)
+        if job is None:
+            return None
+        job.wait("connect")
+        return OrchestratedRunner(job=job, request=request)
+
+    def shutdown(self):
+        """Cancel benchmark runs that did not start yet, stop running jobs and clean up."""
+        for job in self._jobs.values():
+            job.abort()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self._own_staging_root:
+            shutil.rmtree(self._staging_root, ignore_errors=True)
@@ -0,0 +1,206 @@
+"""
+Job status polling: shared polling schedule for openEO and OGC API jobs.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+import functools
+import logging
+import math
+import random
+import statistics
+import threading
+import time
+from typing import Any, Callable, Dict, TypeVar
+
+_log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Tracked metric with the job duration (as observed through polling),
+# also used to estimate the duration of the next run.
+DURATION_METRIC = "poll:duration_seconds"
+
+
+@dataclasses.dataclass(frozen=True)
+class PollingPolicy:
+    """
+    Job status polling schedule:
+    fast polling at first, then exponential backoff (with jitter) up to a maximum interval.
+
+    When the job duration can be estimated (e.g. from earlier runs),
+    polling is sparse until the job is expected to finish,
+    (halving the remaining time each poll), followed by the normal backoff schedule.
+
+    :param initial_interval: initial interval (seconds) between status polls
+    :param max_interval: maximum interval (seconds) between status polls
+    :param backoff: interval growth factor
+    :param jitter: relative jitter to apply on each interval
+    :param expected_duration: expected job duration in seconds (if known)
+    """
+
+    initial_interval: float = 2
+    max_interval: float = 60
+    backoff: float = 1.5
+    jitter: float = 0.1
+    expected_duration: float | None = None
+
+    def get_interval(self, *, elapsed: float, step: int, rng: Callable[[], float] = random.random) -> float:
+        """
+        :param elapsed: time (seconds) since the start of the job
+        :param step: number of polls since start of the backoff schedule
+        """
+        if self.expected_duration and elapsed < self.expected_duration:
+            interval = max(self.initial_interval, min((self.expected_duration - elapsed) / 2, self.max_interval))
+        else:
+            interval = min(self.initial_interval * self.backoff**step, self.max_interval)
+        return interval * (1 + self.jitter * (2 * rng() - 1))
+
+
+@dataclasses.dataclass(frozen=True)
+class PollStats:
+    # Number of status polls
+    count: int
+    # Upper bound of the time (seconds) between the job finishing and noticing that
+    # (time between the last two polls)
+    overshoot_seconds: float
+    # Time (seconds) from start of the job to the last poll
+    duration_seconds: float
+
+
+class PollingCancelled(Exception):
+    pass
+
+
+class JobPoller:
+    """
+    Job status poller, following a `PollingPolicy`, and keeping track of polling stats.
+
+    Supports a time limit and cancellation (from any thread),
+    to be handled in the polling loop with `raise_if_aborted()`.
+
+    :param sleep: custom sleep function (by default: sleep that is interrupted on cancellation)
+    """
+
+    def __init__(
+        self,
+        policy: PollingPolicy | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] | None = None,
+        rng: Callable[[], float] = random.random,
+    ):
+        self.policy = policy or PollingPolicy()
+        self._clock = clock
+        self._cancelled = threading.Event()
+        self._sleep = sleep or self._cancelled.wait
+        self._rng = rng
+        self.start = clock()
+        self.max_seconds: float | None = None
+        self.count = 0
+        self._step = 0
+        self._polls = []
+
+    def set_time_limit(self, seconds: float | None):
+        """Set maximum time (seconds, since the poller was created) to wait for the job."""
+        self.max_seconds = seconds
+
+    @property
+    def remaining(self) -> float | None:
+        """Remaining time (seconds) before the time limit (if any)."""
+        return self.max_seconds - self.elapsed if self.max_seconds else None
+
+    def cancel(self):
+        """Cancel polling (thread-safe): a pending `wait()` returns immediately."""
+        self._cancelled.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def raise_if_aborted(self, *, job: str, stop_job: Callable[[], Any]):
+        """
+        When the time limit is exceeded or polling was cancelled:
+        stop the remote job (best effort, to not leave orphaned jobs running) and raise an exception.
+
+        :param job: job description for messages (e.g. "Batch job j-123")
+        :param stop_job: callable to stop/cancel the remote job
+        """
+        if self.max_seconds and self.elapsed >= self.max_seconds:
+            exception = TimeoutError(f"{job} exceeded maximum allowed time of {self.max_seconds / 60:g} minutes")
+        elif self.cancelled:
+            exception = PollingCancelled(f"{job}: polling cancelled")
+        else:
+            return
+        _log.warning(f"Stopping {job}: {exception}")
+        try:
+            stop_job()
+        except Exception as e:
+            _log.warning(f"Failed to stop {job}: {e!r}")
+        raise exception
+
+    @property
+    def elapsed(self) -> float:
+        return self._clock() - self.start
+
+    def get_interval(self) -> float:
+        """Interval to wait before next poll."""
+        elapsed = self.elapsed
+        interval = self.policy.get_interval(elapsed=elapsed, step=self._step, rng=self._rng)
+        if not (self.policy.expected_duration and elapsed < self.policy.expected_duration):
+            self._step += 1
+        return interval
+
+    def wait(self):
+        """Sleep until next poll (but not beyond the time limit)."""
+        interval = self.get_interval()
+        if self.max_seconds:
+            interval = max(0.0, min(interval, self.remaining))
+        if not self.cancelled:
+            self._sleep(interval)
+
+    def poll(self, fun: Callable[[], T]) -> T:
+        """Do a status poll (call given function) and keep track of it."""
+        self.count += 1
+        self._polls = [*self._polls[-1:], self._clock()]
+        return fun()
+
+    def get_stats(self) -> PollStats:
+        previous = self._polls[-2] if len(self._polls) > 1 else self.start
+        last = self._polls[-1] if self._polls else self.start
+        return PollStats(count=self.count, overshoot_seconds=last - previous, duration_seconds=last - self.start)
+
+
+@functools.lru_cache(maxsize=4)
+def load_expected_durations(location: str) -> Dict[str, float]:
+    """
+    Load expected job durations per scenario id: median of the job durations of recent successful runs
+    from a Parquet metrics dataset (local path or "s3://bucket/key").
+    """
+    from apex_algorithm_qa_tools.common import create_s3_filesystem
+    from apex_algorithm_qa_tools.metrics.parquet_metrics import load_recent_scenario_metrics_map
+
+    if location.startswith("s3://"):
+        filesystem = create_s3_filesystem()
+        location = location[len("s3://") :]
+    else:
+        filesystem = None
+    history = load_recent_scenario_metrics_map(location, filesystem=filesystem, metric_names=[DURATION_METRIC])
+    durations = {}
+    for scenario_id, rows in history.items():
+        values = [r[DURATION_METRIC] for r in rows if r[DURATION_METRIC] is not None]
+        values = [v for v in values if not math.isnan(v)]
+        if values:
+            durations[scenario_id] = statistics.median(values)
+    _log.info(f"Loaded expected job durations for {len(durations)} scenarios from {location!r}")
+    return durations
+
+
+def get_polling_policy(scenario, request) -> PollingPolicy:
+    """Get polling policy for a benchmark scenario (with expected job duration, if configured)."""
+    location = request.config.getoption("--job-duration-history", default=None)
+    expected_duration = load_expected_durations(location).get(scenario.id) if location else None
+    if expected_duration:
+        _log.info(f"Polling job of {scenario.id=} with {expected_duration=:.0f}s")
+    return PollingPolicy(expected_duration=expected_duration)
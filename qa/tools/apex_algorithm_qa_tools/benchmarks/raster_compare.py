@@ -0,0 +1,240 @@
+"""
+Memory-bounded comparison of (large) raster files (GeoTIFF, NetCDF):
+actual and expected data are streamed in block-aligned windows,
+accumulating tolerance statistics incrementally (instead of loading full arrays in memory),
+and the comparison stops early when the failure budget is exceeded.
+
+Tolerance semantics follow `openeo.testing.results.assert_job_results_allclose()`:
+a value differs significantly when `|actual - expected| > atol + rtol * |expected|`,
+and at most `pixel_tolerance` percent of the values may differ significantly.
+Mismatching NaN (nodata) values are not tolerated.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import numpy
+
+_log = logging.getLogger(__name__)
+
+# Target number of values (per band) to read in one window
+DEFAULT_WINDOW_SIZE = 1024 * 1024
+
+NETCDF_SUFFIXES = {".nc", ".netcdf"}
+GEOTIFF_SUFFIXES = {".tif", ".tiff", ".gtiff", ".geotiff"}
+
+
+class ToleranceStats:
+    """
+    Incrementally accumulated statistics of the differences between actual and expected values.
+
+    :param total: total number of values to compare (to determine the failure budget)
+    """
+
+    def __init__(self, *, total: int, rtol: float, atol: float, pixel_tolerance: float):
+        self.total = total
+        self.rtol = rtol
+        self.atol = atol
+        self.pixel_tolerance = pixel_tolerance
+        # Maximum number of significantly differing values
+        self.budget = total * pixel_tolerance / 100
+        self.compared = 0
+        self.bad = 0
+        self.nan_mismatches = 0
+        self.max_abs_diff = 0.0
+
+    def update(self, actual: numpy.ndarray, expected: numpy.ndarray):
+        """Add comparison of a block of actual and expected values."""
+        self.compared += expected.size
+        if not (numpy.issubdtype(actual.dtype, numpy.number) and numpy.issubdtype(expected.dtype, numpy.number)):
+            self.bad += int(numpy.count_nonzero(actual != expected))
+            return
+        actual = actual.astype(numpy.float64, copy=False)
+        expected = expected.astype(numpy.float64, copy=False)
+        actual_nan = numpy.isnan(actual)
+        expected_nan = numpy.isnan(expected)
+        self.nan_mismatches += int(numpy.count_nonzero(actual_nan != expected_nan))
+        valid = ~(actual_nan | expected_nan)
+        diff = numpy.abs(actual[valid] - expected[valid])
+        if diff.size:
+            self.bad += int(numpy.count_nonzero(diff > numpy.abs(expected[valid]) * self.rtol + self.atol))
+            self.max_abs_diff = max(self.max_abs_diff, float(diff.max()))
+
+    @property
+    def exceeded(self) -> bool:
+        """Whether the failure budget is exceeded (no need to compare further)."""
+        return self.nan_mismatches > 0 or self.bad > self.budget
+
+    def get_issues(self) -> List[str]:
+        issues = []
+        if self.nan_mismatches:
+            issues.append(f"NaN (nodata) mismatch for {self.nan_mismatches} values")
+        if self.bad > self.budget:
+            percentage = self.bad / self.total * 100
+            issues.append(
+                f"Fraction significantly differing pixels: {percentage}% > {self.pixel_tolerance}%"
+                f" (max absolute difference {self.max_abs_diff})"
+            )
+        if issues and self.compared < self.total:
+            issues.append(f"Stopped comparison early, after {self.compared} of {self.total} values")
+        return issues
+
+
+def _row_windows(height: int, width: int, block_height: int, window_size: int) -> Iterator[Tuple[int, int]]:
+    """Row ranges (start, stop), aligned to the block height, of about `window_size` values each."""
+    rows = max(block_height, (window_size // max(width, 1)) // block_height * block_height)
+    for start in range(0, height, rows):
+        yield start, min(start + rows, height)
+
+
+def geotiff_windows(dataset, *, window_size: int) -> Iterator:
+    """
+    Block-aligned windows covering a (rasterio) dataset,
+    to process it window by window with bounded memory usage (e.g. comparison, fingerprints).
+
+    :param window_size: target number of values (per band) per window (rounded to block boundaries)
+    """
+    import rasterio.windows
+
+    block_height, block_width = dataset.block_shapes[0]
+    if block_width >= dataset.width:
+        # Striped layout: windows of full rows
+        for start, stop in _row_windows(dataset.height, dataset.width, block_height, window_size):
+            yield rasterio.windows.Window(0, start, dataset.width, stop - start)
+    else:
+        # Tiled layout: tile by tile
+        for _, window in dataset.block_windows(1):
+            yield window
+
+
+def array_windows(array, *, window_size: int) -> Iterator[tuple]:
+    """
+    Index keys of windows covering a (lazily loaded) xarray DataArray:
+    all leading indices (e.g. time, band) and row windows of the last two dimensions (y, x).
+
+    :param window_size: target number of values per window (rounded to chunk boundaries)
+    """
+    if array.ndim < 2:
+        yield ()
+        return
+    *leading, height, width = array.shape
+    chunk_sizes = array.encoding.get("chunksizes")
+    block_height = chunk_sizes[-2] if chunk_sizes else 1
+    for index in itertools.product(*(range(n) for n in leading)):
+        for start, stop in _row_windows(height, width, block_height, window_size):
+            yield index + (slice(start, stop), slice(None))
+
+
+def _compare_geotiffs(actual: Path, expected: Path, *, stats_args: dict, window_size: int) -> List[str]:
+    import rasterio
+
+    with rasterio.open(actual) as a, rasterio.open(expected) as e:
+        actual_shape = (a.count, a.height, a.width)
+        expected_shape = (e.count, e.height, e.width)
+        if actual_shape != expected_shape:
+            return [f"Shape mismatch: {actual_shape} != {expected_shape}"]
+        issues = []
+        if a.crs != e.crs:
+            issues.append(f"CRS mismatch: {a.crs} != {e.crs}")
+        if a.transform != e.transform:
+            issues.append(f"Coordinate mismatch (geotransform): {tuple(a.transform)} != {tuple(e.transform)}")
+        if issues:
+            return issues
+
+        stats = ToleranceStats(total=e.count * e.height * e.width, **stats_args)
+        for window in geotiff_windows(e, window_size=window_size):
+            stats.update(a.read(window=window), e.read(window=window))
+            if stats.exceeded:
+                break
+        return stats.get_issues()
+
+
+def _compare_netcdf_variable(actual, expected, *, stats_args: dict, window_size: int) -> List[str]:
+    if actual.dims != expected.dims:
+        return [f"Dimension mismatch: {actual.dims} != {expected.dims}"]
+    if actual.shape != expected.shape:
+        return [f"Shape mismatch: {actual.shape} != {expected.shape}"]
+    issues = []
+    for dim in expected.dims:
+        if dim in expected.coords and dim in actual.coords:
+            acs = actual.coords[dim].values
+            ecs = expected.coords[dim].values
+            if not numpy.array_equal(acs, ecs):
+                issues.append(f"Coordinate value mismatch for dimension {dim!r}")
+    if issues:
+        return issues
+
+    stats = ToleranceStats(total=expected.size, **stats_args)
+    for key in array_windows(expected, window_size=window_size):
+        stats.update(actual[key].values, expected[key].values)
+        if stats.exceeded:
+            break
+    return stats.get_issues()
+
+
+def _compare_netcdfs(actual: Path, expected: Path, *, stats_args: dict, window_size: int) -> List[str]:
+    import xarray
+
+    # Note: data is loaded lazily (only the indexed windows are read from disk)
+    with xarray.open_dataset(actual) as a, xarray.open_dataset(expected) as e:
+        issues = []
+        actual_vars = set(a.data_vars)
+        expected_vars = set(e.data_vars)
+        if actual_vars != expected_vars:
+            issues.append(f"Xarray DataSet variables mismatch: {actual_vars} != {expected_vars}")
+        for var in sorted(expected_vars.intersection(actual_vars)):
+            var_issues = _compare_netcdf_variable(a[var], e[var], stats_args=stats_args, window_size=window_size)
+            if var_issues:
+                issues.append(f"Issues for variable {var!r}:")
+                issues.extend(var_issues)
+        return issues
+
+
+def get_decoded_size(path: Path) -> int:
+    """
+    Size (bytes) of the decoded raster data in given file (GeoTIFF or NetCDF), which is the memory
+    needed to load it fully (unlike the file size on disk, which can be much smaller due to compression).
+    Only metadata is read to determine it.
+    """
+    suffix = path.suffix.lower()
+    if suffix in GEOTIFF_SUFFIXES:
+        import rasterio
+
+        with rasterio.open(path) as dataset:
+            return sum(dataset.height * dataset.width * numpy.dtype(dtype).itemsize for dtype in dataset.dtypes)
+    elif suffix in NETCDF_SUFFIXES:
+        import xarray
+
+        with xarray.open_dataset(path) as dataset:
+            return sum(var.size * var.dtype.itemsize for var in dataset.variables.values())
+    raise ValueError(f"Unsupported raster file type: {path}")
+
+
+def compare_rasters_windowed(
+    actual: Path,
+    expected: Path,
+    *,
+    rtol: float = 1e-6,
+    atol: float = 1e-6,
+    pixel_tolerance: float = 0.0,
+    window_size: int = DEFAULT_WINDOW_SIZE,
+) -> List[str]:
+    """
+    Compare actual and expected raster file (GeoTIFF or NetCDF) window by window,
+    with peak memory usage in the order of a single window.
+
+    :param pixel_tolerance: maximum percentage of values that may differ significantly
+    :param window_size: target number of values (per band) per window (rounded to block boundaries)
+    :return: list of issues (empty if no issues)
+    """
+    stats_args = dict(rtol=rtol, atol=atol, pixel_tolerance=pixel_tolerance)
+    suffix = expected.suffix.lower()
+    if suffix in GEOTIFF_SUFFIXES:
+        return _compare_geotiffs(actual, expected, stats_args=stats_args, window_size=window_size)
+    elif suffix in NETCDF_SUFFIXES:
+        return _compare_netcdfs(actual, expected, stats_args=stats_args, window_size=window_size)
+    raise ValueError(f"Unsupported raster file type: {expected}")
@@ -5,6 +5,8 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+from apex_algorithm_qa_tools.benchmarks.polling import JobPoller, PollStats
+from apex_algorithm_qa_tools.downloads import DownloadStats
 from apex_algorithm_qa_tools.scenarios import BenchmarkScenario
 
 
@@ -34,6 +36,13 @@ class BenchmarkRunnerArtifacts:
 
 
 class BenchmarkRunner(ABC):
+    # Job status polling stats (set by `run_job`)
+    poll_stats: PollStats | None = None
+    # Result download stats (set by `download_actual`)
+    download_stats: list[DownloadStats] | None = None
+    # Poller of the running job (if any)
+    _poller: JobPoller | None = None
+
     def __init__(self, *, scenario: BenchmarkScenario, request):
         self.scenario = scenario
         self.request = request
@@ -47,6 +56,11 @@ class BenchmarkRunner(ABC):
     def run_job(self, *, max_minutes: int | None):
         pass
 
+    def cancel(self):
+        """Cancel the running job, if any (can be called from any thread): stops polling and the remote job."""
+        if self._poller:
+            self._poller.cancel()
+
     @abstractmethod
     def collect_artifacts(self) -> BenchmarkRunnerArtifacts:
         pass
@@ -11,10 +11,13 @@ from apex_algorithm_qa_tools.benchmarks.ogc import (
     get_auth_token,
     run_ogc_job,
 )
+from apex_algorithm_qa_tools.benchmarks.common import get_result_download_policy
+from apex_algorithm_qa_tools.benchmarks.polling import JobPoller, get_polling_policy
 from apex_algorithm_qa_tools.benchmarks.runners.base import (
     BenchmarkRunner,
     BenchmarkRunnerArtifacts,
 )
+from apex_algorithm_qa_tools.downloads import ParallelDownloader
 
 from apex_algorithm_qa_tools.scenarios.ogc import OGCAPIBenchmarkScenario
 
@@ -46,13 +49,18 @@ class OGCBenchmarkRunner(BenchmarkRunner):
     def run_job(self, *, max_minutes: int | None):
         if self._job is None:
             raise RuntimeError("Cannot run OGC API job before create_job().")
-        self._job_id = run_ogc_job(
-            api_client=self._api_client,
-            scenario=self.scenario,
-            user_token=self.user_token,
-            job=self._job,
-            max_minutes=max_minutes,
-        )
+        poller = self._poller = JobPoller(get_polling_policy(self.scenario, self.request))
+        try:
+            self._job_id = run_ogc_job(
+                api_client=self._api_client,
+                scenario=self.scenario,
+                user_token=self.user_token,
+                job=self._job,
+                max_minutes=max_minutes,
+                poller=poller,
+            )
+        finally:
+            self.poll_stats = poller.get_stats()
 
     def collect_artifacts(self) -> BenchmarkRunnerArtifacts:
         if self._job_id is None:
@@ -73,9 +81,15 @@ class OGCBenchmarkRunner(BenchmarkRunner):
     def download_actual(self, *, actual_dir: Path) -> list[Path]:
         if self._results is None:
             raise RuntimeError("Cannot download OGC API results before collect_artifacts().")
-        return download_ogc_results(
-            results_metadata=self._results,
-            actual_dir=actual_dir,
-            user_token=self.user_token,
-            details=self.result_details,
-        )
+        downloader = ParallelDownloader()
+        try:
+            return download_ogc_results(
+                results_metadata=self._results,
+                actual_dir=actual_dir,
+                user_token=self.user_token,
+                details=self.result_details,
+                downloader=downloader,
+                policy=get_result_download_policy(self.scenario, self.request),
+            )
+        finally:
+            self.download_stats = downloader.stats
@@ -10,6 +10,8 @@ from apex_algorithm_qa_tools.benchmarks.openeo import (
     get_openeo_backend,
     run_openeo_job,
 )
+from apex_algorithm_qa_tools.benchmarks.common import get_result_download_policy
+from apex_algorithm_qa_tools.benchmarks.polling import JobPoller, get_polling_policy
 from apex_algorithm_qa_tools.benchmarks.runners.base import (
     BenchmarkJobMetadata,
     BenchmarkMetric,
@@ -17,6 +19,7 @@ from apex_algorithm_qa_tools.benchmarks.runners.base import (
     BenchmarkRunner,
     BenchmarkRunnerArtifacts,
 )
+from apex_algorithm_qa_tools.downloads import ParallelDownloader
 
 from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
 
@@ -41,7 +44,11 @@ class OpenEOBenchmarkRunner(BenchmarkRunner):
     def run_job(self, *, max_minutes: int | None):
         if self._job is None:
             raise RuntimeError("Cannot run openEO job before create_job().")
-        run_openeo_job(job=self._job, max_minutes=max_minutes)
+        poller = self._poller = JobPoller(get_polling_policy(self.scenario, self.request))
+        try:
+            run_openeo_job(job=self._job, max_minutes=max_minutes, poller=poller)
+        finally:
+            self.poll_stats = poller.get_stats()
 
     def collect_artifacts(self) -> BenchmarkRunnerArtifacts:
         if self._job is None:
@@ -68,4 +75,13 @@ class OpenEOBenchmarkRunner(BenchmarkRunner):
     def download_actual(self, *, actual_dir: Path) -> list[Path]:
         if self._results is None:
             raise RuntimeError("Cannot download openEO results before collect_artifacts().")
-        return download_openeo_results(results=self._results, actual_dir=actual_dir)
+        downloader = ParallelDownloader()
+        try:
+            return download_openeo_results(
+                results=self._results,
+                actual_dir=actual_dir,
+                downloader=downloader,
+                policy=get_result_download_policy(self.scenario, self.request),
+            )
+        finally:
+            self.download_stats = downloader.stats
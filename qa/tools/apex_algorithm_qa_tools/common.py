@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
 from pathlib import Path
-from typing import Iterator
+from typing import Any, Iterator
 
 import pyarrow.fs
 
@@ -14,6 +15,38 @@ import pyarrow.fs
 _log = logging.getLogger(__name__)
 
 
+try:
+    import orjson
+
+    _fast_json_loads = orjson.loads
+except ImportError:
+    try:
+        import msgspec
+
+        _fast_json_loads = msgspec.json.decode
+    except ImportError:
+        _fast_json_loads = None
+
+
+def json_loads(data: str | bytes) -> Any:
+    """
+    Decode JSON document, using orjson or msgspec when available.
+    Falls back to the standard library for documents they reject (e.g. with NaN literals),
+    so results and errors are the same as with `json.loads`.
+    """
+    if _fast_json_loads is not None:
+        try:
+            return _fast_json_loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
+
+
+def load_json(path: str | Path) -> Any:
+    """Load JSON file (using `json_loads`)."""
+    return json_loads(Path(path).read_bytes())
+
+
 def create_s3_filesystem() -> pyarrow.fs.S3FileSystem:
     """Build S3 filesystem using APEx env vars with AWS fallbacks."""
     return pyarrow.fs.S3FileSystem(
@@ -0,0 +1,261 @@
+"""
+Robust file downloads: pooled sessions, retries, resuming and streaming checksum verification.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import dataclasses
+import hashlib
+import logging
+import threading
+import time
+from pathlib import Path
+from typing import Iterable, List, Mapping
+
+import requests
+import requests.adapters
+import requests.auth
+import urllib3.util
+
+_log = logging.getLogger(__name__)
+
+# Chunk size for streaming downloads and copies.
+CHUNK_SIZE = 1024 * 1024
+
+DEFAULT_TIMEOUT = 60
+
+
+class ChecksumMismatchError(IOError):
+    pass
+
+
+def create_session(pool_size: int = 8, *, retries: int = 3) -> requests.Session:
+    """
+    Create a requests session with a connection pool of given size
+    (to share across download threads)
+    and retries of failed connections and transient server errors.
+    """
+    session = requests.Session()
+    retry = urllib3.util.Retry(
+        total=retries,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=["GET", "HEAD"],
+        raise_on_status=False,
+    )
+    adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadResult:
+    # Whether the resource was not modified (HTTP 304), in which case nothing was downloaded
+    not_modified: bool = False
+    sha256: str | None = None
+    size: int = 0
+    etag: str | None = None
+    last_modified: str | None = None
+
+
+def download(
+    url: str,
+    path: Path,
+    *,
+    session: requests.Session | None = None,
+    headers: Mapping[str, str] | None = None,
+    auth: requests.auth.AuthBase | None = None,
+    sha256: str | None = None,
+    size: int | None = None,
+    max_attempts: int = 3,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> DownloadResult:
+    """
+    Stream download URL to given path, computing the SHA-256 hash along the way.
+
+    An interrupted transfer is resumed with an HTTP Range request (up to `max_attempts` attempts),
+    or restarted when the server does not support ranges.
+    On a checksum or size mismatch, the downloaded file is removed and `ChecksumMismatchError` is raised.
+
+    :param headers: additional request headers (e.g. for a conditional request)
+    :param auth: requests authentication handler (optional)
+    :param sha256: expected SHA-256 hex digest of the content (optional)
+    :param size: expected size in bytes of the content (optional)
+    """
+    session = session or requests
+    headers = dict(headers or {})
+    hasher = hashlib.sha256()
+    offset = 0
+    etag = None
+    with path.open("wb") as f:
+        for attempt in range(1, max_attempts + 1):
+            request_headers = dict(headers)
+            if offset:
+                request_headers["Range"] = f"bytes={offset}-"
+                if etag:
+                    # Only resume if the resource did not change in the meantime
+                    request_headers["If-Range"] = etag
+            try:
+                with session.get(url, headers=request_headers, auth=auth, stream=True, timeout=timeout) as resp:
+                    if resp.status_code == 304:
+                        path.unlink()
+                        return DownloadResult(not_modified=True)
+                    resp.raise_for_status()
+                    etag = resp.headers.get("ETag")
+                    last_modified = resp.headers.get("Last-Modified")
+                    if offset and resp.status_code != 206:
+                        _log.info(f"Restarting download of {url!r} (server did not honour range request)")
+                        f.seek(0)
+                        f.truncate()
+                        hasher = hashlib.sha256()
+                        offset = 0
+                    for chunk in resp.iter_content(chunk_size=CHUNK_SIZE):
+                        f.write(chunk)
+                        hasher.update(chunk)
+                        offset += len(chunk)
+                break
+            except (requests.ConnectionError, requests.exceptions.ChunkedEncodingError, requests.Timeout) as e:
+                if attempt >= max_attempts:
+                    raise
+                _log.warning(f"Download of {url!r} interrupted at {offset} bytes ({e!r}), resuming (attempt {attempt})")
+                time.sleep(0.5 * attempt)
+
+    result = DownloadResult(sha256=hasher.hexdigest(), size=offset, etag=etag, last_modified=last_modified)
+    if (sha256 and result.sha256 != sha256.lower()) or (size is not None and result.size != size):
+        path.unlink()
+        raise ChecksumMismatchError(
+            f"Download of {url!r} does not match expected checksum/size:"
+            f" got sha256={result.sha256} size={result.size}, expected sha256={sha256} size={size}"
+        )
+    return result
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadTask:
+    url: str
+    path: Path
+    # Name for logging and stats (e.g. asset name), defaults to the file name
+    name: str | None = None
+    headers: Mapping[str, str] | None = None
+    auth: requests.auth.AuthBase | None = None
+    # Size in bytes, if known upfront (e.g. from asset metadata)
+    size: int | None = None
+
+
+@dataclasses.dataclass(frozen=True)
+class DownloadStats:
+    name: str
+    path: Path
+    # Downloaded bytes (or size of the skipped file, 0 if unknown)
+    size: int
+    # Download duration in seconds (including retries)
+    seconds: float
+    # Whether the download was skipped (see `ParallelDownloader.skip_all()`)
+    skipped: bool = False
+    # SHA-256 hex digest of the downloaded content
+    sha256: str | None = None
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.size / self.seconds if self.seconds > 0 else float("nan")
+
+
+class ParallelDownloader:
+    """
+    Download multiple files concurrently (with a bounded thread pool)
+    over a shared keep-alive session, with retries of each download (see `download()`),
+    keeping track of download stats (`stats`) for all downloads done through this downloader.
+
+    :param max_workers: maximum number of concurrent downloads
+    :param session: session to use (by default: pooled session from `create_session()`)
+    :param max_attempts: maximum number of attempts per download
+    """
+
+    def __init__(self, *, max_workers: int = 4, session: requests.Session | None = None, max_attempts: int = 3):
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self._session = session
+        self._lock = threading.Lock()
+        self.stats: List[DownloadStats] = []
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = create_session(pool_size=self.max_workers)
+            return self._session
+
+    def _download(self, task: DownloadTask) -> DownloadStats:
+        name = task.name or task.path.name
+        _log.info(f"Downloading {name!r} from {task.url!r} to {str(task.path)!r}")
+        task.path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        result = download(
+            task.url,
+            task.path,
+            session=self._get_session(),
+            headers=task.headers,
+            auth=task.auth,
+            max_attempts=self.max_attempts,
+        )
+        stats = DownloadStats(
+            name=name, path=task.path, size=result.size, seconds=time.monotonic() - start, sha256=result.sha256
+        )
+        _log.info(f"Downloaded {name!r}: {stats.size} bytes in {stats.seconds:.1f}s")
+        with self._lock:
+            self.stats.append(stats)
+        return stats
+
+    def _get_size(self, task: DownloadTask) -> int:
+        if task.size is not None:
+            return task.size
+        try:
+            resp = self._get_session().head(
+                task.url, headers=task.headers, auth=task.auth, allow_redirects=True, timeout=DEFAULT_TIMEOUT
+            )
+            resp.raise_for_status()
+            return int(resp.headers["Content-Length"])
+        except Exception as e:
+            _log.warning(f"Failed to determine size of {task.url!r}: {e!r}")
+            return 0
+
+    def _skip(self, task: DownloadTask) -> DownloadStats:
+        stats = DownloadStats(
+            name=task.name or task.path.name, path=task.path, size=self._get_size(task), seconds=0, skipped=True
+        )
+        _log.info(f"Skipping download of {stats.name!r} ({stats.size} bytes)")
+        with self._lock:
+            self.stats.append(stats)
+        return stats
+
+    def skip_all(self, tasks: Iterable[DownloadTask]):
+        """
+        Record given downloads as skipped in the stats
+        (with their size, from the task or, if unknown, determined with a HEAD request).
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="head") as executor:
+            list(executor.map(self._skip, tasks))
+
+    def download_all(self, tasks: Iterable[DownloadTask]) -> List[Path]:
+        """
+        Download all given tasks concurrently and return their paths (in task order).
+        On failure, pending downloads are cancelled and the (first) error is raised.
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="download"
+        ) as executor:
+            futures = [executor.submit(self._download, task) for task in tasks]
+            done, _ = concurrent.futures.wait(futures, return_when=concurrent.futures.FIRST_EXCEPTION)
+            errors = [f.exception() for f in futures if f in done and f.exception()]
+            if errors:
+                for future in futures:
+                    future.cancel()
+                raise errors[0]
+            return [future.result().path for future in futures]
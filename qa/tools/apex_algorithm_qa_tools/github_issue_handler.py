@@ -15,7 +15,7 @@ import requests
 from apex_algorithm_qa_tools.metrics.performance_baselines import _compute_threshold_stats
 
 from apex_algorithm_qa_tools.common import get_project_root
-from apex_algorithm_qa_tools.scenarios.common import get_benchmark_scenarios
+from apex_algorithm_qa_tools.scenarios.common import get_scenario_index
 from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
 
 logger = logging.getLogger(__name__)
@@ -610,18 +610,10 @@ class GithubIssueHandler:
             token=github_token or self.github_context.token,
         )
         self.central_label = central_label
-        self._benchmark_scenarios = get_benchmark_scenarios()
+        self._scenario_index = get_scenario_index()
 
     def get_benchmark_scenarios(self, scenario_id: str) -> BenchmarkScenario | None:
-        matches = [s for s in self._benchmark_scenarios if s.id == scenario_id]
-        if len(matches) == 1:
-            return matches[0]
-        elif len(matches) == 0:
-            return None
-        else:
-            raise ValueError(
-                f"Found {len(matches)} benchmark scenarios with {scenario_id=}"
-            )
+        return self._scenario_index.get(scenario_id)
 
     def main(self) -> None:
         """
@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-import json
 import logging
 from typing import Any, List
 
-from apex_algorithm_qa_tools.common import get_project_root
+from apex_algorithm_qa_tools.common import get_project_root, load_json
 
 _log = logging.getLogger(__name__)
 
 
 def _get_ogc_record_schema(name: str) -> dict:
-    with open(get_project_root() / "schemas" / name) as f:
-        return json.load(f)
+    return load_json(get_project_root() / "schemas" / name)
 
 
 def get_service_ogc_record_schema() -> dict:
@@ -29,9 +27,7 @@ def get_provider_ogc_record_schema() -> dict:
 def _get_ogc_records(folder: str, glob: str) -> List[Any]:
     records = []
     for path in (get_project_root() / folder).glob(glob):
-        with open(path) as f:
-            data = json.load(f)
-            records.append({'path': str(path), 'data': data})
+        records.append({'path': str(path), 'data': load_json(path)})
     return records
 
 
@@ -0,0 +1,228 @@
+"""
+Persistent, content-addressed cache for benchmark reference data.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Iterable
+
+import requests
+
+from apex_algorithm_qa_tools.downloads import CHUNK_SIZE, download
+
+_log = logging.getLogger(__name__)
+
+# Linux ioctl request code to clone (reflink) a file on copy-on-write filesystems (e.g. btrfs, XFS).
+_FICLONE = 0x40049409
+
+
+def link_or_copy(src: Path, dst: Path):
+    """
+    Materialize file `src` at `dst`: as hard link if possible,
+    otherwise as reflink (copy-on-write clone) if supported, otherwise as plain copy.
+    """
+    if dst.exists():
+        dst.unlink()
+    try:
+        os.link(src, dst)
+        return
+    except OSError:
+        pass
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        try:
+            import fcntl
+
+            fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except (ImportError, OSError):
+            pass
+        shutil.copyfileobj(fsrc, fdst, CHUNK_SIZE)
+
+
+class ReferenceDataCache:
+    """
+    On-disk cache of reference data files, shared across runs and processes.
+
+    - Files are stored content-addressed (by SHA-256 of the content) under ``objects/``,
+      so that identical reference files (e.g. shared between scenarios) are stored once.
+    - Per source URL, a small reference file under ``refs/`` records the content hash
+      and the ETag/Last-Modified validators of the last download,
+      so that unchanged files are only revalidated with a conditional request.
+    - Cached files are read-only and materialized in a reference directory as hard links (no extra bytes)
+      or reflinks when possible.
+    - The total size of the stored files is bounded by ``max_size`` bytes,
+      evicting least recently used files first.
+    """
+
+    def __init__(self, root: str | Path, *, max_size: int = 20 * 1024**3):
+        self.root = Path(root)
+        self.max_size = max_size
+        for sub in ["objects", "refs", "tmp"]:
+            (self.root / sub).mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def from_env(cls) -> ReferenceDataCache | None:
+        """Build cache from the `APEX_ALGORITHMS_REFERENCE_CACHE` env var (cache root directory), if set."""
+        root = os.environ.get("APEX_ALGORITHMS_REFERENCE_CACHE")
+        return cls(root) if root else None
+
+    def _ref_path(self, source: str) -> Path:
+        return self.root / "refs" / f"{hashlib.sha256(source.encode('utf8')).hexdigest()}.json"
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.root / "objects" / sha256[:2] / sha256
+
+    def _read_ref(self, source: str) -> dict | None:
+        try:
+            with self._ref_path(source).open("r", encoding="utf8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def _write_ref(self, source: str, ref: dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.root / "tmp")
+        with os.fdopen(fd, "w", encoding="utf8") as f:
+            json.dump(ref, f)
+        os.replace(tmp_path, self._ref_path(source))
+
+    def _add_object(self, tmp_path: str, sha256: str):
+        """Move (fully written) temp file into the object store under given content hash."""
+        path = self._object_path(sha256)
+        if path.exists():
+            os.remove(tmp_path)
+        else:
+            path.parent.mkdir(exist_ok=True)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, path)
+
+    def store(self, chunks: Iterable[bytes]) -> tuple[str, int]:
+        """
+        Store content (given as iterable of chunks) in the cache.
+
+        :return: tuple of content SHA-256 hash and size.
+        """
+        hasher = hashlib.sha256()
+        size = 0
+        fd, tmp_path = tempfile.mkstemp(dir=self.root / "tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in chunks:
+                    hasher.update(chunk)
+                    size += len(chunk)
+                    f.write(chunk)
+            sha256 = hasher.hexdigest()
+            self._add_object(tmp_path, sha256)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return sha256, size
+
+    def get(
+        self,
+        url: str,
+        *,
+        sha256: str | None = None,
+        size: int | None = None,
+        session: requests.Session | None = None,
+    ) -> Path:
+        """
+        Get path of the (read-only) cached file for given URL,
+        downloading (or revalidating) it when necessary.
+
+        :param sha256: expected SHA-256 hash of the content (optional).
+            If the cache already contains content with this hash, it is used without any request.
+            Otherwise, the download is verified against it.
+        :param size: expected size in bytes of the content (optional)
+        """
+        if sha256:
+            path = self._object_path(sha256.lower())
+            if path.exists():
+                _log.info(f"Reference data cache hit for {url!r} (by checksum)")
+                os.utime(path)
+                return path
+
+        ref = self._read_ref(url)
+        path = self._object_path(ref["sha256"]) if ref else None
+        headers = {}
+        if path and path.exists() and not sha256:
+            if ref.get("etag"):
+                headers["If-None-Match"] = ref["etag"]
+            if ref.get("last_modified"):
+                headers["If-Modified-Since"] = ref["last_modified"]
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.root / "tmp")
+        os.close(fd)
+        try:
+            result = download(url, Path(tmp_path), session=session, headers=headers, sha256=sha256, size=size)
+            if result.not_modified:
+                _log.info(f"Reference data cache hit for {url!r} (not modified)")
+                os.utime(path)
+                return path
+            self._add_object(tmp_path, result.sha256)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        _log.info(f"Downloaded {url!r} to reference data cache ({result.size} bytes, sha256={result.sha256})")
+        self._write_ref(
+            url,
+            {
+                "url": url,
+                "sha256": result.sha256,
+                "size": result.size,
+                "etag": result.etag,
+                "last_modified": result.last_modified,
+            },
+        )
+        path = self._object_path(result.sha256)
+        os.utime(path)
+        self._evict(keep=path)
+        return path
+
+    def _evict(self, keep: Path):
+        """
+        Evict least recently used objects until the cache fits in ``max_size``.
+
+        :param keep: object to never evict (the one just added),
+            even if it exceeds ``max_size`` on its own.
+        """
+        objects = []
+        total = 0
+        for path in (self.root / "objects").glob("*/*"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            total += stat.st_size
+            if path != keep:
+                objects.append((stat.st_mtime, stat.st_size, path))
+        if total <= self.max_size:
+            return
+        # Least recently used first (based on mtime, updated on each use).
+        for _, size, path in sorted(objects):
+            if total <= self.max_size:
+                break
+            _log.info(f"Evicting {path} from reference data cache")
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def materialize(
+        self,
+        url: str,
+        path: Path,
+        *,
+        sha256: str | None = None,
+        size: int | None = None,
+        session: requests.Session | None = None,
+    ) -> Path:
+        """Download (if necessary) given URL in the cache and materialize it at given path."""
+        link_or_copy(self.get(url, sha256=sha256, size=size, session=session), path)
+        return path
@@ -17,7 +17,7 @@ from apex_algorithm_qa_tools.metrics.performance_baselines import (
     _check_reference_performance,
     _compute_baselines,
 )
-from apex_algorithm_qa_tools.scenarios import get_benchmark_scenarios
+from apex_algorithm_qa_tools.scenarios import get_scenario_index
 
 
 def main() -> None:
@@ -51,7 +51,7 @@ def main() -> None:
     regression_messages = []
     rows = []
 
-    benchmark_scenarios = {scenario.id: scenario for scenario in get_benchmark_scenarios()}
+    benchmark_scenarios = get_scenario_index()
     total_scenarios = len(scenario_metrics_by_id)
     print(f"[progress] Evaluating {total_scenarios} scenario(s)")
 
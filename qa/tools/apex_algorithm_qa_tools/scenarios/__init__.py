@@ -1,13 +1,17 @@
 from apex_algorithm_qa_tools.scenarios.common import (
     download_reference_data,
     get_benchmark_scenarios,
+    get_scenario_index,
     lint_benchmark_scenario,
 )
+from apex_algorithm_qa_tools.scenarios.index import ScenarioIndex
 from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
 
 __all__ = [
     "BenchmarkScenario",
     "download_reference_data",
     "get_benchmark_scenarios",
+    "get_scenario_index",
     "lint_benchmark_scenario",
+    "ScenarioIndex",
 ]
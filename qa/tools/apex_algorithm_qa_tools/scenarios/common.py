@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-import glob
+import concurrent.futures
+import hashlib
 import logging
+import os
 import re
 from pathlib import Path
-from typing import List
+from typing import Collection, Dict, List
 
 import requests
 from apex_algorithm_qa_tools.common import (
@@ -12,25 +14,50 @@ from apex_algorithm_qa_tools.common import (
 )
 from openeo.util import TimingLogger
 
+from apex_algorithm_qa_tools.downloads import CHUNK_SIZE, create_session, download
+from apex_algorithm_qa_tools.reference_cache import ReferenceDataCache, link_or_copy
 from apex_algorithm_qa_tools.scenarios.openeo import lint_openeo_fields
 from apex_algorithm_qa_tools.scenarios.ogc import OGCAPIBenchmarkScenario
-from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
-from apex_algorithm_qa_tools.scenarios.factory import read_scenarios_file
+from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario, ReferenceSource
+from apex_algorithm_qa_tools.scenarios.index import ScenarioIndex
+from apex_algorithm_qa_tools.scenarios.registry import ScenarioRegistry
 
 _log = logging.getLogger(__name__)
 
 
+# Scenario registries and indexes per project root
+_registries: Dict[Path, ScenarioRegistry] = {}
+_indexes: Dict[Path, ScenarioIndex] = {}
+
+
+def _get_registry(root=None) -> ScenarioRegistry:
+    root = Path(root or get_project_root())
+    if root not in _registries:
+        _registries[root] = ScenarioRegistry(root, cache_path=os.environ.get("APEX_ALGORITHMS_SCENARIO_CACHE"))
+    return _registries[root]
+
+
 def get_benchmark_scenarios(root=None) -> List[BenchmarkScenario]:
+    """
+    Get all benchmark scenarios of the algorithm catalog.
+
+    Parsed and validated scenario files are cached (in memory, and optionally on disk
+    at the path given by env var `APEX_ALGORITHMS_SCENARIO_CACHE`),
+    so that repeated calls only need to check for changed files.
+    """
     # TODO: instead of flat list, keep original grouping/structure of benchmark scenario files?
-    # TODO: check for uniqueness of scenario IDs? Also make this a pre-commit lint tool?
-    scenarios = []
-    # old style glob is used to support symlinks
-    for path in glob.glob(
-        str((root or get_project_root()) / "algorithm_catalog") + "/**/*benchmark_scenarios*/*.json",
-        recursive=True,
-    ):
-        scenarios.extend(read_scenarios_file(path))
-    return scenarios
+    return _get_registry(root).get_scenarios()
+
+
+def get_scenario_index(root=None) -> ScenarioIndex:
+    """
+    Get (shared) index of all benchmark scenarios of the algorithm catalog,
+    rebuilt when scenario files changed.
+    """
+    registry = _get_registry(root)
+    if registry.refresh() or registry.root not in _indexes:
+        _indexes[registry.root] = ScenarioIndex(registry.get_scenarios())
+    return _indexes[registry.root]
 
 
 def lint_common_fields(scenario: BenchmarkScenario):
@@ -64,29 +91,97 @@ def lint_ogc_fields(scenario: OGCAPIBenchmarkScenario):
     assert isinstance(scenario.parameters, dict)
 
 
-def download_reference_data(scenario: BenchmarkScenario, reference_dir: Path) -> Path:
+def _download_reference_file(
+    source: ReferenceSource,
+    path: Path,
+    *,
+    cache: ReferenceDataCache | None,
+    session: requests.Session,
+) -> str:
+    """Download reference file and return its SHA-256 hash."""
+    with TimingLogger(title=f"Downloading {source.href=} to {path=}", logger=_log.info):
+        # Handle file:// URLs (local files)
+        if source.href.startswith("file://"):
+            file_path = source.href[7:]  # Remove "file://" prefix
+            hasher = hashlib.sha256()
+            with open(file_path, "rb") as src_file:
+                with path.open("wb") as f:
+                    while chunk := src_file.read(CHUNK_SIZE):
+                        f.write(chunk)
+                        hasher.update(chunk)
+            return hasher.hexdigest()
+        elif cache:
+            cached = cache.get(source.href, sha256=source.sha256, size=source.size, session=session)
+            link_or_copy(cached, path)
+            # Cached objects are content-addressed
+            return cached.name
+        else:
+            # Handle HTTP(S) URLs: download to temp file first, to never leave partial files behind
+            tmp_path = path.with_name(f"{path.name}.part")
+            try:
+                result = download(source.href, tmp_path, session=session, sha256=source.sha256, size=source.size)
+                os.replace(tmp_path, path)
+            finally:
+                tmp_path.unlink(missing_ok=True)
+            return result.sha256
+
+
+def download_reference_data(
+    scenario: BenchmarkScenario,
+    reference_dir: Path,
+    *,
+    cache: ReferenceDataCache | None = None,
+    max_workers: int = 4,
+    hashes: Dict[str, str] | None = None,
+    skip: Collection[str] = (),
+) -> Path:
+    """
+    Download the reference data of a benchmark scenario to given directory.
+
+    Files are downloaded in parallel over a pooled session,
+    with retries, resuming of interrupted transfers,
+    and verification against the checksum/size fields of the reference data (if any).
+
+    :param cache: reference data cache to download HTTP(S) sources through
+        (by default: cache at the path given by env var `APEX_ALGORITHMS_REFERENCE_CACHE`, if set).
+        Cached files are hard-linked (or reflinked) into the reference directory.
+    :param max_workers: maximum number of parallel downloads
+    :param hashes: optional dictionary to collect the SHA-256 hashes of the reference files
+        (by relative path), e.g. to skip comparison of identical files.
+    :param skip: relative paths of reference files not to download
+        (e.g. because actual results already matched their fingerprint).
+    """
+    if cache is None:
+        cache = ReferenceDataCache.from_env()
     with TimingLogger(
         title=f"Downloading reference data for {scenario.id=} to {reference_dir=}",
         logger=_log.info,
     ):
-        for path, source in scenario.reference_data.items():
+        files = {}
+        for path, source in scenario.get_reference_sources().items():
+            if path in skip:
+                _log.info(f"Skipping download of reference file {path!r}")
+                continue
             path = reference_dir / path
             if not path.is_relative_to(reference_dir):
                 raise ValueError(f"Resolved {path=} is not relative to {reference_dir=} ({scenario.id=})")
             path.parent.mkdir(parents=True, exist_ok=True)
-
-            with TimingLogger(title=f"Downloading {source=} to {path=}", logger=_log.info):
-                # Handle file:// URLs (local files)
-                if source.startswith("file://"):
-                    file_path = source[7:]  # Remove "file://" prefix
-                    with open(file_path, "rb") as src_file:
-                        with path.open("wb") as f:
-                            f.write(src_file.read())
-                else:
-                    # Handle HTTP(S) URLs
-                    resp = requests.get(source, stream=True)
-                    with path.open("wb") as f:
-                        for chunk in resp.iter_content(chunk_size=128):
-                            f.write(chunk)
+            files[path] = source
+
+        if files:
+            with create_session(pool_size=max_workers) as session, concurrent.futures.ThreadPoolExecutor(
+                max_workers=max_workers
+            ) as executor:
+                futures = [
+                    executor.submit(_download_reference_file, source, path, cache=cache, session=session)
+                    for path, source in files.items()
+                ]
+                # Wait for all downloads (to not leave downloads running in the background), raise first failure.
+                for future in futures:
+                    future.exception()
+                for (path, source), future in zip(files.items(), futures):
+                    sha256 = future.result()
+                    if hashes is not None:
+                        hashes[str(path.relative_to(reference_dir))] = sha256
 
     return reference_dir
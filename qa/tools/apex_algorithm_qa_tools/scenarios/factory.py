@@ -1,7 +1,7 @@
-import json
 from pathlib import Path
 from typing import List
 
+from apex_algorithm_qa_tools.common import load_json
 from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
 from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
 from apex_algorithm_qa_tools.scenarios.ogc import OGCAPIBenchmarkScenario
@@ -12,19 +12,18 @@ def read_scenarios_file(path: str | Path) -> List[BenchmarkScenario]:
     Load list of benchmark scenarios from a JSON file.
     """
     path = Path(path)
-    with path.open("r", encoding="utf8") as f:
-        data = json.load(f)
+    data = load_json(path)
     # TODO: support single scenario files in addition to listings?
     assert isinstance(data, list)
     return [_benchmark_factory(item, path) for item in data]
 
 
-def _benchmark_factory(item: dict, path: str | Path) -> BenchmarkScenario:
+def _benchmark_factory(item: dict, path: str | Path, *, validate: bool = True) -> BenchmarkScenario:
     # TODO #14 need for differentiation between different types of scenarios?
     assert item["type"] is not None, "Missing required 'type' field in benchmark scenario"
     if item["type"] == "openeo":
-        return openEOBenchmarkScenario.from_dict(data=item, source=path)
+        return openEOBenchmarkScenario.from_dict(data=item, source=path, validate=validate)
     elif item["type"] == "ogc_api_process":
-        return OGCAPIBenchmarkScenario.from_dict(data=item, source=path)
+        return OGCAPIBenchmarkScenario.from_dict(data=item, source=path, validate=validate)
     else:
         raise ValueError(f"Unsupported benchmark scenario type: {item['type']}")
@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import collections
+import re
+import urllib.parse
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
+
+
+class DuplicateScenarioIdError(ValueError):
+    pass
+
+
+def get_backend_host(url: str) -> str | None:
+    """Get host name from a backend URL or bare host name (e.g. "openeo.dataspace.copernicus.eu")."""
+    if not re.match(r"^[a-z]+://", url):
+        url = f"https://{url}"
+    return urllib.parse.urlparse(url).hostname
+
+
+def _get_processes(scenario: BenchmarkScenario) -> List[Tuple[str, str | None]]:
+    """Get (process id, namespace) pairs of the (UDP) processes used in a scenario."""
+    processes = []
+    if getattr(scenario, "application", None):
+        processes.append((scenario.application, getattr(scenario, "namespace", None)))
+    for node in (getattr(scenario, "process_graph", None) or {}).values():
+        if isinstance(node, dict) and node.get("namespace"):
+            processes.append((node.get("process_id"), node["namespace"]))
+    return list(dict.fromkeys(processes))
+
+
+class ScenarioIndex:
+    """
+    Index of benchmark scenarios for constant time lookup by id,
+    with precomputed groupings by backend host, scenario type, (UDP) process and source file.
+
+    Scenario ids are required to be unique.
+    """
+
+    def __init__(self, scenarios: Iterable[BenchmarkScenario]):
+        self._by_id: Dict[str, BenchmarkScenario] = {}
+        self._by_backend: Dict[str, List[BenchmarkScenario]] = collections.defaultdict(list)
+        self._by_type: Dict[str, List[BenchmarkScenario]] = collections.defaultdict(list)
+        self._by_process: Dict[Tuple[str, str | None], List[BenchmarkScenario]] = collections.defaultdict(list)
+        self._by_process_id: Dict[str, List[BenchmarkScenario]] = collections.defaultdict(list)
+        self._by_source: Dict[str, List[BenchmarkScenario]] = collections.defaultdict(list)
+        # Raw backend (openEO) or endpoint (OGC API) strings, e.g. for regex based filtering
+        self._by_backend_url: Dict[str, List[BenchmarkScenario]] = collections.defaultdict(list)
+
+        for scenario in scenarios:
+            if scenario.id in self._by_id:
+                raise DuplicateScenarioIdError(
+                    f"Duplicate benchmark scenario id {scenario.id!r}"
+                    f" (in {self._by_id[scenario.id].source} and {scenario.source})"
+                )
+            self._by_id[scenario.id] = scenario
+            self._by_type[scenario.type].append(scenario)
+            backend = getattr(scenario, "backend", None) or getattr(scenario, "endpoint", None)
+            if backend:
+                self._by_backend_url[backend].append(scenario)
+                self._by_backend[get_backend_host(backend)].append(scenario)
+            for process_id, namespace in _get_processes(scenario):
+                self._by_process[process_id, namespace].append(scenario)
+                by_process_id = self._by_process_id[process_id]
+                if not by_process_id or by_process_id[-1] is not scenario:
+                    by_process_id.append(scenario)
+            if scenario.source:
+                self._by_source[str(scenario.source)].append(scenario)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def __iter__(self) -> Iterator[BenchmarkScenario]:
+        return iter(self._by_id.values())
+
+    def __contains__(self, scenario_id: str) -> bool:
+        return scenario_id in self._by_id
+
+    def __getitem__(self, scenario_id: str) -> BenchmarkScenario:
+        return self._by_id[scenario_id]
+
+    def get(self, scenario_id: str) -> BenchmarkScenario | None:
+        return self._by_id.get(scenario_id)
+
+    @property
+    def backends(self) -> List[str]:
+        """Backend host names."""
+        return sorted(self._by_backend.keys())
+
+    def by_backend(self, host: str) -> List[BenchmarkScenario]:
+        """Get scenarios by backend host name (or URL)."""
+        return list(self._by_backend.get(get_backend_host(host), []))
+
+    def by_type(self, type: str) -> List[BenchmarkScenario]:
+        return list(self._by_type.get(type, []))
+
+    def by_process(self, process_id: str, namespace: str | None = None) -> List[BenchmarkScenario]:
+        """Get scenarios using given (UDP) process (in any namespace, unless a namespace is given)."""
+        if namespace is None:
+            return list(self._by_process_id.get(process_id, []))
+        return list(self._by_process.get((process_id, namespace), []))
+
+    def by_source(self, source: str | Path) -> List[BenchmarkScenario]:
+        """Get scenarios defined in given scenario file."""
+        return list(self._by_source.get(str(source), []))
+
+    def filter_backend(self, pattern: str) -> List[BenchmarkScenario]:
+        """
+        Get scenarios with a backend (or endpoint) matching given regex pattern
+        (applied with `re.match` to each distinct backend just once).
+        """
+        regex = re.compile(pattern)
+        matching = set()
+        for backend, scenarios in self._by_backend_url.items():
+            if regex.match(backend):
+                matching.update(s.id for s in scenarios)
+        return [s for s in self if s.id in matching]
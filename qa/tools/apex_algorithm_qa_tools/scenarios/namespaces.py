@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import concurrent.futures
+import logging
+import os
+import re
+import subprocess
+import threading
+from pathlib import Path
+from typing import Dict, Iterable
+
+import requests
+
+from apex_algorithm_qa_tools.common import get_project_root, json_loads
+from apex_algorithm_qa_tools.downloads import DEFAULT_TIMEOUT, create_session
+
+_log = logging.getLogger(__name__)
+
+# Raw GitHub URLs of files in this repository
+_LOCAL_REPO_URL = re.compile(
+    r"^https://raw\.githubusercontent\.com/ESA-APEx/apex_algorithms/(?:refs/heads/)?(?P<ref>[^/]+)/(?P<path>.+)$"
+)
+
+
+class NamespaceResolver:
+    """
+    Resolver of URL based openEO process namespaces to their (UDP) process definitions.
+
+    - URLs of files in this repository (raw GitHub URLs of ESA-APEx/apex_algorithms)
+      are read from the local git history when the ref is available there:
+      commit refs as such, branch refs (e.g. "main") from the remote-tracking branch ("origin/main"),
+      and tag refs.
+      The working tree is never used, as it might not correspond to the ref (e.g. on a feature branch).
+    - Other URLs are fetched over a pooled session, concurrently when using `prefetch()`.
+    - Results (and failures) are memoized for the lifetime of the resolver.
+
+    :param root: project root (local checkout)
+    :param max_workers: maximum number of concurrent fetches in `prefetch()`
+    :param offline: do not fetch anything: `resolve()` returns None for URLs that can not be resolved locally
+    """
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        session: requests.Session | None = None,
+        max_workers: int = 8,
+        offline: bool = False,
+    ):
+        self.root = Path(root or get_project_root())
+        self.max_workers = max_workers
+        self.offline = offline
+        self._session = session
+        self._memo: Dict[str, concurrent.futures.Future] = {}
+        self._lock = threading.Lock()
+
+    def _get_session(self) -> requests.Session:
+        with self._lock:
+            if self._session is None:
+                self._session = create_session(pool_size=self.max_workers)
+            return self._session
+
+    def _git_show(self, ref: str, path: str) -> bytes | None:
+        try:
+            result = subprocess.run(["git", "-C", str(self.root), "show", f"{ref}:{path}"], capture_output=True)
+        except OSError:
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    def _load_local(self, url: str) -> dict | None:
+        match = _LOCAL_REPO_URL.match(url)
+        if not match:
+            return None
+        ref, path = match.group("ref", "path")
+        if re.fullmatch("[0-9a-f]{7,40}", ref):
+            candidates = [ref]
+        else:
+            # Note: not using local branches, which might be outdated or diverged
+            candidates = [f"refs/remotes/origin/{ref}", f"refs/tags/{ref}"]
+        for candidate in candidates:
+            content = self._git_show(candidate, path)
+            if content is not None:
+                return json_loads(content)
+        return None
+
+    def _load(self, url: str) -> dict | None:
+        process = self._load_local(url)
+        if process is not None:
+            _log.debug(f"Resolved namespace {url!r} from local checkout")
+            return process
+        if self.offline:
+            _log.info(f"Offline mode: not resolving namespace {url!r}")
+            return None
+        resp = self._get_session().get(url, timeout=DEFAULT_TIMEOUT)
+        resp.raise_for_status()
+        return json_loads(resp.content)
+
+    def _get_future(self, url: str, executor: concurrent.futures.Executor | None = None) -> concurrent.futures.Future:
+        with self._lock:
+            future = self._memo.get(url)
+            if future is not None:
+                return future
+            if executor:
+                future = self._memo[url] = executor.submit(self._load, url)
+                return future
+            future = self._memo[url] = concurrent.futures.Future()
+        try:
+            future.set_result(self._load(url))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def prefetch(self, urls: Iterable[str]):
+        """Resolve given namespace URLs concurrently (and wait for completion)."""
+        urls = set(urls).difference(self._memo)
+        if urls:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for url in urls:
+                    self._get_future(url, executor=executor)
+
+    def resolve(self, url: str) -> dict | None:
+        """
+        Get process definition at given namespace URL
+        (None in offline mode for URLs that can not be resolved locally).
+        """
+        return self._get_future(url).result()
+
+
+_resolver: NamespaceResolver | None = None
+
+
+def get_namespace_resolver() -> NamespaceResolver:
+    """
+    Get shared namespace resolver (memoizing results for the whole run).
+    Offline mode can be enabled with env var `APEX_ALGORITHMS_LINT_OFFLINE`.
+    """
+    global _resolver
+    if _resolver is None:
+        offline = os.environ.get("APEX_ALGORITHMS_LINT_OFFLINE", "").lower() in {"1", "true", "yes"}
+        _resolver = NamespaceResolver(offline=offline)
+    return _resolver
@@ -3,11 +3,9 @@ from __future__ import annotations
 import dataclasses
 from pathlib import Path
 
-import jsonschema
-
 from apex_algorithm_qa_tools.scenarios.scenario import (
     BenchmarkScenario,
-    get_benchmark_scenario_schema,
+    validate_benchmark_scenario,
 )
 
 
@@ -36,8 +34,11 @@ class OGCAPIBenchmarkScenario(BenchmarkScenario):
         cls,
         data: dict,
         source: str | Path | None = None,
+        *,
+        validate: bool = True,
     ) -> BenchmarkScenario:
-        jsonschema.validate(instance=data, schema=get_benchmark_scenario_schema())
+        if validate:
+            validate_benchmark_scenario(data)
 
         application = data.get("application")
         namespace = data.get("namespace")
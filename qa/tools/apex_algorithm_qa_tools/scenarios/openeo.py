@@ -2,16 +2,17 @@ from __future__ import annotations
 
 import dataclasses
 import json
+import logging
 from pathlib import Path
 import re
 from typing import List
 
-import jsonschema
-import requests
-
-from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario,get_benchmark_scenario_schema
+from apex_algorithm_qa_tools.scenarios.namespaces import NamespaceResolver, get_namespace_resolver
+from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario, validate_benchmark_scenario
 from apex_algorithm_qa_tools.common import assert_no_github_feature_branch_refs
 
+_log = logging.getLogger(__name__)
+
 
 BACKEND_PATTERNS = [
     r"^(https://)?openeo\.dataspace\.copernicus\.eu(/.*)?$",
@@ -30,8 +31,9 @@ class openEOBenchmarkScenario(BenchmarkScenario):
     job_options: dict | None = None
 
     @classmethod
-    def from_dict(cls, data: dict, source: str | Path | None = None) -> BenchmarkScenario:
-        jsonschema.validate(instance=data, schema=get_benchmark_scenario_schema())
+    def from_dict(cls, data: dict, source: str | Path | None = None, *, validate: bool = True) -> BenchmarkScenario:
+        if validate:
+            validate_benchmark_scenario(data)
         # TODO: also include the `lint_benchmark_scenario` stuff here (maybe with option to toggle deep URL inspection)?
 
         # TODO #14 standardization of these types? What about other types and how to support them?
@@ -69,7 +71,10 @@ def lint_namespace_reference(namespace: str):
     assert_no_github_feature_branch_refs(namespace)
 
 
-def lint_openeo_process_graph(scenario: BenchmarkScenario):
+def lint_openeo_process_graph(scenario: BenchmarkScenario, *, resolver: NamespaceResolver | None = None):
+    """
+    :param resolver: resolver for URL based namespaces (by default: shared, memoizing resolver)
+    """
     assert isinstance(scenario.process_graph, dict)
 
     for node in scenario.process_graph.values():
@@ -85,6 +90,8 @@ def lint_openeo_process_graph(scenario: BenchmarkScenario):
         lint_namespace_reference(namespace)
 
         if re.match(r"^https://", namespace):
-            response = requests.get(namespace)
-            response.raise_for_status()
-            assert response.json()["id"] == node["process_id"]
+            process = (resolver or get_namespace_resolver()).resolve(namespace)
+            if process is None:
+                _log.warning(f"Skipping check of unresolved namespace {namespace!r} ({scenario.id=})")
+                continue
+            assert process["id"] == node["process_id"]
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import concurrent.futures
+import glob
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, List
+
+import jsonschema
+
+from apex_algorithm_qa_tools.common import get_project_root, json_loads, load_json
+from apex_algorithm_qa_tools.scenarios.factory import _benchmark_factory
+from apex_algorithm_qa_tools.scenarios.scenario import (
+    BenchmarkScenario,
+    get_benchmark_scenario_schema,
+    validate_benchmark_scenario,
+)
+
+_log = logging.getLogger(__name__)
+
+# Minimum number of scenario files to validate before using a process pool.
+_PARALLEL_THRESHOLD = 16
+
+
+def _validate_scenarios_content(content: bytes) -> List[dict]:
+    """Parse and validate the content of a benchmark scenarios file."""
+    items = json_loads(content)
+    assert isinstance(items, list)
+    for item in items:
+        validate_benchmark_scenario(item)
+    return items
+
+
+class _ValidationFailure(Exception):
+    """Picklable stand-in for a `jsonschema.ValidationError` raised in a worker process."""
+
+    def __init__(self, fields: dict):
+        super().__init__(fields)
+        self.fields = fields
+
+
+def _validate_scenarios_content_in_worker(content: bytes) -> List[dict]:
+    """
+    Like `_validate_scenarios_content()`, for use in a worker process:
+    a `jsonschema.ValidationError` can not be pickled back to the parent process,
+    so it is converted to plain data (to be converted back with `jsonschema.ValidationError(**fields)`).
+    """
+    try:
+        return _validate_scenarios_content(content)
+    except jsonschema.ValidationError as e:
+        raise _ValidationFailure(
+            {
+                "message": e.message,
+                "validator": e.validator,
+                "path": list(e.path),
+                "schema_path": list(e.schema_path),
+                "validator_value": e.validator_value,
+                "instance": e.instance,
+                "schema": e.schema,
+            }
+        ) from None
+
+
+def _get_schema_hash() -> str:
+    """Hash of the benchmark scenario schema, to invalidate persisted validation results on schema changes."""
+    schema = get_benchmark_scenario_schema()
+    return hashlib.sha256(json.dumps(schema, sort_keys=True).encode("utf8")).hexdigest()
+
+
+class ScenarioRegistry:
+    """
+    Registry of the benchmark scenarios of the algorithm catalog.
+
+    Scenario files are only (re)read when their mtime or size changed,
+    and only (re)validated when their content hash changed.
+    The validated scenario data can be persisted to a cache file,
+    to make loading in a fresh process (e.g. pytest collection) cheap as well.
+
+    :param root: project root (containing the "algorithm_catalog" folder)
+    :param cache_path: optional path to a JSON file to persist the validated scenario data in
+    :param max_workers: maximum number of processes to validate scenario files with
+        (0 to always validate in the current process)
+    """
+
+    CACHE_VERSION = 1
+
+    def __init__(
+        self,
+        root: str | Path | None = None,
+        *,
+        cache_path: str | Path | None = None,
+        max_workers: int | None = None,
+    ):
+        self.root = Path(root or get_project_root())
+        self.cache_path = Path(cache_path) if cache_path else None
+        self.max_workers = max_workers
+        # Mapping of scenario file path to dict with keys: "mtime_ns", "size", "sha256", "items"
+        self._entries: Dict[str, dict] = {}
+        if self.cache_path:
+            self._load_cache()
+
+    def _load_cache(self):
+        try:
+            data = load_json(self.cache_path)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.CACHE_VERSION:
+            _log.info(f"Ignoring scenario cache {self.cache_path} with unsupported version {data.get('version')!r}")
+            return
+        if data.get("schema") != _get_schema_hash():
+            _log.info(f"Ignoring scenario cache {self.cache_path} validated against another schema version")
+            return
+        self._entries = data["entries"]
+
+    def _write_cache(self):
+        tmp_path = self.cache_path.with_name(f"{self.cache_path.name}.tmp-{os.getpid()}")
+        with tmp_path.open("w", encoding="utf8") as f:
+            json.dump(
+                {"version": self.CACHE_VERSION, "schema": _get_schema_hash(), "entries": self._entries},
+                f,
+                separators=(",", ":"),
+            )
+        os.replace(tmp_path, self.cache_path)
+
+    def _find_files(self) -> List[str]:
+        # old style glob is used to support symlinks
+        return sorted(
+            glob.glob(str(self.root / "algorithm_catalog") + "/**/*benchmark_scenarios*/*.json", recursive=True)
+        )
+
+    def refresh(self) -> bool:
+        """
+        Update the registry from the scenario files on disk.
+
+        :return: whether anything changed.
+        """
+        paths = self._find_files()
+        changed = False
+        to_validate: Dict[str, bytes] = {}
+        for path in paths:
+            stat = os.stat(path)
+            entry = self._entries.get(path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            content = Path(path).read_bytes()
+            sha256 = hashlib.sha256(content).hexdigest()
+            if entry and entry["sha256"] == sha256:
+                entry.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            else:
+                to_validate[path] = content
+                self._entries[path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+            changed = True
+
+        if to_validate:
+            _log.info(f"Validating {len(to_validate)} benchmark scenario files")
+            try:
+                if self.max_workers == 0 or len(to_validate) < _PARALLEL_THRESHOLD:
+                    validated = [_validate_scenarios_content(c) for c in to_validate.values()]
+                else:
+                    executor = concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers)
+                    try:
+                        with executor:
+                            validated = list(executor.map(_validate_scenarios_content_in_worker, to_validate.values()))
+                    except _ValidationFailure as e:
+                        raise jsonschema.ValidationError(**e.fields) from None
+                for path, items in zip(to_validate.keys(), validated):
+                    self._entries[path]["items"] = items
+            except Exception:
+                # Roll back: invalid (or unvalidated) files should not be registered
+                for path in to_validate:
+                    self._entries.pop(path, None)
+                raise
+
+        for path in set(self._entries).difference(paths):
+            del self._entries[path]
+            changed = True
+
+        if changed and self.cache_path:
+            self._write_cache()
+        return changed
+
+    def get_scenarios(self) -> List[BenchmarkScenario]:
+        """Get all (validated) benchmark scenarios, as new scenario objects."""
+        self.refresh()
+        return [
+            _benchmark_factory(item, Path(path), validate=False)
+            for path, entry in sorted(self._entries.items())
+            for item in entry["items"]
+        ]
@@ -2,22 +2,65 @@ from __future__ import annotations
 
 from abc import ABC
 import dataclasses
-import json
+import functools
 from pathlib import Path
-from typing import List
+from typing import Dict, List
 
+import jsonschema
 
 from apex_algorithm_qa_tools.common import (
     get_project_root,
+    load_json,
 )
 
 
 # TODO #15 Flatten apex_algorithm_qa_tools to a single module and push as much functionality to https://github.com/ESA-APEx/esa-apex-toolbox-python
+@functools.lru_cache(maxsize=1)
 def get_benchmark_scenario_schema() -> dict:
-    with open(get_project_root() / "schemas/benchmark_scenario.json") as f:
-        return json.load(f)
+    # Note: cached, so should be treated as read-only.
+    return load_json(get_project_root() / "schemas/benchmark_scenario.json")
 
 
+@functools.lru_cache(maxsize=1)
+def get_benchmark_scenario_validator() -> jsonschema.protocols.Validator:
+    """Validator for the benchmark scenario schema (schema checked and validator compiled once)."""
+    schema = get_benchmark_scenario_schema()
+    validator_class = jsonschema.validators.validator_for(schema)
+    validator_class.check_schema(schema)
+    return validator_class(schema)
+
+
+def validate_benchmark_scenario(data: dict):
+    """
+    Validate benchmark scenario data against the schema.
+    Like `jsonschema.validate`, but with a reused validator.
+    """
+    error = jsonschema.exceptions.best_match(get_benchmark_scenario_validator().iter_errors(data))
+    if error is not None:
+        raise error
+
+
+@dataclasses.dataclass(frozen=True)
+class ReferenceSource:
+    """
+    Source of a reference data file, with optional checksum and size to verify the download with,
+    and optional URL of its fingerprint sidecar file (to compare with before downloading).
+    """
+
+    href: str
+    sha256: str | None = None
+    size: int | None = None
+    fingerprint: str | None = None
+
+    @classmethod
+    def from_value(cls, value: str | dict) -> ReferenceSource:
+        """Build from a `reference_data` value: a plain URL or an object with "href" and optional checksum fields."""
+        if isinstance(value, str):
+            return cls(href=value)
+        return cls(
+            href=value["href"], sha256=value.get("sha256"), size=value.get("size"), fingerprint=value.get("fingerprint")
+        )
+
 
 @dataclasses.dataclass(kw_only=True)
 class BenchmarkScenario(ABC):
@@ -29,5 +72,9 @@ class BenchmarkScenario(ABC):
     source: str | Path | None = None
 
     @classmethod
-    def from_dict(cls, data: dict, source: str | Path | None = None) -> BenchmarkScenario:
-        pass
\ No newline at end of file
+    def from_dict(cls, data: dict, source: str | Path | None = None, *, validate: bool = True) -> BenchmarkScenario:
+        pass
+
+    def get_reference_sources(self) -> Dict[str, ReferenceSource]:
+        """Get reference data sources, by (relative) file path."""
+        return {path: ReferenceSource.from_value(value) for path, value in self.reference_data.items()}
@@ -2,19 +2,27 @@ import json
 from pathlib import Path
 from typing import List
 
+import openeo.rest.auth.auth
+import openeo.rest.connection
 import openeo.rest.job
 import openeo.testing.results
 import pytest
 from apex_algorithm_qa_tools.benchmarks.common import (
+    ResultDownloadPolicy,
     analyse_results_comparison_exception,
+    collect_metrics_from_download_stats,
     collect_metrics_from_job_metadata,
     collect_metrics_from_results_metadata,
 )
+from apex_algorithm_qa_tools.benchmarks.ogc import download_ogc_results
+from apex_algorithm_qa_tools.benchmarks.openeo import download_openeo_results
 from apex_algorithm_qa_tools.benchmarks.runners.base import (
     BenchmarkJobMetadata,
     BenchmarkMetric,
     BenchmarkResults,
 )
+from apex_algorithm_qa_tools.downloads import DownloadStats, ParallelDownloader
+from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
 
 
 class DummyTracker:
@@ -46,6 +54,190 @@ def test_collect_metrics_from_job_metadata(dummy_tracker):
     ]
 
 
+def test_collect_metrics_from_download_stats(dummy_tracker):
+    download_stats = [
+        DownloadStats(name="a.tif", path=Path("a.tif"), size=4_000_000, seconds=2),
+        DownloadStats(name="b.tif", path=Path("b.tif"), size=1_000_000, seconds=0.5),
+    ]
+    collect_metrics_from_download_stats(download_stats, track_metric=dummy_tracker)
+    assert dummy_tracker.data == [
+        ("download:asset:a.tif:bytes", 4_000_000),
+        ("download:asset:a.tif:megabytes_per_second", 2.0),
+        ("download:asset:b.tif:bytes", 1_000_000),
+        ("download:asset:b.tif:megabytes_per_second", 2.0),
+        ("download:total:assets", 2),
+        ("download:total:bytes", 5_000_000),
+    ]
+
+
+def test_collect_metrics_from_download_stats_skipped(dummy_tracker):
+    download_stats = [
+        DownloadStats(name="a.tif", path=Path("a.tif"), size=1_000_000, seconds=1),
+        DownloadStats(name="debug.tif", path=Path("debug.tif"), size=3_000_000, seconds=0, skipped=True),
+    ]
+    collect_metrics_from_download_stats(download_stats, track_metric=dummy_tracker)
+    assert dummy_tracker.data == [
+        ("download:asset:a.tif:bytes", 1_000_000),
+        ("download:asset:a.tif:megabytes_per_second", 1.0),
+        ("download:total:assets", 1),
+        ("download:total:bytes", 1_000_000),
+        ("download:skipped:assets", 1),
+        ("download:skipped:bytes", 3_000_000),
+    ]
+
+
+class TestResultDownloadPolicy:
+    def _scenario(self, reference_options: dict, reference_data: dict | None = None) -> openEOBenchmarkScenario:
+        return openEOBenchmarkScenario(
+            id="foo",
+            type="openeo",
+            backend="openeo.test",
+            process_graph={},
+            reference_data=reference_data or {},
+            reference_options=reference_options,
+        )
+
+    def test_default(self):
+        policy = ResultDownloadPolicy.from_scenario(self._scenario({}))
+        assert policy == ResultDownloadPolicy()
+        assert policy.accepts("anything.tif")
+
+    def test_reference(self):
+        scenario = self._scenario(
+            {"download": "reference"}, reference_data={"openEO[1].tif": "https://data.test/a.tif"}
+        )
+        policy = ResultDownloadPolicy.from_scenario(scenario)
+        assert policy.accepts("openEO[1].tif")
+        assert policy.accepts("job-results.json")
+        assert not policy.accepts("openEO1.tif")
+        assert not policy.accepts("debug.tif")
+
+    def test_reference_default(self):
+        scenario = self._scenario({}, reference_data={"openEO.tif": "https://data.test/a.tif"})
+        assert not ResultDownloadPolicy.from_scenario(scenario, default="reference").accepts("debug.tif")
+        scenario = self._scenario({"download": "all"}, reference_data={"openEO.tif": "https://data.test/a.tif"})
+        assert ResultDownloadPolicy.from_scenario(scenario, default="reference").accepts("debug.tif")
+
+    def test_reference_without_reference_data(self):
+        policy = ResultDownloadPolicy.from_scenario(self._scenario({"download": "reference"}))
+        assert policy.accepts("debug.tif")
+
+    def test_patterns(self):
+        policy = ResultDownloadPolicy.from_scenario(self._scenario({"download": ["*.tif", "sub/*.nc"]}))
+        assert policy.accepts("openEO.tif")
+        assert policy.accepts("sub/out.nc")
+        assert not policy.accepts("out.nc")
+
+    def test_invalid(self):
+        with pytest.raises(ValueError, match="Invalid result download policy"):
+            ResultDownloadPolicy.from_scenario(self._scenario({"download": "nope"}))
+
+
+def test_download_ogc_results(tmp_path, requests_mock):
+    mock = requests_mock.get("https://data.test/results/out.tif", content=b"tiff data")
+    results_metadata = BenchmarkResults(
+        assets={
+            "out": {"href": "https://data.test/results/out.tif", "type": "image/tiff"},
+            "stats": [1, 2, 3],
+        }
+    )
+    downloader = ParallelDownloader()
+    paths = download_ogc_results(
+        results_metadata=results_metadata, actual_dir=tmp_path, user_token="t0k3n", downloader=downloader
+    )
+    assert paths == [tmp_path / "job-results.json", tmp_path / "out.tif", tmp_path / "stats.json"]
+    assert (tmp_path / "out.tif").read_bytes() == b"tiff data"
+    assert mock.last_request.headers["Authorization"] == "Bearer t0k3n"
+    assert [(s.name, s.size) for s in downloader.stats] == [("out", 9)]
+
+
+def test_download_ogc_results_policy(tmp_path, requests_mock):
+    requests_mock.get("https://data.test/results/out.tif", content=b"tiff data")
+    debug = requests_mock.get("https://data.test/results/debug.tif", content=b"debug data")
+    results_metadata = BenchmarkResults(
+        assets={
+            "out": {"href": "https://data.test/results/out.tif"},
+            "debug": {"href": "https://data.test/results/debug.tif", "file:size": 10},
+            "stats": [1, 2, 3],
+        }
+    )
+    downloader = ParallelDownloader()
+    paths = download_ogc_results(
+        results_metadata=results_metadata,
+        actual_dir=tmp_path,
+        downloader=downloader,
+        policy=ResultDownloadPolicy(patterns=("out.tif",)),
+    )
+    assert paths == [tmp_path / "job-results.json", tmp_path / "out.tif"]
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["job-results.json", "out.tif"]
+    assert debug.call_count == 0
+    assert sorted((s.name, s.size, s.skipped) for s in downloader.stats) == [("debug", 10, True), ("out", 9, False)]
+
+
+def _openeo_results(requests_mock, *assets: tuple[str, str, dict]) -> openeo.rest.job.JobResults:
+    """Real `JobResults` (of a batch job on an authenticated connection), with mocked result metadata."""
+    requests_mock.get("https://openeo.test/", json={"api_version": "1.2.0", "endpoints": []})
+    requests_mock.get(
+        "https://openeo.test/jobs/j-123/results",
+        json={"type": "Collection", "assets": {key: {"href": href, **metadata} for key, href, metadata in assets}},
+    )
+    connection = openeo.rest.connection.Connection("https://openeo.test")
+    connection.auth = openeo.rest.auth.auth.BearerAuth(bearer="t0k3n")
+    return openeo.rest.job.JobResults(openeo.rest.job.BatchJob(job_id="j-123", connection=connection))
+
+
+def test_download_openeo_results(tmp_path, requests_mock):
+    requests_mock.get("https://openeo.test/jobs/j-123/results/out.tif", content=b"tiff data")
+    external = requests_mock.get("https://storage.test/j-123/out.nc", content=b"netcdf")
+    results = _openeo_results(
+        requests_mock,
+        ("out.tif", "https://openeo.test/jobs/j-123/results/out.tif", {}),
+        ("out.nc", "https://storage.test/j-123/out.nc", {}),
+    )
+    downloader = ParallelDownloader()
+    paths = download_openeo_results(results=results, actual_dir=tmp_path, downloader=downloader)
+    assert paths == [tmp_path / "out.tif", tmp_path / "out.nc", tmp_path / "job-results.json"]
+    assert (tmp_path / "out.tif").read_bytes() == b"tiff data"
+    assert json.loads((tmp_path / "job-results.json").read_text())["type"] == "Collection"
+    # No backend credentials for external storage
+    assert "Authorization" not in external.last_request.headers
+    assert sorted((s.name, s.size) for s in downloader.stats) == [("out.nc", 6), ("out.tif", 9)]
+
+
+def test_download_openeo_results_filenames(tmp_path, requests_mock):
+    requests_mock.get("https://openeo.test/jobs/j-123/results/a1b2/out.tif", content=b"tiff data")
+    requests_mock.get("https://openeo.test/jobs/j-123/results/c3d4", content=b"netcdf")
+    results = _openeo_results(
+        requests_mock,
+        ("B02 (10m)", "https://openeo.test/jobs/j-123/results/a1b2/out.tif", {}),
+        ("data", "https://openeo.test/jobs/j-123/results/c3d4", {}),
+    )
+    paths = download_openeo_results(results=results, actual_dir=tmp_path)
+    assert paths == [tmp_path / "B02__10m_-out.tif", tmp_path / "data-c3d4", tmp_path / "job-results.json"]
+    assert (tmp_path / "B02__10m_-out.tif").read_bytes() == b"tiff data"
+
+
+def test_download_openeo_results_policy(tmp_path, requests_mock):
+    requests_mock.get("https://openeo.test/jobs/j-123/results/out.tif", content=b"tiff data")
+    debug = requests_mock.get("https://openeo.test/jobs/j-123/results/debug.nc", content=b"netcdf")
+    debug_head = requests_mock.head("https://openeo.test/jobs/j-123/results/debug.nc", headers={"Content-Length": "6"})
+    results = _openeo_results(
+        requests_mock,
+        ("out.tif", "https://openeo.test/jobs/j-123/results/out.tif", {}),
+        ("debug.nc", "https://openeo.test/jobs/j-123/results/debug.nc", {}),
+    )
+    downloader = ParallelDownloader()
+    paths = download_openeo_results(
+        results=results, actual_dir=tmp_path, downloader=downloader, policy=ResultDownloadPolicy(patterns=("*.tif",))
+    )
+    assert paths == [tmp_path / "out.tif", tmp_path / "job-results.json"]
+    assert debug.call_count == 0
+    assert debug_head.last_request.headers["Authorization"] == "Bearer t0k3n"
+    assert sorted((s.name, s.size, s.skipped) for s in downloader.stats) == [
+        ("debug.nc", 6, True),
+        ("out.tif", 9, False),
+    ]
+
 def test_collect_metrics_from_results_metadata_proj_shape(dummy_tracker):
     metadata = BenchmarkResults(
         assets={
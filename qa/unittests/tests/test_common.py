@@ -1,7 +1,12 @@
+import json
+import math
+
 import pytest
 from apex_algorithm_qa_tools.common import (
     assert_no_github_feature_branch_refs,
     get_project_root,
+    json_loads,
+    load_json,
 )
 
 
@@ -38,3 +43,23 @@ def test_assert_no_github_feature_branch_refs_ok(href):
 def test_assert_no_github_feature_branch_refs_not_ok(href, expected_error):
     with pytest.raises(ValueError, match=expected_error):
         assert_no_github_feature_branch_refs(href)
+
+
+@pytest.mark.parametrize("data", ['{"id": "foo", "values": [1, 2.5, null]}', b'["\\u00e9", true]'])
+def test_json_loads(data):
+    assert json_loads(data) == json.loads(data)
+
+
+def test_json_loads_nan():
+    assert math.isnan(json_loads('{"x": NaN}')["x"])
+
+
+def test_json_loads_invalid():
+    with pytest.raises(json.JSONDecodeError):
+        json_loads('{"id": ')
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('[{"id": "caf\u00e9"}]', encoding="utf8")
+    assert load_json(path) == [{"id": "café"}]
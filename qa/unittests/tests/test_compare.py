@@ -0,0 +1,183 @@
+import hashlib
+import json
+import sys
+import types
+
+import numpy
+import openeo.testing.results
+import pytest
+import xarray
+from apex_algorithm_qa_tools.benchmarks.common import analyse_results_comparison_exception
+from apex_algorithm_qa_tools.benchmarks.compare import (
+    FileComparison,
+    JobResultsComparison,
+    collect_metrics_from_comparison,
+    compare_job_results,
+    file_sha256,
+)
+
+pytest.importorskip("netCDF4")
+
+
+def write_netcdf(path, data):
+    xarray.Dataset({"b1": (("y", "x"), numpy.asarray(data, dtype="float32"))}).to_netcdf(path)
+
+
+def write_metadata(path, **kwargs):
+    path.write_text(json.dumps({"type": "Collection", "links": [], **kwargs}))
+
+
+@pytest.fixture
+def dirs(tmp_path):
+    actual = tmp_path / "actual"
+    expected = tmp_path / "expected"
+    actual.mkdir()
+    expected.mkdir()
+    return actual, expected
+
+
+def test_file_sha256(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(b"data" * 1000)
+    assert file_sha256(path) == hashlib.sha256(b"data" * 1000).hexdigest()
+
+
+class TestCompareJobResults:
+    def test_identical(self, dirs):
+        actual, expected = dirs
+        for d in dirs:
+            write_netcdf(d / "out.nc", [[1, 2], [3, 4]])
+            write_metadata(d / "job-results.json")
+        comparison = compare_job_results(actual, expected)
+        assert [(f.name, f.identical, f.issues) for f in comparison.files] == [
+            ("job-results.json", True, []),
+            ("out.nc", True, []),
+        ]
+        comparison.raise_for_issues()
+
+    def test_known_hashes(self, dirs):
+        actual, expected = dirs
+        write_netcdf(actual / "out.nc", [[1, 2], [3, 4]])
+        write_netcdf(expected / "out.nc", [[5, 6], [7, 8]])
+        comparison = compare_job_results(
+            actual, expected, actual_hashes={"out.nc": "abc"}, expected_hashes={"out.nc": "abc"}
+        )
+        assert [(f.name, f.identical) for f in comparison.files] == [("out.nc", True)]
+
+    def test_within_tolerance(self, dirs):
+        actual, expected = dirs
+        write_netcdf(actual / "out.nc", [[1, 2], [3, 4]])
+        write_netcdf(expected / "out.nc", [[1, 2], [3, 4.001]])
+        comparison = compare_job_results(actual, expected, rtol=1e-3, atol=0.01)
+        assert [(f.name, f.identical, f.issues) for f in comparison.files] == [("out.nc", False, [])]
+        comparison.raise_for_issues()
+
+    def test_parallel_with_issues(self, dirs):
+        actual, expected = dirs
+        write_netcdf(actual / "a.nc", [[1, 2], [3, 4]])
+        write_netcdf(expected / "a.nc", [[1, 2], [3, 4.001]])
+        write_netcdf(actual / "b.nc", [[1, 2], [3, 4]])
+        write_netcdf(expected / "b.nc", [[1, 2], [3, 40]])
+        write_metadata(actual / "job-results.json", id="j-123")
+        write_metadata(expected / "job-results.json", id="j-456")
+        comparison = compare_job_results(actual, expected, rtol=1e-3, atol=0.01, max_workers=2)
+        assert [(f.name, f.identical, bool(f.issues)) for f in comparison.files] == [
+            ("a.nc", False, False),
+            ("b.nc", False, True),
+            ("job-results.json", False, False),
+        ]
+        with pytest.raises(AssertionError, match="Issues for file 'b.nc'"):
+            comparison.raise_for_issues()
+
+    def test_fingerprint_matches(self, dirs):
+        actual, expected = dirs
+        write_netcdf(actual / "a.nc", [[1, 2], [3, 4]])
+        write_netcdf(expected / "a.nc", [[1, 2], [3, 4]])
+        write_netcdf(actual / "b.nc", [[1, 2], [3, 4]])
+        match = FileComparison(name="b.nc", identical=False, issues=[], seconds=1, fingerprint_match=True)
+        comparison = compare_job_results(actual, expected, fingerprint_matches={"b.nc": match})
+        assert comparison.issues == []
+        assert [(f.name, f.identical, f.fingerprint_match) for f in comparison.files] == [
+            ("a.nc", True, False),
+            ("b.nc", False, True),
+        ]
+
+    def test_file_set_mismatch(self, dirs):
+        actual, expected = dirs
+        write_netcdf(actual / "a.nc", [[1]])
+        write_netcdf(expected / "a.nc", [[1]])
+        write_netcdf(expected / "b.nc", [[1]])
+        comparison = compare_job_results(actual, expected)
+        assert [i.split(":")[0] for i in comparison.issues] == ["File set mismatch"]
+        assert [f.name for f in comparison.files] == ["a.nc"]
+        with pytest.raises(AssertionError, match="File set mismatch"):
+            comparison.raise_for_issues()
+
+    def test_derived_from_change(self, dirs):
+        # Same failure analysis as with `assert_job_results_allclose()`
+        actual, expected = dirs
+        write_metadata(actual / "job-results.json", links=[{"rel": "derived_from", "href": "/path/to/S2_V1.SAFE"}])
+        write_metadata(expected / "job-results.json", links=[{"rel": "derived_from", "href": "/path/to/S2_V2.SAFE"}])
+        with pytest.raises(AssertionError, match="Differing.*derived_from.*links") as exc_info:
+            compare_job_results(actual, expected).raise_for_issues()
+        assert analyse_results_comparison_exception(exc_info.value) == "derived_from-change"
+
+    @pytest.mark.parametrize("name", ["out.nc", "job-results.json"])
+    def test_public_api_fallback(self, dirs, monkeypatch, name):
+        actual, expected = dirs
+        if name == "out.nc":
+            write_netcdf(actual / name, [[1, 2], [3, 4]])
+            write_netcdf(expected / name, [[1, 2], [3, 40]])
+        else:
+            write_metadata(actual / name, links=[{"rel": "derived_from", "href": "/path/to/S2_V1.SAFE"}])
+            write_metadata(expected / name, links=[{"rel": "derived_from", "href": "/path/to/S2_V2.SAFE"}])
+        issues = compare_job_results(actual, expected).files[0].issues
+        assert issues
+
+        # Same issues when the private per-file building blocks are not available in openeo.
+        public_results = types.ModuleType("openeo.testing.results")
+        public_results.assert_job_results_allclose = openeo.testing.results.assert_job_results_allclose
+        monkeypatch.setitem(sys.modules, "openeo.testing.results", public_results)
+        fallback_issues = compare_job_results(actual, expected).files[0].issues
+        assert "\n".join(fallback_issues) == "\n".join(issues)
+
+
+def test_get_issues():
+    comparison = JobResultsComparison(
+        issues=["File set mismatch"],
+        files=[
+            FileComparison(
+                name="job-results.json", identical=False, issues=["Differing 'derived_from' links"], seconds=1
+            ),
+            FileComparison(name="out.tif", identical=False, issues=["Shape mismatch"], seconds=1),
+            FileComparison(name="other.tif", identical=True, issues=[], seconds=0),
+        ],
+    )
+    assert comparison.get_issues() == [
+        "File set mismatch",
+        "Issues for metadata file 'job-results.json':",
+        "Differing 'derived_from' links",
+        "Issues for file 'out.tif':",
+        "Shape mismatch",
+    ]
+
+
+def test_collect_metrics_from_comparison():
+    comparison = JobResultsComparison(
+        issues=[],
+        files=[
+            FileComparison(name="a.tif", identical=True, issues=[], seconds=0.1),
+            FileComparison(name="b.tif", identical=False, issues=[], seconds=3),
+            FileComparison(name="c.tif", identical=False, issues=[], seconds=0.5, fingerprint_match=True),
+        ],
+    )
+    data = []
+    collect_metrics_from_comparison(comparison, track_metric=lambda name, value: data.append((name, value)))
+    assert data == [
+        ("compare:file:a.tif:seconds", 0.1),
+        ("compare:file:b.tif:seconds", 3),
+        ("compare:file:c.tif:seconds", 0.5),
+        ("compare:identical_files", 1),
+        ("compare:fingerprint_matched_files", 1),
+        ("compare:compared_files", 1),
+    ]
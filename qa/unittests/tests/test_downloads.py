@@ -0,0 +1,156 @@
+import hashlib
+import io
+
+import pytest
+import urllib3.exceptions
+import apex_algorithm_qa_tools.downloads
+from apex_algorithm_qa_tools.downloads import (
+    ChecksumMismatchError,
+    DownloadTask,
+    ParallelDownloader,
+    create_session,
+    download,
+)
+
+
+class InterruptedStream(io.RawIOBase):
+    """File-like response body that breaks off after the given data."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def readable(self):
+        return True
+
+    def read(self, size=-1):
+        if self._data:
+            data, self._data = self._data, b""
+            return data
+        raise urllib3.exceptions.ProtocolError("Connection broken")
+
+
+class TestDownload:
+    @pytest.fixture(autouse=True)
+    def small_chunks(self, monkeypatch):
+        monkeypatch.setattr(apex_algorithm_qa_tools.downloads, "CHUNK_SIZE", 4)
+        monkeypatch.setattr(apex_algorithm_qa_tools.downloads.time, "sleep", lambda s: None)
+
+    def test_basic(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f.tif", content=b"tiff data", headers={"ETag": '"v1"'})
+        result = download("https://data.test/f.tif", tmp_path / "f.tif", session=create_session())
+        assert (tmp_path / "f.tif").read_bytes() == b"tiff data"
+        assert result.sha256 == hashlib.sha256(b"tiff data").hexdigest()
+        assert result.size == 9
+        assert result.etag == '"v1"'
+
+    def test_resume(self, tmp_path, requests_mock):
+        mock = requests_mock.get(
+            "https://data.test/f.tif",
+            [
+                {"body": InterruptedStream(b"tiff"), "headers": {"ETag": '"v1"'}},
+                {"content": b" data", "status_code": 206},
+            ],
+        )
+        result = download(
+            "https://data.test/f.tif", tmp_path / "f.tif", sha256=hashlib.sha256(b"tiff data").hexdigest()
+        )
+        assert (tmp_path / "f.tif").read_bytes() == b"tiff data"
+        assert result.size == 9
+        assert mock.call_count == 2
+        assert mock.request_history[1].headers["Range"] == "bytes=4-"
+        assert mock.request_history[1].headers["If-Range"] == '"v1"'
+
+    def test_resume_unsupported(self, tmp_path, requests_mock):
+        requests_mock.get(
+            "https://data.test/f.tif",
+            [{"body": InterruptedStream(b"tiff")}, {"content": b"tiff data", "status_code": 200}],
+        )
+        download("https://data.test/f.tif", tmp_path / "f.tif")
+        assert (tmp_path / "f.tif").read_bytes() == b"tiff data"
+
+    def test_interrupted_too_often(self, tmp_path, requests_mock):
+        requests_mock.get(
+            "https://data.test/f.tif", [{"body": InterruptedStream(b"tiff")}, {"body": InterruptedStream(b"tiff")}]
+        )
+        with pytest.raises(Exception, match="Connection broken"):
+            download("https://data.test/f.tif", tmp_path / "f.tif", max_attempts=2)
+
+    def test_checksum_mismatch(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f.tif", content=b"tiff data")
+        with pytest.raises(ChecksumMismatchError, match="does not match expected checksum"):
+            download("https://data.test/f.tif", tmp_path / "f.tif", sha256="0" * 64)
+        assert not (tmp_path / "f.tif").exists()
+
+    def test_size_mismatch(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f.tif", content=b"tiff data")
+        with pytest.raises(ChecksumMismatchError):
+            download("https://data.test/f.tif", tmp_path / "f.tif", size=123)
+
+    def test_not_modified(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f.tif", status_code=304)
+        result = download("https://data.test/f.tif", tmp_path / "f.tif", headers={"If-None-Match": '"v1"'})
+        assert result.not_modified
+        assert not (tmp_path / "f.tif").exists()
+
+
+class TestParallelDownloader:
+    def test_download_all(self, tmp_path, requests_mock):
+        for i in range(5):
+            requests_mock.get(f"https://data.test/f{i}.tif", content=b"x" * (i + 1))
+        downloader = ParallelDownloader(max_workers=3)
+        tasks = [
+            DownloadTask(url=f"https://data.test/f{i}.tif", path=tmp_path / "sub" / f"f{i}.tif", name=f"asset{i}")
+            for i in range(5)
+        ]
+        paths = downloader.download_all(tasks)
+        assert paths == [tmp_path / "sub" / f"f{i}.tif" for i in range(5)]
+        assert [p.read_bytes() for p in paths] == [b"x" * (i + 1) for i in range(5)]
+        assert {s.sha256 for s in downloader.stats} == {hashlib.sha256(b"x" * (i + 1)).hexdigest() for i in range(5)}
+        assert sorted((s.name, s.size) for s in downloader.stats) == [(f"asset{i}", i + 1) for i in range(5)]
+
+    def test_headers_and_auth(self, tmp_path, requests_mock):
+        mock = requests_mock.get("https://data.test/f.tif", content=b"data")
+        task = DownloadTask(
+            url="https://data.test/f.tif",
+            path=tmp_path / "f.tif",
+            headers={"X-Foo": "bar"},
+            auth=lambda r: r.headers.update({"Authorization": "Bearer t0k3n"}) or r,
+        )
+        ParallelDownloader().download_all([task])
+        assert mock.last_request.headers["X-Foo"] == "bar"
+        assert mock.last_request.headers["Authorization"] == "Bearer t0k3n"
+
+    def test_default_name(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f.tif", content=b"data")
+        downloader = ParallelDownloader()
+        downloader.download_all([DownloadTask(url="https://data.test/f.tif", path=tmp_path / "f.tif")])
+        assert [(s.name, s.path, s.size) for s in downloader.stats] == [("f.tif", tmp_path / "f.tif", 4)]
+
+    def test_failure(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/f0.tif", content=b"data")
+        requests_mock.get("https://data.test/f1.tif", status_code=404)
+        tasks = [DownloadTask(url=f"https://data.test/f{i}.tif", path=tmp_path / f"f{i}.tif") for i in range(2)]
+        with pytest.raises(Exception, match="404"):
+            ParallelDownloader(max_workers=2, session=create_session(retries=0)).download_all(tasks)
+
+    def test_empty(self):
+        assert ParallelDownloader().download_all([]) == []
+
+    def test_skip_all(self, tmp_path, requests_mock):
+        head = requests_mock.head("https://data.test/f1.tif", headers={"Content-Length": "1234"})
+        requests_mock.head("https://data.test/f2.tif", status_code=500)
+        downloader = ParallelDownloader(session=create_session(retries=0))
+        downloader.skip_all(
+            [
+                DownloadTask(url="https://data.test/f0.tif", path=tmp_path / "f0.tif", size=42),
+                DownloadTask(url="https://data.test/f1.tif", path=tmp_path / "f1.tif"),
+                DownloadTask(url="https://data.test/f2.tif", path=tmp_path / "f2.tif"),
+            ]
+        )
+        assert sorted((s.name, s.size, s.skipped) for s in downloader.stats) == [
+            ("f0.tif", 42, True),
+            ("f1.tif", 1234, True),
+            ("f2.tif", 0, True),
+        ]
+        assert head.call_count == 1
+        assert not any(tmp_path.iterdir())
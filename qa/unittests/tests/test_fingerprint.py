@@ -0,0 +1,238 @@
+import json
+
+import numpy
+import pytest
+import xarray
+from apex_algorithm_qa_tools.benchmarks.fingerprint import (
+    BandFingerprint,
+    Fingerprint,
+    _BandAccumulator,
+    compare_fingerprints,
+    compute_fingerprint,
+    get_fingerprint_path,
+    load_fingerprint,
+    match_reference_fingerprints,
+    write_fingerprint,
+)
+from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
+
+rasterio = pytest.importorskip("rasterio")
+
+
+def write_geotiff(path, data, *, nodata=None, transform=None):
+    data = numpy.asarray(data, dtype="float32")
+    if data.ndim == 2:
+        data = data[numpy.newaxis]
+    count, height, width = data.shape
+    with rasterio.open(
+        path,
+        "w",
+        driver="GTiff",
+        count=count,
+        height=height,
+        width=width,
+        dtype="float32",
+        nodata=nodata,
+        blockysize=1,
+        crs="EPSG:32631",
+        transform=transform or rasterio.transform.from_origin(500000, 5700000, 10, 10),
+    ) as dst:
+        dst.write(data)
+
+
+def make_data(seed=42, shape=(2, 30, 40)):
+    return numpy.random.default_rng(seed).normal(loc=100, scale=10, size=shape)
+
+
+def test_band_accumulator():
+    values = make_data(shape=(1000,))
+    values[::7] = numpy.nan
+    values[::11] = -9999
+    accumulator = _BandAccumulator(nodata=-9999, edges=[0, 50, 100, 150, 200])
+    for window in numpy.array_split(values, 13):
+        accumulator.update(window)
+    fingerprint = accumulator.get_fingerprint()
+
+    valid = values[~numpy.isnan(values) & (values != -9999)]
+    assert fingerprint.count == 1000
+    assert fingerprint.valid_count == valid.size
+    assert fingerprint.nodata_fraction == pytest.approx(1 - valid.size / 1000)
+    assert (fingerprint.min, fingerprint.max) == (valid.min(), valid.max())
+    assert fingerprint.mean == pytest.approx(valid.mean())
+    assert fingerprint.std == pytest.approx(valid.std())
+    assert fingerprint.histogram == numpy.histogram(valid, bins=[0, 50, 100, 150, 200])[0].tolist()
+
+
+def test_band_accumulator_no_valid_values():
+    accumulator = _BandAccumulator()
+    accumulator.update(numpy.full(10, numpy.nan))
+    assert accumulator.get_histogram_edges(bins=4) == []
+    assert accumulator.get_fingerprint() == BandFingerprint(
+        count=10, nodata_fraction=1.0, min=None, max=None, mean=None, std=None, histogram_edges=[], histogram=[]
+    )
+
+
+class TestComputeFingerprint:
+    def test_geotiff(self, tmp_path):
+        data = make_data()
+        data[0, :5, :] = -9999
+        write_geotiff(tmp_path / "out.tif", data, nodata=-9999)
+        fingerprint = compute_fingerprint(tmp_path / "out.tif", bins=8, window_size=100)
+
+        assert sorted(fingerprint.bands) == ["1", "2"]
+        assert fingerprint.geometry["shape"] == [2, 30, 40]
+        assert fingerprint.geometry["dtypes"] == ["float32", "float32"]
+        assert fingerprint.geometry["transform"] == [10, 0, 500000, 0, -10, 5700000]
+        assert "32631" in fingerprint.geometry["crs"]
+        band = fingerprint.bands["1"]
+        valid = data[0, 5:, :].astype("float32")
+        assert (band.count, band.valid_count) == (1200, 1000)
+        assert band.mean == pytest.approx(valid.mean(dtype="float64"))
+        assert band.std == pytest.approx(valid.std(dtype="float64"))
+        assert band.histogram_edges == pytest.approx(numpy.linspace(valid.min(), valid.max(), 9).tolist())
+        assert sum(band.histogram) == 1000
+
+        # Single pass with given bin edges: same fingerprint
+        edges = fingerprint.get_histogram_edges()
+        assert compute_fingerprint(tmp_path / "out.tif", edges=edges, window_size=100) == fingerprint
+
+    def test_netcdf(self, tmp_path):
+        pytest.importorskip("netCDF4")
+        data = make_data()
+        xarray.Dataset(
+            {"B02": (("t", "y", "x"), data.astype("float32")), "B03": (("t", "y", "x"), data.astype("float32") * 2)}
+        ).to_netcdf(tmp_path / "out.nc")
+        fingerprint = compute_fingerprint(tmp_path / "out.nc", window_size=100)
+
+        assert sorted(fingerprint.bands) == ["B02", "B03"]
+        assert fingerprint.bands["B02"].count == data.size
+        assert fingerprint.bands["B03"].mean == pytest.approx(2 * data.astype("float32").mean(dtype="float64"))
+        assert fingerprint.geometry["variables"]["B02"] == {
+            "dims": ["t", "y", "x"],
+            "shape": [2, 30, 40],
+            "dtype": "<f4",
+        }
+
+    def test_netcdf_coordinates(self, tmp_path):
+        pytest.importorskip("netCDF4")
+        data = make_data().astype("float32")
+        for name, x0 in [("expected.nc", 0), ("actual.nc", 10_000)]:
+            xarray.Dataset(
+                {"B02": (("t", "y", "x"), data)}, coords={"x": numpy.arange(40) * 10.0 + x0, "y": numpy.arange(30)}
+            ).to_netcdf(tmp_path / name)
+        expected = compute_fingerprint(tmp_path / "expected.nc")
+        actual = compute_fingerprint(tmp_path / "actual.nc", edges=expected.get_histogram_edges())
+        assert actual.bands == expected.bands
+        issues = compare_fingerprints(actual, expected)
+        assert [i.split(":")[0] for i in issues] == ["Geometry mismatch (coordinates)"]
+
+    def test_unsupported(self, tmp_path):
+        with pytest.raises(ValueError, match="Unsupported raster file type"):
+            compute_fingerprint(tmp_path / "out.json")
+
+
+class TestCompareFingerprints:
+    @pytest.fixture
+    def expected(self, tmp_path) -> Fingerprint:
+        write_geotiff(tmp_path / "expected.tif", make_data())
+        return compute_fingerprint(tmp_path / "expected.tif")
+
+    def get_actual(self, path, data, expected: Fingerprint) -> Fingerprint:
+        write_geotiff(path, data)
+        return compute_fingerprint(path, edges=expected.get_histogram_edges())
+
+    def test_identical(self, tmp_path, expected):
+        actual = self.get_actual(tmp_path / "actual.tif", make_data(), expected)
+        assert compare_fingerprints(actual, expected) == []
+
+    def test_within_tolerance(self, tmp_path, expected):
+        actual = self.get_actual(tmp_path / "actual.tif", make_data() + 0.01, expected)
+        assert compare_fingerprints(actual, expected, atol=0.1, pixel_tolerance=1) == []
+        assert compare_fingerprints(actual, expected, atol=0.001, pixel_tolerance=1) != []
+
+    def test_diverging(self, tmp_path, expected):
+        data = make_data()
+        data[1, :10, :] = 0
+        actual = self.get_actual(tmp_path / "actual.tif", data, expected)
+        issues = compare_fingerprints(actual, expected, atol=1, pixel_tolerance=1)
+        assert issues[0] == "Issues for band '2':"
+        assert "Fraction of values in different histogram bins: 33.33333333333333% > 1%" in issues
+        assert [i.split(" mismatch")[0] for i in issues[1:4]] == [
+            "Statistic 'min'",
+            "Statistic 'mean'",
+            "Statistic 'std'",
+        ]
+
+    def test_shifted(self, tmp_path, expected):
+        write_geotiff(
+            tmp_path / "actual.tif", make_data(), transform=rasterio.transform.from_origin(600000, 5700000, 10, 10)
+        )
+        actual = compute_fingerprint(tmp_path / "actual.tif", edges=expected.get_histogram_edges())
+        assert actual.bands == expected.bands
+        assert compare_fingerprints(actual, expected, atol=1, pixel_tolerance=10) == [
+            "Geometry mismatch (transform): [10.0, 0.0, 600000.0, 0.0, -10.0, 5700000.0]"
+            " != [10.0, 0.0, 500000.0, 0.0, -10.0, 5700000.0]"
+        ]
+
+    def test_shape_mismatch(self, tmp_path, expected):
+        actual = self.get_actual(tmp_path / "actual.tif", make_data(shape=(3, 30, 30)), expected)
+        assert compare_fingerprints(actual, expected) == [
+            "Geometry mismatch (dtypes): ['float32', 'float32', 'float32'] != ['float32', 'float32']",
+            "Geometry mismatch (shape): [3, 30, 30] != [2, 30, 40]",
+            "Band set mismatch: ['1', '2', '3'] != ['1', '2']",
+            "Issues for band '1':",
+            "Value count mismatch: 900 != 1200",
+            "Issues for band '2':",
+            "Value count mismatch: 900 != 1200",
+        ]
+
+
+def test_write_and_load_fingerprint(tmp_path, requests_mock):
+    write_geotiff(tmp_path / "ref.tif", make_data())
+    path = write_fingerprint(tmp_path / "ref.tif", bins=4)
+    assert path == get_fingerprint_path(tmp_path / "ref.tif") == tmp_path / "ref.tif.fingerprint.json"
+    data = json.loads(path.read_text())
+    assert data["version"] == 1
+    assert data["geometry"]["shape"] == [2, 30, 40]
+    assert len(data["bands"]["1"]["histogram"]) == 4
+
+    fingerprint = load_fingerprint(f"file://{path}")
+    assert fingerprint == compute_fingerprint(tmp_path / "ref.tif", bins=4)
+    requests_mock.get("https://data.test/ref.tif.fingerprint.json", text=path.read_text())
+    assert load_fingerprint("https://data.test/ref.tif.fingerprint.json") == fingerprint
+
+    with pytest.raises(ValueError, match="Unsupported fingerprint version"):
+        Fingerprint.from_dict({"version": 666, "bands": {}, "geometry": {}})
+
+
+def test_match_reference_fingerprints(tmp_path):
+    reference = tmp_path / "reference"
+    actual = tmp_path / "actual"
+    reference.mkdir()
+    actual.mkdir()
+    for name in ["same.tif", "changed.tif", "plain.tif", "broken.tif"]:
+        write_geotiff(reference / name, make_data())
+        write_fingerprint(reference / name)
+        write_geotiff(actual / name, make_data() if name != "changed.tif" else make_data(seed=666))
+    (reference / "broken.tif.fingerprint.json").write_text("{}")
+    # Same pixels, shifted 100 km
+    write_geotiff(reference / "shifted.tif", make_data())
+    write_fingerprint(reference / "shifted.tif")
+    write_geotiff(
+        actual / "shifted.tif", make_data(), transform=rasterio.transform.from_origin(600000, 5700000, 10, 10)
+    )
+
+    scenario = openEOBenchmarkScenario(
+        id="test",
+        type="openeo",
+        backend="openeo.test",
+        process_graph={},
+        reference_data={
+            name: {"href": f"file://{reference / name}", "fingerprint": f"file://{reference / name}.fingerprint.json"}
+            for name in ["same.tif", "changed.tif", "shifted.tif", "broken.tif", "missing.tif"]
+        }
+        | {"plain.tif": f"file://{reference / 'plain.tif'}"},
+    )
+    matches = match_reference_fingerprints(scenario, actual, atol=0.1, pixel_tolerance=1)
+    assert list(matches) == ["same.tif"]
+    assert (matches["same.tif"].name, matches["same.tif"].fingerprint_match) == ("same.tif", True)
@@ -0,0 +1,151 @@
+import threading
+import time
+import types
+from pathlib import Path
+
+import pytest
+from apex_algorithm_qa_tools.benchmarks.orchestrator import BenchmarkOrchestrator
+from apex_algorithm_qa_tools.benchmarks.runners.base import (
+    BenchmarkJobMetadata,
+    BenchmarkResults,
+    BenchmarkRunner,
+    BenchmarkRunnerArtifacts,
+)
+from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
+
+
+class FakeRunner(BenchmarkRunner):
+    """Benchmark runner with a fake job (just sleeping), keeping track of concurrency."""
+
+    lock = threading.Lock()
+    running = 0
+    max_running = 0
+
+    def __init__(self, *, scenario, request, duration: float = 0.2, fail_step: str | None = None):
+        super().__init__(scenario=scenario, request=request)
+        self.duration = duration
+        self.fail_step = fail_step
+
+    def _maybe_fail(self, step):
+        if step == self.fail_step:
+            raise RuntimeError(f"Failure in {step}")
+
+    def create_job(self):
+        self._maybe_fail("create-job")
+
+    def run_job(self, *, max_minutes):
+        cls = type(self)
+        with cls.lock:
+            cls.running += 1
+            cls.max_running = max(cls.max_running, cls.running)
+        time.sleep(self.duration)
+        with cls.lock:
+            cls.running -= 1
+        self._maybe_fail("run-job")
+
+    def collect_artifacts(self):
+        return BenchmarkRunnerArtifacts(
+            job_id=f"j-{self.scenario.id}",
+            job_metadata=BenchmarkJobMetadata(cost=1, usage=[]),
+            results_metadata=BenchmarkResults(assets={}),
+        )
+
+    def download_actual(self, *, actual_dir: Path) -> list[Path]:
+        path = actual_dir / "sub" / "result.tif"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(self.scenario.id)
+        return [path]
+
+
+def make_request(nodeid: str):
+    config = types.SimpleNamespace(getoption=lambda name, default=None: default)
+    node = types.SimpleNamespace(nodeid=nodeid, name=nodeid)
+    return types.SimpleNamespace(node=node, session=types.SimpleNamespace(name="session"), config=config)
+
+
+def make_scenario(id: str, backend: str = "openeo.test") -> openEOBenchmarkScenario:
+    return openEOBenchmarkScenario(id=id, type="openeo", backend=backend, process_graph={})
+
+
+@pytest.fixture(autouse=True)
+def reset_fake_runner():
+    FakeRunner.running = FakeRunner.max_running = 0
+
+
+class TestBenchmarkOrchestrator:
+    def test_concurrent(self, tmp_path):
+        orchestrator = BenchmarkOrchestrator(create_runner=FakeRunner, max_jobs_per_backend=4, staging_root=tmp_path)
+        start = time.monotonic()
+        for i in range(4):
+            orchestrator.submit(make_scenario(f"s{i}"), make_request(f"test[s{i}]"))
+        for i in range(4):
+            runner = orchestrator.get_runner(make_request(f"test[s{i}]"))
+            runner.create_job()
+            runner.run_job(max_minutes=None)
+            assert runner.collect_artifacts().job_id == f"j-s{i}"
+            paths = runner.download_actual(actual_dir=tmp_path / f"actual{i}")
+            assert paths == [tmp_path / f"actual{i}" / "sub" / "result.tif"]
+            assert paths[0].read_text() == f"s{i}"
+        assert time.monotonic() - start < 0.6
+        assert FakeRunner.max_running == 4
+        orchestrator.shutdown()
+
+    def test_per_backend_limit(self, tmp_path):
+        orchestrator = BenchmarkOrchestrator(
+            create_runner=lambda **kwargs: FakeRunner(duration=0.1, **kwargs),
+            max_jobs_per_backend=1,
+            staging_root=tmp_path,
+        )
+        for i in range(3):
+            orchestrator.submit(make_scenario(f"s{i}"), make_request(f"test[s{i}]"))
+        for i in range(3):
+            orchestrator.get_runner(make_request(f"test[s{i}]")).run_job(max_minutes=None)
+        assert FakeRunner.max_running == 1
+        orchestrator.shutdown()
+
+    @pytest.mark.parametrize("fail_step", ["create-job", "run-job"])
+    def test_failure_replayed_at_step(self, tmp_path, fail_step):
+        orchestrator = BenchmarkOrchestrator(
+            create_runner=lambda **kwargs: FakeRunner(duration=0, fail_step=fail_step, **kwargs),
+            staging_root=tmp_path,
+        )
+        orchestrator.submit(make_scenario("s"), make_request("test[s]"))
+        runner = orchestrator.get_runner(make_request("test[s]"))
+        steps = {"create-job": runner.create_job, "run-job": lambda: runner.run_job(max_minutes=None)}
+        for step, fun in steps.items():
+            if step == fail_step:
+                with pytest.raises(RuntimeError, match=f"Failure in {fail_step}"):
+                    fun()
+                break
+            fun()
+        orchestrator.shutdown()
+
+    def test_shutdown_stops_running_jobs(self, tmp_path):
+        cancelled = threading.Event()
+
+        class CancellableRunner(FakeRunner):
+            def run_job(self, *, max_minutes):
+                assert cancelled.wait(timeout=5)
+                raise RuntimeError("Job stopped")
+
+            def cancel(self):
+                cancelled.set()
+
+        orchestrator = BenchmarkOrchestrator(create_runner=CancellableRunner, staging_root=tmp_path)
+        orchestrator.submit(make_scenario("s"), make_request("test[s]"))
+        runner = orchestrator.get_runner(make_request("test[s]"))
+        orchestrator.shutdown()
+        with pytest.raises(RuntimeError, match="Job stopped"):
+            runner.run_job(max_minutes=None)
+        assert cancelled.is_set()
+
+    def test_connect_failure(self, tmp_path):
+        def create_runner(**kwargs):
+            raise ConnectionError("nope")
+
+        orchestrator = BenchmarkOrchestrator(create_runner=create_runner, staging_root=tmp_path)
+        orchestrator.submit(make_scenario("s"), make_request("test[s]"))
+        with pytest.raises(ConnectionError, match="nope"):
+            orchestrator.get_runner(make_request("test[s]"))
+        assert orchestrator.get_runner(make_request("test[other]")) is None
+        orchestrator.shutdown()
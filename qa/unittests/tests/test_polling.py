@@ -0,0 +1,238 @@
+import threading
+import time
+import types
+
+import pyarrow
+import pyarrow.parquet
+import pytest
+import requests
+from apex_algorithm_qa_tools.benchmarks.ogc import run_ogc_job
+from apex_algorithm_qa_tools.benchmarks.openeo import run_openeo_job
+from apex_algorithm_qa_tools.benchmarks.polling import (
+    JobPoller,
+    PollingCancelled,
+    PollingPolicy,
+    load_expected_durations,
+)
+from ogc_api_processes_client.models import StatusCode
+from openeo.rest import JobFailedException
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+def make_poller(clock: FakeClock, **kwargs) -> JobPoller:
+    return JobPoller(PollingPolicy(jitter=0, **kwargs), clock=clock, sleep=clock.sleep)
+
+
+class TestPollingPolicy:
+    def test_backoff(self):
+        policy = PollingPolicy(initial_interval=2, backoff=2, max_interval=10, jitter=0)
+        assert [policy.get_interval(elapsed=0, step=s) for s in range(5)] == [2, 4, 8, 10, 10]
+
+    def test_jitter(self):
+        policy = PollingPolicy(initial_interval=10, jitter=0.1)
+        assert policy.get_interval(elapsed=0, step=0, rng=lambda: 0) == pytest.approx(9)
+        assert policy.get_interval(elapsed=0, step=0, rng=lambda: 1) == pytest.approx(11)
+
+    def test_expected_duration(self):
+        policy = PollingPolicy(initial_interval=2, max_interval=100, jitter=0, expected_duration=120)
+        assert policy.get_interval(elapsed=0, step=0) == 60
+        assert policy.get_interval(elapsed=100, step=0) == 10
+        assert policy.get_interval(elapsed=119, step=0) == 2
+        assert policy.get_interval(elapsed=130, step=1) == 3
+
+
+class TestJobPoller:
+    def test_stats(self, clock):
+        poller = make_poller(clock, initial_interval=2, backoff=2)
+        for _ in range(3):
+            poller.wait()
+            poller.poll(lambda: "running")
+        assert clock.sleeps == [2, 4, 8]
+        stats = poller.get_stats()
+        assert (stats.count, stats.overshoot_seconds, stats.duration_seconds) == (3, 8, 14)
+
+    def test_expected_duration(self, clock):
+        poller = make_poller(clock, initial_interval=2, backoff=2, max_interval=100, expected_duration=100)
+        while poller.elapsed < 110:
+            poller.wait()
+            poller.poll(lambda: "running")
+        # Sparse polling until expected end, then fast polling again
+        assert clock.sleeps == [50, 25, 12.5, 6.25, 3.125, 2, 2, 2, 4, 8]
+
+    def test_wait_time_limit(self, clock):
+        poller = make_poller(clock, initial_interval=10)
+        poller.set_time_limit(13)
+        poller.wait()
+        poller.wait()
+        poller.wait()
+        assert clock.sleeps == [10, 3, 0]
+
+    def test_raise_if_aborted_timeout(self, clock):
+        poller = make_poller(clock)
+        poller.set_time_limit(60)
+        stopped = []
+        poller.raise_if_aborted(job="Batch job j-123", stop_job=lambda: stopped.append(True))
+        clock.now += 60
+        with pytest.raises(TimeoutError, match="Batch job j-123 exceeded maximum allowed time of 1 minutes"):
+            poller.raise_if_aborted(job="Batch job j-123", stop_job=lambda: stopped.append(True))
+        assert stopped == [True]
+
+    def test_raise_if_aborted_stop_failure(self, clock, caplog):
+        poller = make_poller(clock)
+        poller.cancel()
+
+        def stop_job():
+            raise RuntimeError("nope")
+
+        with pytest.raises(PollingCancelled):
+            poller.raise_if_aborted(job="Batch job j-123", stop_job=stop_job)
+        assert "Failed to stop Batch job j-123: RuntimeError('nope')" in caplog.text
+
+    def test_cancel_interrupts_wait(self):
+        poller = JobPoller(PollingPolicy(initial_interval=60))
+        threading.Timer(0.1, poller.cancel).start()
+        start = time.monotonic()
+        poller.wait()
+        assert time.monotonic() - start < 5
+        assert poller.cancelled
+
+
+class FakeOpenEOJob:
+    job_id = "j-123"
+
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+        self.started = False
+        self.stopped = False
+
+    def start(self):
+        self.started = True
+
+    def stop(self):
+        self.stopped = True
+
+    def describe(self):
+        status = self._statuses.pop(0)
+        if isinstance(status, Exception):
+            raise status
+        return {"status": status}
+
+    def logs(self, level=None):
+        return []
+
+
+class TestRunOpenEOJob:
+    def test_finished(self, clock):
+        job = FakeOpenEOJob(["queued", "running", "finished"])
+        poller = make_poller(clock, initial_interval=1, backoff=2)
+        run_openeo_job(job=job, max_minutes=None, poller=poller)
+        assert job.started
+        assert clock.sleeps == [1, 2, 4]
+        assert poller.get_stats().count == 3
+
+    def test_soft_error(self, clock):
+        job = FakeOpenEOJob(["queued", requests.ConnectionError("glitch"), "finished"])
+        poller = make_poller(clock)
+        run_openeo_job(job=job, max_minutes=None, poller=poller)
+        assert poller.get_stats().count == 3
+
+    def test_failed(self, clock):
+        job = FakeOpenEOJob(["running", "error"])
+        with pytest.raises(JobFailedException, match="didn't finish successfully. Status: error"):
+            run_openeo_job(job=job, max_minutes=None, poller=make_poller(clock))
+
+    def test_timeout(self, clock):
+        job = FakeOpenEOJob(["running"] * 100)
+        poller = make_poller(clock, initial_interval=10, backoff=1)
+        with pytest.raises(TimeoutError, match="Batch job j-123 exceeded maximum allowed time of 1 minutes"):
+            run_openeo_job(job=job, max_minutes=1, poller=poller)
+        assert job.stopped
+        assert sum(clock.sleeps) == 60
+
+    def test_timeout_in_worker_thread(self, clock):
+        # No dependency on signals (which only work in the main thread)
+        job = FakeOpenEOJob(["running"] * 100)
+        errors = []
+
+        def run():
+            try:
+                run_openeo_job(job=job, max_minutes=1, poller=make_poller(clock, initial_interval=10))
+            except Exception as e:
+                errors.append(e)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        thread.join(timeout=5)
+        assert [type(e) for e in errors] == [TimeoutError]
+        assert job.stopped
+
+
+class TestRunOgcJob:
+    def test_successful(self, clock):
+        statuses = [StatusCode.RUNNING, StatusCode.SUCCESSFUL]
+        api_client = types.SimpleNamespace(
+            execute_simple=lambda **kwargs: types.SimpleNamespace(job_id="ns:j-123"),
+            get_status=lambda job_id: types.SimpleNamespace(status=statuses.pop(0)),
+        )
+        poller = make_poller(clock, initial_interval=2, backoff=2)
+        job_id = run_ogc_job(
+            api_client=api_client,
+            scenario=types.SimpleNamespace(application="app"),
+            user_token="t0k3n",
+            job={},
+            max_minutes=None,
+            poller=poller,
+        )
+        assert job_id == "j-123"
+        assert clock.sleeps == [2, 4]
+        assert poller.get_stats().count == 2
+
+    def test_timeout(self, clock):
+        dismissed = []
+        api_client = types.SimpleNamespace(
+            execute_simple=lambda **kwargs: types.SimpleNamespace(job_id="ns:j-123"),
+            get_status=lambda job_id: types.SimpleNamespace(status=StatusCode.RUNNING),
+            dismiss=lambda job_id, _headers: dismissed.append(job_id),
+        )
+        with pytest.raises(TimeoutError, match="Batch job j-123 exceeded maximum allowed time of 2 minutes"):
+            run_ogc_job(
+                api_client=api_client,
+                scenario=types.SimpleNamespace(application="app"),
+                user_token="t0k3n",
+                job={},
+                max_minutes=2,
+                poller=make_poller(clock, initial_interval=50, backoff=1),
+            )
+        assert dismissed == ["j-123"]
+        assert clock.sleeps == [50, 50, 20]
+
+
+def test_load_expected_durations(tmp_path):
+    path = tmp_path / "metrics.parquet"
+    table = pyarrow.Table.from_pydict(
+        {
+            "test:nodeid": [f"tests/test_benchmarks.py::test_run_benchmark[{s}]" for s in ["a", "a", "a", "b", "c"]],
+            "test:outcome": ["passed", "passed", "passed", "failed", "passed"],
+            "test:start": [time.time()] * 5,
+            "poll:duration_seconds": [100.0, 300.0, 200.0, 50.0, None],
+        }
+    )
+    pyarrow.parquet.write_table(table, path)
+    assert load_expected_durations(str(path)) == {"a": 200.0}
@@ -0,0 +1,171 @@
+import numpy
+import pytest
+import xarray
+from apex_algorithm_qa_tools.benchmarks.compare import compare_job_results
+from apex_algorithm_qa_tools.benchmarks.raster_compare import (
+    ToleranceStats,
+    _row_windows,
+    compare_rasters_windowed,
+    get_decoded_size,
+)
+
+rasterio = pytest.importorskip("rasterio")
+
+
+def write_geotiff(path, data, *, tiled: bool = False, transform=None, compress=None):
+    data = numpy.asarray(data, dtype="float32")
+    if data.ndim == 2:
+        data = data[numpy.newaxis]
+    count, height, width = data.shape
+    profile = dict(
+        driver="GTiff",
+        count=count,
+        height=height,
+        width=width,
+        dtype="float32",
+        crs="EPSG:32631",
+        transform=transform or rasterio.transform.from_origin(500000, 5700000, 10, 10),
+    )
+    if compress:
+        profile.update(compress=compress)
+    if tiled:
+        profile.update(tiled=True, blockxsize=16, blockysize=16)
+    else:
+        profile.update(blockysize=1)
+    with rasterio.open(path, "w", **profile) as dst:
+        dst.write(data)
+
+
+def write_netcdf(path, data):
+    data = numpy.asarray(data, dtype="float32")
+    xarray.Dataset(
+        {"b1": (("t", "y", "x"), data)},
+        coords={"t": numpy.arange(data.shape[0]), "y": numpy.arange(data.shape[1]), "x": numpy.arange(data.shape[2])},
+    ).to_netcdf(path)
+
+
+class TestToleranceStats:
+    def test_within_tolerance(self):
+        stats = ToleranceStats(total=4, rtol=0.1, atol=0, pixel_tolerance=0)
+        stats.update(numpy.array([1.0, 2.0, 10.5, numpy.nan]), numpy.array([1.0, 2.0, 10.0, numpy.nan]))
+        assert (stats.bad, stats.nan_mismatches, stats.max_abs_diff) == (0, 0, 0.5)
+        assert not stats.exceeded
+        assert stats.get_issues() == []
+
+    def test_pixel_tolerance(self):
+        stats = ToleranceStats(total=10, rtol=0, atol=0.1, pixel_tolerance=10)
+        stats.update(numpy.array([1.0, 2.0]), numpy.array([1.0, 3.0]))
+        assert not stats.exceeded
+        stats.update(numpy.array([1.0, 2.0]), numpy.array([1.0, 3.0]))
+        assert stats.exceeded
+        assert stats.get_issues() == [
+            "Fraction significantly differing pixels: 20.0% > 10% (max absolute difference 1.0)",
+            "Stopped comparison early, after 4 of 10 values",
+        ]
+
+    def test_nan_mismatch(self):
+        stats = ToleranceStats(total=2, rtol=1, atol=1, pixel_tolerance=50)
+        stats.update(numpy.array([1.0, numpy.nan]), numpy.array([1.0, 2.0]))
+        assert stats.exceeded
+        assert stats.get_issues() == ["NaN (nodata) mismatch for 1 values"]
+
+
+def test_row_windows():
+    assert list(_row_windows(10, 100, 1, 300)) == [(0, 3), (3, 6), (6, 9), (9, 10)]
+    assert list(_row_windows(10, 100, 4, 300)) == [(0, 4), (4, 8), (8, 10)]
+    assert list(_row_windows(10, 100, 1, 10_000)) == [(0, 10)]
+
+
+class TestCompareRastersWindowed:
+    @pytest.mark.parametrize("tiled", [False, True])
+    def test_geotiff(self, tmp_path, tiled):
+        data = numpy.arange(2 * 40 * 50).reshape((2, 40, 50))
+        write_geotiff(tmp_path / "actual.tif", data + 0.01, tiled=tiled)
+        write_geotiff(tmp_path / "expected.tif", data, tiled=tiled)
+        kwargs = dict(rtol=0, atol=0.1, pixel_tolerance=0, window_size=100)
+        assert compare_rasters_windowed(tmp_path / "actual.tif", tmp_path / "expected.tif", **kwargs) == []
+
+    def test_geotiff_early_stop(self, tmp_path):
+        data = numpy.zeros((100, 20))
+        write_geotiff(tmp_path / "actual.tif", data + 1)
+        write_geotiff(tmp_path / "expected.tif", data)
+        issues = compare_rasters_windowed(
+            tmp_path / "actual.tif", tmp_path / "expected.tif", atol=0.1, pixel_tolerance=10, window_size=200
+        )
+        assert issues == [
+            "Fraction significantly differing pixels: 20.0% > 10% (max absolute difference 1.0)",
+            "Stopped comparison early, after 400 of 2000 values",
+        ]
+
+    def test_geotiff_shape_mismatch(self, tmp_path):
+        write_geotiff(tmp_path / "actual.tif", numpy.zeros((10, 20)))
+        write_geotiff(tmp_path / "expected.tif", numpy.zeros((10, 21)))
+        assert compare_rasters_windowed(tmp_path / "actual.tif", tmp_path / "expected.tif") == [
+            "Shape mismatch: (1, 10, 20) != (1, 10, 21)"
+        ]
+
+    def test_geotiff_coordinate_mismatch(self, tmp_path):
+        write_geotiff(tmp_path / "actual.tif", numpy.zeros((10, 20)))
+        write_geotiff(
+            tmp_path / "expected.tif",
+            numpy.zeros((10, 20)),
+            transform=rasterio.transform.from_origin(500010, 5700000, 10, 10),
+        )
+        issues = compare_rasters_windowed(tmp_path / "actual.tif", tmp_path / "expected.tif")
+        assert [i.split(":")[0] for i in issues] == ["Coordinate mismatch (geotransform)"]
+
+    def test_netcdf(self, tmp_path):
+        pytest.importorskip("netCDF4")
+        data = numpy.arange(3 * 30 * 20).reshape((3, 30, 20))
+        write_netcdf(tmp_path / "actual.nc", data + 0.01)
+        write_netcdf(tmp_path / "expected.nc", data)
+        kwargs = dict(rtol=0, atol=0.1, pixel_tolerance=0, window_size=100)
+        assert compare_rasters_windowed(tmp_path / "actual.nc", tmp_path / "expected.nc", **kwargs) == []
+
+        expected = data.astype("float32")
+        expected[0, 1, 5] = 1000
+        write_netcdf(tmp_path / "expected.nc", expected)
+        issues = compare_rasters_windowed(tmp_path / "actual.nc", tmp_path / "expected.nc", **kwargs)
+        assert issues[0] == "Issues for variable 'b1':"
+        assert issues[1].startswith("Fraction significantly differing pixels: 0.05555555555555555% > 0%")
+        assert issues[2:] == ["Stopped comparison early, after 100 of 1800 values"]
+
+
+def test_get_decoded_size(tmp_path):
+    write_geotiff(tmp_path / "out.tif", numpy.zeros((3, 200, 100)), compress="deflate")
+    assert get_decoded_size(tmp_path / "out.tif") == 3 * 200 * 100 * 4
+    assert (tmp_path / "out.tif").stat().st_size < 10_000
+
+    pytest.importorskip("netCDF4")
+    write_netcdf(tmp_path / "out.nc", numpy.zeros((3, 20, 10)))
+    # Data variable (float32) and coordinates (int64)
+    assert get_decoded_size(tmp_path / "out.nc") == 3 * 20 * 10 * 4 + (3 + 20 + 10) * 8
+
+
+def test_compare_job_results_windowed(tmp_path):
+    for name in ["actual", "expected"]:
+        (tmp_path / name).mkdir()
+    data = numpy.zeros((50, 50))
+    write_geotiff(tmp_path / "actual" / "out.tif", data + 1)
+    write_geotiff(tmp_path / "expected" / "out.tif", data)
+    comparison = compare_job_results(tmp_path / "actual", tmp_path / "expected", atol=0.1, windowed_min_size=0)
+    assert [(f.name, f.identical, f.issues) for f in comparison.files] == [
+        ("out.tif", False, ["Fraction significantly differing pixels: 100.0% > 0.0% (max absolute difference 1.0)"])
+    ]
+
+
+def test_compare_job_results_windowed_decoded_size(tmp_path, caplog):
+    caplog.set_level("INFO")
+    for name in ["actual", "expected"]:
+        (tmp_path / name).mkdir()
+    data = numpy.zeros((500, 500))
+    write_geotiff(tmp_path / "actual" / "out.tif", data + 1, compress="deflate")
+    write_geotiff(tmp_path / "expected" / "out.tif", data, compress="deflate")
+    assert (tmp_path / "actual" / "out.tif").stat().st_size < 100_000
+    # Small compressed files, but 1 MB of decoded data
+    compare_job_results(tmp_path / "actual", tmp_path / "expected", windowed_min_size=1_000_000)
+    assert "Comparing large raster 'out.tif' window by window" in caplog.text
+
+    caplog.clear()
+    compare_job_results(tmp_path / "actual", tmp_path / "expected", windowed_min_size=1_000_001)
+    assert "window by window" not in caplog.text
@@ -0,0 +1,146 @@
+import hashlib
+import os
+
+import pytest
+import requests
+from apex_algorithm_qa_tools.downloads import ChecksumMismatchError
+from apex_algorithm_qa_tools.reference_cache import ReferenceDataCache
+from apex_algorithm_qa_tools.scenarios.common import download_reference_data
+from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
+
+
+class TestReferenceDataCache:
+    def test_get_and_revalidate(self, tmp_path, requests_mock):
+        url = "https://data.test/ref.tif"
+        mock = requests_mock.get(url, content=b"tiff data", headers={"ETag": '"v1"'})
+        cache = ReferenceDataCache(tmp_path / "cache")
+
+        path = cache.get(url)
+        assert path.read_bytes() == b"tiff data"
+        assert mock.call_count == 1
+        assert "If-None-Match" not in mock.last_request.headers
+
+        requests_mock.get(url, status_code=304)
+        assert cache.get(url) == path
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_get_changed(self, tmp_path, requests_mock):
+        url = "https://data.test/ref.tif"
+        requests_mock.get(url, content=b"v1", headers={"ETag": '"v1"'})
+        cache = ReferenceDataCache(tmp_path / "cache")
+        path1 = cache.get(url)
+        requests_mock.get(url, content=b"v2", headers={"ETag": '"v2"'})
+        path2 = cache.get(url)
+        assert path1 != path2
+        assert path2.read_bytes() == b"v2"
+
+    def test_get_http_error(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/ref.tif", status_code=404)
+        cache = ReferenceDataCache(tmp_path / "cache")
+        with pytest.raises(requests.HTTPError):
+            cache.get("https://data.test/ref.tif")
+        assert list((tmp_path / "cache" / "objects").glob("*/*")) == []
+
+    def test_content_addressed(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/a.tif", content=b"same")
+        requests_mock.get("https://data.test/b.tif", content=b"same")
+        cache = ReferenceDataCache(tmp_path / "cache")
+        assert cache.get("https://data.test/a.tif") == cache.get("https://data.test/b.tif")
+        assert len(list((tmp_path / "cache" / "objects").glob("*/*"))) == 1
+
+    def test_get_by_checksum(self, tmp_path, requests_mock):
+        sha256 = hashlib.sha256(b"same").hexdigest()
+        mock_a = requests_mock.get("https://data.test/a.tif", content=b"same")
+        mock_b = requests_mock.get("https://data.test/b.tif", content=b"same")
+        cache = ReferenceDataCache(tmp_path / "cache")
+        path = cache.get("https://data.test/a.tif", sha256=sha256)
+        assert cache.get("https://data.test/a.tif", sha256=sha256) == path
+        assert cache.get("https://data.test/b.tif", sha256=sha256) == path
+        assert (mock_a.call_count, mock_b.call_count) == (1, 0)
+
+    def test_get_checksum_mismatch(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/ref.tif", content=b"corrupt")
+        cache = ReferenceDataCache(tmp_path / "cache")
+        with pytest.raises(ChecksumMismatchError):
+            cache.get("https://data.test/ref.tif", sha256=hashlib.sha256(b"tiff data").hexdigest())
+        assert list((tmp_path / "cache" / "objects").glob("*/*")) == []
+        assert list((tmp_path / "cache" / "tmp").iterdir()) == []
+
+    def test_materialize_hardlink(self, tmp_path, requests_mock):
+        requests_mock.get("https://data.test/ref.tif", content=b"tiff data")
+        cache = ReferenceDataCache(tmp_path / "cache")
+        path = cache.materialize("https://data.test/ref.tif", tmp_path / "ref.tif")
+        assert path.read_bytes() == b"tiff data"
+        assert os.path.samefile(path, cache.get("https://data.test/ref.tif"))
+
+    def test_eviction(self, tmp_path, requests_mock):
+        cache = ReferenceDataCache(tmp_path / "cache", max_size=25)
+        for i in range(4):
+            requests_mock.get(f"https://data.test/{i}.tif", content=bytes([i]) * 10)
+            path = cache.get(f"https://data.test/{i}.tif")
+            os.utime(path, (i, i))
+        remaining = sorted(p.read_bytes()[0] for p in (tmp_path / "cache" / "objects").glob("*/*"))
+        assert remaining == [2, 3]
+
+    def test_eviction_oversized(self, tmp_path, requests_mock):
+        cache = ReferenceDataCache(tmp_path / "cache", max_size=25)
+        requests_mock.get("https://data.test/small.tif", content=b"s" * 10)
+        requests_mock.get("https://data.test/large.tif", content=b"L" * 100)
+        cache.get("https://data.test/small.tif")
+        path = cache.get("https://data.test/large.tif")
+        assert path.read_bytes() == b"L" * 100
+        assert list((tmp_path / "cache" / "objects").glob("*/*")) == [path]
+
+
+def test_download_reference_data(tmp_path, requests_mock):
+    local = tmp_path / "local.nc"
+    local.write_bytes(b"netcdf data")
+    requests_mock.get("https://data.test/ref.tif", content=b"tiff data")
+    scenario = openEOBenchmarkScenario(
+        id="test",
+        type="openeo",
+        description="Test",
+        backend="openeo.test",
+        process_graph={},
+        reference_data={"ref.tif": "https://data.test/ref.tif", "sub/local.nc": f"file://{local}"},
+    )
+    cache = ReferenceDataCache(tmp_path / "cache")
+
+    expected_hashes = {
+        "ref.tif": hashlib.sha256(b"tiff data").hexdigest(),
+        "sub/local.nc": hashlib.sha256(b"netcdf data").hexdigest(),
+    }
+    hashes = {}
+    reference_dir = download_reference_data(scenario, tmp_path / "reference", cache=cache, hashes=hashes)
+    assert (reference_dir / "ref.tif").read_bytes() == b"tiff data"
+    assert (reference_dir / "sub" / "local.nc").read_bytes() == b"netcdf data"
+    assert os.path.samefile(reference_dir / "ref.tif", cache.get("https://data.test/ref.tif"))
+    assert hashes == expected_hashes
+
+    hashes = {}
+    reference_dir = download_reference_data(scenario, tmp_path / "reference-nocache", hashes=hashes)
+    assert (reference_dir / "ref.tif").read_bytes() == b"tiff data"
+    assert hashes == expected_hashes
+
+    hashes = {}
+    reference_dir = download_reference_data(scenario, tmp_path / "reference-skip", hashes=hashes, skip={"ref.tif"})
+    assert [p.name for p in reference_dir.rglob("*") if p.is_file()] == ["local.nc"]
+    assert hashes == {"sub/local.nc": expected_hashes["sub/local.nc"]}
+
+
+def test_download_reference_data_checksums(tmp_path, requests_mock):
+    requests_mock.get("https://data.test/a.tif", content=b"aaa")
+    requests_mock.get("https://data.test/b.tif", content=b"corrupt")
+    scenario = openEOBenchmarkScenario(
+        id="test",
+        type="openeo",
+        backend="openeo.test",
+        process_graph={},
+        reference_data={
+            "a.tif": {"href": "https://data.test/a.tif", "sha256": hashlib.sha256(b"aaa").hexdigest(), "size": 3},
+            "b.tif": {"href": "https://data.test/b.tif", "sha256": hashlib.sha256(b"bbb").hexdigest()},
+        },
+    )
+    with pytest.raises(ChecksumMismatchError):
+        download_reference_data(scenario, tmp_path / "reference")
+    assert sorted(p.name for p in (tmp_path / "reference").iterdir()) == ["a.tif"]
@@ -1,19 +1,39 @@
+import json
+import re
+import subprocess
 from pathlib import Path
 
 import jsonschema
 import pytest
+import requests
 
 from apex_algorithm_qa_tools.scenarios.common import get_benchmark_scenarios, lint_benchmark_scenario
 from apex_algorithm_qa_tools.scenarios.factory import _benchmark_factory
-from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario
+from apex_algorithm_qa_tools.scenarios.scenario import BenchmarkScenario, ReferenceSource
 from apex_algorithm_qa_tools.scenarios.openeo import openEOBenchmarkScenario
+import apex_algorithm_qa_tools.scenarios.registry
+from apex_algorithm_qa_tools.scenarios.registry import ScenarioRegistry
+from apex_algorithm_qa_tools.scenarios.index import DuplicateScenarioIdError, ScenarioIndex
+from apex_algorithm_qa_tools.scenarios.namespaces import NamespaceResolver, get_namespace_resolver
+from apex_algorithm_qa_tools.scenarios.openeo import lint_openeo_process_graph
+from apex_algorithm_qa_tools.scenarios.ogc import OGCAPIBenchmarkScenario, OGCAPIAuth
 
 def test_get_benchmark_scenarios():
     scenarios = get_benchmark_scenarios()
     assert len(scenarios) > 0
 
 
-# TODO: tests to check uniqueness of scenario ids?
+
+
+@pytest.fixture(scope="module")
+def prefetch_namespaces():
+    """Resolve all namespaces used in the benchmark scenarios concurrently up front."""
+    get_namespace_resolver().prefetch(
+        node["namespace"]
+        for scenario in get_benchmark_scenarios()
+        for node in (getattr(scenario, "process_graph", None) or {}).values()
+        if re.match("^https://", node.get("namespace") or "")
+    )
 
 
 @pytest.mark.parametrize(
@@ -24,7 +44,7 @@ def test_get_benchmark_scenarios():
         for uc in get_benchmark_scenarios()
     ],
 )
-def test_lint_scenario(scenario: BenchmarkScenario):
+def test_lint_scenario(scenario: BenchmarkScenario, prefetch_namespaces):
     lint_benchmark_scenario(scenario)
 
     assert isinstance(scenario.source, Path) and scenario.source.exists()
@@ -68,6 +88,75 @@ class TestOpenEOBenchmarkScenario:
             openEOBenchmarkScenario.from_dict({})
 
 
+class TestReferenceData:
+    def test_reference_sources(self):
+        bs = openEOBenchmarkScenario.from_dict(
+            {
+                "id": "foo",
+                "type": "openeo",
+                "backend": "openeo.test",
+                "process_graph": {},
+                "reference_data": {
+                    "a.tif": "https://data.test/a.tif",
+                    "b.tif": {"href": "https://data.test/b.tif", "sha256": "ab" * 32, "size": 123},
+                    "c.tif": {"href": "https://data.test/c.tif", "fingerprint": "https://data.test/c.tif.fp.json"},
+                },
+            }
+        )
+        assert bs.get_reference_sources() == {
+            "a.tif": ReferenceSource(href="https://data.test/a.tif"),
+            "b.tif": ReferenceSource(href="https://data.test/b.tif", sha256="ab" * 32, size=123),
+            "c.tif": ReferenceSource(href="https://data.test/c.tif", fingerprint="https://data.test/c.tif.fp.json"),
+        }
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            123,
+            {"sha256": "ab" * 32},
+            {"href": "https://data.test/b.tif", "sha256": "nope"},
+            {"href": "https://data.test/b.tif", "md5": "ab" * 16},
+        ],
+    )
+    def test_invalid(self, value):
+        with pytest.raises(jsonschema.ValidationError):
+            openEOBenchmarkScenario.from_dict(
+                {
+                    "id": "foo",
+                    "type": "openeo",
+                    "backend": "openeo.test",
+                    "process_graph": {},
+                    "reference_data": {"b.tif": value},
+                }
+            )
+
+    @pytest.mark.parametrize("download", ["all", "reference", ["*.tif", "sub/*.nc"]])
+    def test_download_option(self, download):
+        bs = openEOBenchmarkScenario.from_dict(
+            {
+                "id": "foo",
+                "type": "openeo",
+                "backend": "openeo.test",
+                "process_graph": {},
+                "reference_options": {"download": download},
+            }
+        )
+        assert bs.reference_options == {"download": download}
+
+    @pytest.mark.parametrize("download", ["some", "*.tif", [1, 2]])
+    def test_download_option_invalid(self, download):
+        with pytest.raises(jsonschema.ValidationError):
+            openEOBenchmarkScenario.from_dict(
+                {
+                    "id": "foo",
+                    "type": "openeo",
+                    "backend": "openeo.test",
+                    "process_graph": {},
+                    "reference_options": {"download": download},
+                }
+            )
+
+
 class TestBenchmarkFactory:
     def test_openeo_factory(self):
         path = Path("dummy_scenarios.json")
@@ -102,3 +191,266 @@ class TestBenchmarkFactory:
                 item={"type": "ogcapi-processes"},
                 path=Path("dummy.json"),
             )
+
+
+class TestScenarioRegistry:
+    @pytest.fixture
+    def root(self, tmp_path) -> Path:
+        for name, ids in [("foo", ["foo1", "foo2"]), ("bar", ["bar1"])]:
+            path = tmp_path / "algorithm_catalog" / "vito" / name / "benchmark_scenarios" / f"{name}.json"
+            path.parent.mkdir(parents=True)
+            path.write_text(
+                json.dumps([{"id": i, "type": "openeo", "backend": "openeo.test", "process_graph": {}} for i in ids])
+            )
+        return tmp_path
+
+    def test_get_scenarios(self, root):
+        registry = ScenarioRegistry(root)
+        scenarios = registry.get_scenarios()
+        assert [s.id for s in scenarios] == ["bar1", "foo1", "foo2"]
+        assert all(isinstance(s, openEOBenchmarkScenario) for s in scenarios)
+        assert scenarios[0].source == root / "algorithm_catalog/vito/bar/benchmark_scenarios/bar.json"
+        assert registry.refresh() is False
+
+    def test_invalid(self, root):
+        path = root / "algorithm_catalog/vito/foo/benchmark_scenarios/foo.json"
+        path.write_text(json.dumps([{"id": "foo1", "type": "openeo"}]))
+        registry = ScenarioRegistry(root)
+        with pytest.raises(jsonschema.ValidationError):
+            registry.get_scenarios()
+        # Invalid file should not be cached
+        with pytest.raises(jsonschema.ValidationError):
+            registry.get_scenarios()
+
+    def test_changes(self, root):
+        registry = ScenarioRegistry(root)
+        assert len(registry.get_scenarios()) == 3
+        path = root / "algorithm_catalog/vito/foo/benchmark_scenarios/foo.json"
+        path.write_text(json.dumps([{"id": "foo3", "type": "openeo", "backend": "openeo.test", "process_graph": {}}]))
+        (root / "algorithm_catalog/vito/bar/benchmark_scenarios/bar.json").unlink()
+        assert [s.id for s in registry.get_scenarios()] == ["foo3"]
+
+    def test_persistent_cache(self, root, tmp_path, monkeypatch):
+        cache_path = tmp_path / "scenarios-cache.json"
+        assert len(ScenarioRegistry(root, cache_path=cache_path).get_scenarios()) == 3
+        assert cache_path.exists()
+
+        def no_validation(content):
+            raise RuntimeError("should not be validated")
+
+        monkeypatch.setattr(apex_algorithm_qa_tools.scenarios.registry, "_validate_scenarios_content", no_validation)
+        registry = ScenarioRegistry(root, cache_path=cache_path)
+        assert [s.id for s in registry.get_scenarios()] == ["bar1", "foo1", "foo2"]
+
+        # Touched but unchanged file: no revalidation either
+        path = root / "algorithm_catalog/vito/foo/benchmark_scenarios/foo.json"
+        path.write_text(path.read_text())
+        registry = ScenarioRegistry(root, cache_path=cache_path)
+        assert [s.id for s in registry.get_scenarios()] == ["bar1", "foo1", "foo2"]
+
+    def test_persistent_cache_schema_change(self, root, tmp_path, monkeypatch):
+        cache_path = tmp_path / "scenarios-cache.json"
+        assert len(ScenarioRegistry(root, cache_path=cache_path).get_scenarios()) == 3
+        monkeypatch.setattr(apex_algorithm_qa_tools.scenarios.registry, "_get_schema_hash", lambda: "other")
+        validated = []
+        monkeypatch.setattr(
+            apex_algorithm_qa_tools.scenarios.registry,
+            "_validate_scenarios_content",
+            lambda content: validated.append(content) or json.loads(content),
+        )
+        assert len(ScenarioRegistry(root, cache_path=cache_path).get_scenarios()) == 3
+        assert len(validated) == 2
+
+    def test_parallel_validation(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(apex_algorithm_qa_tools.scenarios.registry, "_PARALLEL_THRESHOLD", 2)
+        for i in range(4):
+            path = tmp_path / "algorithm_catalog" / "vito" / f"algo{i}" / "benchmark_scenarios" / "scenarios.json"
+            path.parent.mkdir(parents=True)
+            path.write_text(
+                json.dumps([{"id": f"algo{i}", "type": "openeo", "backend": "openeo.test", "process_graph": {}}])
+            )
+        registry = ScenarioRegistry(tmp_path, max_workers=2)
+        assert [s.id for s in registry.get_scenarios()] == ["algo0", "algo1", "algo2", "algo3"]
+
+    def test_parallel_validation_invalid(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(apex_algorithm_qa_tools.scenarios.registry, "_PARALLEL_THRESHOLD", 2)
+        for i in range(4):
+            path = tmp_path / "algorithm_catalog" / "vito" / f"algo{i}" / "benchmark_scenarios" / "scenarios.json"
+            path.parent.mkdir(parents=True)
+            scenario = {"id": f"algo{i}", "type": "openeo", "backend": "openeo.test", "process_graph": {}}
+            if i == 2:
+                del scenario["process_graph"]
+            path.write_text(json.dumps([scenario]))
+        registry = ScenarioRegistry(tmp_path, max_workers=2)
+        with pytest.raises(jsonschema.ValidationError) as exc_info:
+            registry.get_scenarios()
+        assert exc_info.value.instance["id"] == "algo2"
+        # Nothing registered: same error again (instead of unvalidated entries)
+        with pytest.raises(jsonschema.ValidationError):
+            registry.get_scenarios()
+
+
+class TestScenarioIndex:
+    @pytest.fixture
+    def scenarios(self):
+        return [
+            openEOBenchmarkScenario(
+                id="max_ndvi",
+                type="openeo",
+                backend="openeofed.dataspace.copernicus.eu",
+                process_graph={
+                    "maxndvi1": {
+                        "process_id": "max_ndvi",
+                        "namespace": "https://esa-apex.test/max_ndvi.json",
+                        "arguments": {},
+                    },
+                    "save1": {"process_id": "save_result", "arguments": {}},
+                },
+                source=Path("vito/max_ndvi/benchmark_scenarios/max_ndvi.json"),
+            ),
+            openEOBenchmarkScenario(
+                id="max_ndvi_eodc",
+                type="openeo",
+                backend="https://openeo.eodc.eu/openeo/1.2.0",
+                process_graph={
+                    "maxndvi1": {"process_id": "max_ndvi", "namespace": "https://other.test/max_ndvi.json", "arguments": {}},
+                },
+                source=Path("vito/max_ndvi/benchmark_scenarios/max_ndvi.json"),
+            ),
+            OGCAPIBenchmarkScenario(
+                id="dinsar",
+                type="ogc_api_process",
+                endpoint="https://ogc.test/processes",
+                parameters={},
+                application="dinsar",
+                auth=OGCAPIAuth(url="https://auth.test", realm="test"),
+                source=Path("terradue/dinsar/benchmark_scenarios/dinsar.json"),
+            ),
+        ]
+
+    def test_lookup(self, scenarios):
+        index = ScenarioIndex(scenarios)
+        assert len(index) == 3
+        assert [s.id for s in index] == ["max_ndvi", "max_ndvi_eodc", "dinsar"]
+        assert "dinsar" in index
+        assert index["dinsar"] is scenarios[2]
+        assert index.get("max_ndvi") is scenarios[0]
+        assert index.get("nope") is None
+
+    def test_groupings(self, scenarios):
+        index = ScenarioIndex(scenarios)
+        assert index.backends == ["ogc.test", "openeo.eodc.eu", "openeofed.dataspace.copernicus.eu"]
+        assert [s.id for s in index.by_backend("openeofed.dataspace.copernicus.eu")] == ["max_ndvi"]
+        assert [s.id for s in index.by_backend("https://openeo.eodc.eu")] == ["max_ndvi_eodc"]
+        assert [s.id for s in index.by_type("openeo")] == ["max_ndvi", "max_ndvi_eodc"]
+        assert [s.id for s in index.by_type("ogc_api_process")] == ["dinsar"]
+        assert [s.id for s in index.by_process("max_ndvi")] == ["max_ndvi", "max_ndvi_eodc"]
+        assert [s.id for s in index.by_process("max_ndvi", "https://other.test/max_ndvi.json")] == ["max_ndvi_eodc"]
+        assert [s.id for s in index.by_process("dinsar")] == ["dinsar"]
+        assert index.by_process("save_result") == []
+        assert [s.id for s in index.by_source(Path("vito/max_ndvi/benchmark_scenarios/max_ndvi.json"))] == [
+            "max_ndvi",
+            "max_ndvi_eodc",
+        ]
+
+    @pytest.mark.parametrize(
+        ["pattern", "expected"],
+        [
+            ("openeofed", ["max_ndvi"]),
+            (r"(https://)?openeo\.", ["max_ndvi_eodc"]),
+            ("nope", []),
+        ],
+    )
+    def test_filter_backend(self, scenarios, pattern, expected):
+        assert [s.id for s in ScenarioIndex(scenarios).filter_backend(pattern)] == expected
+
+    def test_duplicate_id(self, scenarios):
+        with pytest.raises(DuplicateScenarioIdError, match="Duplicate benchmark scenario id 'max_ndvi'"):
+            ScenarioIndex(scenarios + [scenarios[0]])
+
+    def test_catalog_scenario_ids_are_unique(self):
+        scenarios = get_benchmark_scenarios()
+        assert len(ScenarioIndex(scenarios)) == len(scenarios)
+
+
+class TestNamespaceResolver:
+    URL = "https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{ref}/algorithm_catalog/vito/foo/openeo_udp/foo.json"
+
+    @pytest.fixture
+    def git(self, tmp_path):
+        def git(*args):
+            return subprocess.run(["git", "-C", str(tmp_path), *args], check=True, capture_output=True, text=True).stdout
+
+        return git
+
+    @pytest.fixture
+    def root(self, tmp_path, git) -> Path:
+        """Local checkout with "foo" UDP committed on "origin/main" (and changed in the working tree)."""
+        path = tmp_path / "algorithm_catalog/vito/foo/openeo_udp/foo.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({"id": "foo"}))
+        git("init", "-q")
+        git("add", ".")
+        git("-c", "user.name=test", "-c", "user.email=test@test", "commit", "-q", "-m", "foo")
+        git("update-ref", "refs/remotes/origin/main", "HEAD")
+        path.write_text(json.dumps({"id": "changed"}))
+        return tmp_path
+
+    def test_local_branch(self, root, requests_mock):
+        resolver = NamespaceResolver(root)
+        for ref in ["main", "refs/heads/main"]:
+            assert resolver.resolve(self.URL.format(ref=ref)) == {"id": "foo"}
+        assert requests_mock.call_count == 0
+
+    def test_local_git_commit(self, root, git, requests_mock):
+        sha = git("rev-parse", "HEAD").strip()
+        resolver = NamespaceResolver(root)
+        assert resolver.resolve(self.URL.format(ref=sha)) == {"id": "foo"}
+        assert requests_mock.call_count == 0
+
+    def test_unknown_ref_not_from_working_tree(self, root, requests_mock):
+        url = self.URL.format(ref="feature")
+        requests_mock.get(url, json={"id": "remote"})
+        assert NamespaceResolver(root).resolve(url) == {"id": "remote"}
+        assert NamespaceResolver(root, offline=True).resolve(url) is None
+
+    def test_remote_memoized(self, root, requests_mock):
+        urls = [f"https://udp.test/{name}.json" for name in ["bar", "baz"]]
+        mocks = [requests_mock.get(url, json={"id": url[-8:-5]}) for url in urls]
+        resolver = NamespaceResolver(root, max_workers=2)
+        resolver.prefetch(urls + urls)
+        assert [resolver.resolve(url) for url in urls] == [{"id": "bar"}, {"id": "baz"}]
+        assert [m.call_count for m in mocks] == [1, 1]
+
+    def test_remote_error_memoized(self, root, requests_mock):
+        mock = requests_mock.get("https://udp.test/bar.json", status_code=404)
+        resolver = NamespaceResolver(root)
+        for _ in range(2):
+            with pytest.raises(requests.HTTPError):
+                resolver.resolve("https://udp.test/bar.json")
+        assert mock.call_count == 1
+
+    def test_offline(self, root, requests_mock):
+        resolver = NamespaceResolver(root, offline=True)
+        assert resolver.resolve("https://udp.test/bar.json") is None
+        assert requests_mock.call_count == 0
+
+    def test_lint_openeo_process_graph(self, root, requests_mock):
+        requests_mock.get("https://udp.test/bar.json", json={"id": "bar"})
+        scenario = openEOBenchmarkScenario(
+            id="test",
+            type="openeo",
+            backend="openeo.test",
+            process_graph={
+                "foo": {
+                    "process_id": "foo",
+                    "namespace": "https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/main/algorithm_catalog/vito/foo/openeo_udp/foo.json",
+                    "arguments": {},
+                },
+                "bar": {"process_id": "bar", "namespace": "https://udp.test/bar.json", "arguments": {}},
+            },
+        )
+        lint_openeo_process_graph(scenario, resolver=NamespaceResolver(root))
+        scenario.process_graph["bar"]["process_id"] = "baz"
+        with pytest.raises(AssertionError):
+            lint_openeo_process_graph(scenario, resolver=NamespaceResolver(root))
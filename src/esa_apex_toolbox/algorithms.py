@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import concurrent.futures
 import dataclasses
+import hashlib
 import json
+import logging
+import os
+import threading
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Dict, Generator, Iterable, List, Optional, Tuple, Union
 
-import requests
+from esa_apex_toolbox import json_backend
+from esa_apex_toolbox.http_cache import HttpCache
+
+
+_log = logging.getLogger(__name__)
 
 
 class LINK_REL:
@@ -13,22 +22,26 @@ class LINK_REL:
     SERVICE = "service"
 
 
-def _load_json_resource(src: Union[dict, str, Path]) -> dict:
+def _load_json_resource(src: Union[dict, str, Path], *, cache: Optional[HttpCache] = None) -> dict:
     """Load a JSON resource from a file or a string."""
     if isinstance(src, dict):
         return src
     elif isinstance(src, Path):
-        with open(src, "r", encoding="utf8") as f:
-            return json.load(f)
+        return json_backend.load_file(src)
     elif isinstance(src, str):
         if src.strip().startswith("{"):
             # Assume the string is JSON payload
-            return json.loads(src)
+            return json_backend.loads(src)
         elif src.startswith("http://") or src.startswith("https://"):
             # Assume the string is a URL to a JSON resource
+            if cache:
+                return cache.get_json(src)
+            # Lazy import to keep the import of this module cheap
+            import requests
+
             resp = requests.get(src)
             resp.raise_for_status()
-            return resp.json()
+            return json_backend.loads(resp.content)
         else:
             # Assume the string is a file path
             return _load_json_resource(Path(src))
@@ -49,6 +62,50 @@ class InvalidMetadataError(ValueError):
     pass
 
 
+BBox = Tuple[float, float, float, float]
+
+
+def _iter_positions(coordinates):
+    """Iterate over all positions in (arbitrarily nested) GeoJSON coordinates."""
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+    else:
+        for c in coordinates or []:
+            yield from _iter_positions(c)
+
+
+def geometry_bbox(geometry: Optional[dict]) -> Optional[BBox]:
+    """Calculate the (west, south, east, north) bounding box of a GeoJSON geometry."""
+    if not geometry:
+        return None
+    if geometry.get("type") == "GeometryCollection":
+        bboxes = [b for b in (geometry_bbox(g) for g in geometry.get("geometries", [])) if b]
+        if not bboxes:
+            return None
+        return (
+            min(b[0] for b in bboxes),
+            min(b[1] for b in bboxes),
+            max(b[2] for b in bboxes),
+            max(b[3] for b in bboxes),
+        )
+    positions = list(_iter_positions(geometry.get("coordinates")))
+    if not positions:
+        return None
+    xs = [p[0] for p in positions]
+    ys = [p[1] for p in positions]
+    return (min(xs), min(ys), max(xs), max(ys))
+
+
+def _parse_bbox(data: dict) -> Optional[BBox]:
+    """Get 2D bounding box of a GeoJSON Feature (from explicit 'bbox' or from its geometry)."""
+    bbox = data.get("bbox")
+    if isinstance(bbox, list) and len(bbox) in (4, 6):
+        if len(bbox) == 6:
+            bbox = [bbox[0], bbox[1], bbox[3], bbox[4]]
+        return tuple(float(v) for v in bbox)
+    return geometry_bbox(data.get("geometry"))
+
+
 @dataclasses.dataclass(frozen=True)
 class UdpLink:
     href: str
@@ -103,73 +160,297 @@ class Algorithm:
     service_links: List[ServiceLink] = None
     license: Optional[str] = None
     organization: Optional[str] = None
+    geometry: Optional[dict] = None
+    bbox: Optional[BBox] = None
     # TODO more fields
 
     @classmethod
-    def from_ogc_api_record(cls, src: Union[dict, str, Path]) -> Algorithm:
+    def from_ogc_api_record(cls, src: Union[dict, str, Path], *, cache: Optional[HttpCache] = None) -> Algorithm:
         """
         Load an algorithm from an 'OGC API - Records' record object, specified
         as a dict, a JSON string, a file path, or a URL.
-        """
-        data = _load_json_resource(src)
-
-        if not data.get("type") == "Feature":
-            raise InvalidMetadataError(f"Expected a GeoJSON 'Feature' object, but got type {data.get('type')!r}.")
-        data_conforms_to = data.get("conformsTo", [])
-        # TODO: Remove http reference once merged to main
-        if (("https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core" not in data_conforms_to) and
-                ("https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core" not in data_conforms_to)):
-            raise InvalidMetadataError(
-                f"Expected an 'OGC API - Records' record object, but got {data.get('conformsTo')!r}."
-            )
 
+        :param cache: optional HTTP cache to use when loading from a URL.
+        """
+        data = _load_json_resource(src, cache=cache)
+        _check_record_header(data)
         properties = data.get("properties", {})
-        if properties.get("type") != "service":
-            raise InvalidMetadataError(f"Expected an APEX algorithm object, but got type {properties.get('type')!r}.")
-
         links = data.get("links", [])
-        udp_links = [UdpLink.from_link_object(link) for link in links if link.get("rel") == LINK_REL.UDP]
-        if len(udp_links) > 1:
-            raise InvalidMetadataError("Multiple UDP links found")
-        # TODO: is having a UDP link a requirement? => No, it can also be an application package
-        udp_link = udp_links[0] if udp_links else None
-
-        service_links = [ServiceLink.from_link_object(link) for link in links if link.get("rel") == LINK_REL.SERVICE]
-        if len(service_links) == 0:
-            raise InvalidMetadataError(
-                "No service links found, the algorithm requires at least one valid service that is known to execute it."
-            )
-
-        pis = [c for c in properties.get("contacts", []) if "principal investigator" in c.get("roles", [])]
-        pi_org = pis[0].get("organization", None) if pis else None
-
-        service_license = data.get("license", None)
         return cls(
             id=data["id"],
             title=properties.get("title"),
             description=properties.get("description"),
-            udp_link=udp_link,
-            service_links=service_links,
-            license=service_license,
-            organization=pi_org,
+            udp_link=_parse_udp_link(links),
+            service_links=_parse_service_links(links),
+            license=data.get("license", None),
+            organization=_parse_pi_organization(properties),
+            geometry=data.get("geometry"),
+            bbox=_parse_bbox(data),
+        )
+
+
+def _check_record_header(data: dict):
+    """Check that a record object is an 'OGC API - Records' record of an APEx algorithm."""
+    if not data.get("type") == "Feature":
+        raise InvalidMetadataError(f"Expected a GeoJSON 'Feature' object, but got type {data.get('type')!r}.")
+    data_conforms_to = data.get("conformsTo", [])
+    # TODO: Remove http reference once merged to main
+    if (("https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core" not in data_conforms_to) and
+            ("https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core" not in data_conforms_to)):
+        raise InvalidMetadataError(
+            f"Expected an 'OGC API - Records' record object, but got {data.get('conformsTo')!r}."
         )
 
+    properties = data.get("properties", {})
+    if properties.get("type") != "service":
+        raise InvalidMetadataError(f"Expected an APEX algorithm object, but got type {properties.get('type')!r}.")
+
+
+def _parse_udp_link(links: List[dict]) -> Optional[UdpLink]:
+    udp_links = [UdpLink.from_link_object(link) for link in links if link.get("rel") == LINK_REL.UDP]
+    if len(udp_links) > 1:
+        raise InvalidMetadataError("Multiple UDP links found")
+    # TODO: is having a UDP link a requirement? => No, it can also be an application package
+    return udp_links[0] if udp_links else None
+
+
+def _parse_service_links(links: List[dict]) -> List[ServiceLink]:
+    service_links = [ServiceLink.from_link_object(link) for link in links if link.get("rel") == LINK_REL.SERVICE]
+    if len(service_links) == 0:
+        raise InvalidMetadataError(
+            "No service links found, the algorithm requires at least one valid service that is known to execute it."
+        )
+    return service_links
+
+
+def _parse_pi_organization(properties: dict) -> Optional[str]:
+    pis = [c for c in properties.get("contacts", []) if "principal investigator" in c.get("roles", [])]
+    return pis[0].get("organization", None) if pis else None
+
+
+_UNSET = object()
+
+
+class AlgorithmRecordView:
+    """
+    Lightweight, read-only view on an 'OGC API - Records' algorithm record,
+    as alternative for :py:class:`Algorithm` when handling large numbers of records.
+
+    Only the record header is validated on construction:
+    the raw record dict is kept as-is and fields are decoded on first access
+    (and cached for the parsed link and bounding box fields).
+    Link validation errors are consequently raised on access of
+    :py:attr:`udp_link` or :py:attr:`service_links` (or :py:meth:`to_algorithm`).
+    """
+
+    __slots__ = ("_data", "_udp_link", "_service_links", "_organization", "_bbox")
+
+    def __init__(self, data: dict):
+        _check_record_header(data)
+        if "id" not in data:
+            raise InvalidMetadataError("Missing 'id' in record object.")
+        self._data = data
+        self._udp_link = _UNSET
+        self._service_links = _UNSET
+        self._organization = _UNSET
+        self._bbox = _UNSET
+
+    @classmethod
+    def from_ogc_api_record(
+        cls, src: Union[dict, str, Path], *, cache: Optional[HttpCache] = None
+    ) -> AlgorithmRecordView:
+        """
+        Load an algorithm record view from an 'OGC API - Records' record object, specified
+        as a dict, a JSON string, a file path, or a URL.
+        """
+        return cls(_load_json_resource(src, cache=cache))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(id={self.id!r})"
+
+    @property
+    def raw(self) -> dict:
+        """The raw record object."""
+        return self._data
+
+    @property
+    def id(self) -> str:
+        return self._data["id"]
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._data.get("properties", {}).get("title")
+
+    @property
+    def description(self) -> Optional[str]:
+        return self._data.get("properties", {}).get("description")
+
+    @property
+    def license(self) -> Optional[str]:
+        return self._data.get("license", None)
+
+    @property
+    def geometry(self) -> Optional[dict]:
+        return self._data.get("geometry")
+
+    @property
+    def udp_link(self) -> Optional[UdpLink]:
+        if self._udp_link is _UNSET:
+            self._udp_link = _parse_udp_link(self._data.get("links", []))
+        return self._udp_link
+
+    @property
+    def service_links(self) -> List[ServiceLink]:
+        if self._service_links is _UNSET:
+            self._service_links = _parse_service_links(self._data.get("links", []))
+        return self._service_links
+
+    @property
+    def organization(self) -> Optional[str]:
+        if self._organization is _UNSET:
+            self._organization = _parse_pi_organization(self._data.get("properties", {}))
+        return self._organization
+
+    @property
+    def bbox(self) -> Optional[BBox]:
+        if self._bbox is _UNSET:
+            self._bbox = _parse_bbox(self._data)
+        return self._bbox
+
+    def to_algorithm(self) -> Algorithm:
+        """Fully decode into an :py:class:`Algorithm`."""
+        return Algorithm(
+            id=self.id,
+            title=self.title,
+            description=self.description,
+            udp_link=self.udp_link,
+            service_links=self.service_links,
+            license=self.license,
+            organization=self.organization,
+            geometry=self.geometry,
+            bbox=self.bbox,
+        )
+
+
+def _parse_tree_listing(tree: dict, folder: str = "") -> tuple:
+    """
+    Extract organization -> algorithm names mapping and algorithm -> record path mapping
+    from a (recursive) Git Trees listing.
+    """
+    prefix = f"{folder.strip('/')}/" if folder.strip("/") else ""
+    algorithms = {}
+    record_paths = {}
+    for item in tree.get("tree", []):
+        path = item["path"]
+        if not path.startswith(prefix):
+            continue
+        parts = path[len(prefix) :].split("/")
+        if item["type"] == "tree" and len(parts) == 1:
+            algorithms.setdefault(parts[0], [])
+        elif item["type"] == "tree" and len(parts) == 2:
+            algorithms.setdefault(parts[0], []).append(parts[1])
+        elif item["type"] == "blob" and len(parts) == 4 and parts[2] == "records" and parts[3] == f"{parts[1]}.json":
+            record_paths[parts[1]] = path
+    return algorithms, record_paths
+
+
+def _walk_tree_listing(commit_sha: str, folder: str = "", *, repo: str = "") -> Generator[Tuple[str, bool], dict, dict]:
+    """
+    Resolve the (recursive) Git Trees listing of a commit, independent of the HTTP client (sync or async):
+    yields Git Trees requests as ``(tree_sha, recursive)`` tuples, to be answered with the
+    corresponding listing through ``send()``, and returns the recursive tree listing.
+
+    GitHub truncates the recursive listing of large repositories, in which case
+    this falls back on walking down to the catalog folder non-recursively and listing each organization
+    subtree recursively, which results in a tree listing equivalent to the recursive one (for the catalog folder).
+
+    :param repo: repository name (e.g. "owner/repo") for logging and error messages
+    """
+    tree = yield commit_sha, True
+    if not tree.get("truncated"):
+        return tree
+
+    _log.info(f"Truncated Git Trees listing of {repo}: listing per organization")
+    folder = folder.strip("/")
+    sha = commit_sha
+    for name in folder.split("/") if folder else []:
+        listing = yield sha, False
+        trees = {item["path"]: item["sha"] for item in listing["tree"] if item["type"] == "tree"}
+        if name not in trees:
+            raise ValueError(f"Folder {folder!r} not found in {repo}@{commit_sha}")
+        sha = trees[name]
+
+    prefix = f"{folder}/" if folder else ""
+    items = []
+    listing = yield sha, False
+    for org in listing["tree"]:
+        if org["type"] != "tree":
+            continue
+        org_path = prefix + org["path"]
+        items.append({**org, "path": org_path})
+        org_tree = yield org["sha"], True
+        if org_tree.get("truncated"):
+            raise RuntimeError(f"Truncated Git Trees listing of {org_path!r} in {repo}")
+        items.extend({**item, "path": f"{org_path}/{item['path']}"} for item in org_tree["tree"])
+    return {"sha": commit_sha, "truncated": False, "tree": items}
+
+
+@dataclasses.dataclass(frozen=True)
+class AlgorithmsLoadResult:
+    """Result of loading multiple algorithms: successfully parsed algorithms and per-algorithm failures."""
+
+    algorithms: Dict[str, Algorithm]
+    errors: Dict[str, Exception]
+
 
 class GithubAlgorithmRepository:
     """
     GitHub based algorithm repository.
+
+    By default, the repository layout is discovered through the GitHub "contents" API,
+    which requires a request per directory.
+    With ``tree_listing=True``, the whole layout is resolved at once
+    from a single recursive "Git Trees" request, pinned to the commit SHA of the branch
+    (or a recursive request per organization if that listing is truncated by GitHub).
+
+    An optional :py:class:`~esa_apex_toolbox.http_cache.HttpCache` can be provided
+    to cache listing and record requests on disk.
     """
 
-    # TODO: caching
+    # Connection pool size of the HTTP session, which should cover the concurrency of bulk loading.
+    _POOL_MAXSIZE = 16
+
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        folder: str = "",
+        branch: str = "main",
+        *,
+        tree_listing: bool = False,
+        cache: Optional[HttpCache] = None,
+    ):
+        import requests
+        import requests.adapters
 
-    def __init__(self, owner: str, repo: str, folder: str = "", branch: str = "main"):
         self.owner = owner
         self.repo = repo
         self.folder = folder
         self.branch = branch
         self._session = requests.Session()
-        self._organizations = list(self._list_organizations())
+        self._session.mount("https://", requests.adapters.HTTPAdapter(pool_maxsize=self._POOL_MAXSIZE))
+        self._cache = cache
+        self._commit_sha: Optional[str] = None
+        # Mapping of algorithm name to record path (relative to repo root), only available in tree listing mode.
+        self._record_paths: Optional[dict] = None
         self._algorithms: Optional[dict] = None
+        # Guard against concurrent (lazy) listing, e.g. from `get_algorithms()` workers.
+        self._listing_lock = threading.Lock()
+        if tree_listing:
+            self._algorithms = self._build_tree_listing()
+            self._organizations = list(self._algorithms.keys())
+        else:
+            self._organizations = list(self._list_organizations())
 
 
     def _list_organizations(self):
@@ -203,23 +484,263 @@ class GithubAlgorithmRepository:
     def _get_listing(self, url=None):
         if url is None:
             url = f"https://api.github.com/repos/{self.owner}/{self.repo}/contents/{self.folder}".strip("/")
-        resp = self._session.get(url, headers={"Accept": "application/vnd.github.object+json"})
-        resp.raise_for_status()
-        listing = resp.json()
+        listing = self._get_json(url, headers={"Accept": "application/vnd.github.object+json"})
         return listing, url
 
+    def _get(self, url: str, headers: dict) -> bytes:
+        if self._cache:
+            return self._cache.get(url, session=self._session, headers=headers)
+        resp = self._session.get(url, headers=headers)
+        resp.raise_for_status()
+        return resp.content
+
+    def _get_json(self, url: str, headers: dict):
+        return json_backend.loads(self._get(url, headers=headers))
+
+    def _get_commit_sha(self) -> str:
+        """Resolve the branch to the commit SHA it currently points to."""
+        url = f"https://api.github.com/repos/{self.owner}/{self.repo}/commits/{self.branch}"
+        return self._get(url, headers={"Accept": "application/vnd.github.sha"}).decode("utf8").strip()
+
+    def _build_tree_listing(self) -> dict:
+        """
+        Build the organization -> algorithm names mapping (and the algorithm -> record path mapping)
+        from a recursive Git Trees listing, pinned to a commit SHA (see `_walk_tree_listing()`).
+        """
+        self._commit_sha = self._get_commit_sha()
+        walk = _walk_tree_listing(self._commit_sha, folder=self.folder, repo=f"{self.owner}/{self.repo}")
+        try:
+            sha, recursive = next(walk)
+            while True:
+                sha, recursive = walk.send(self._get_tree(sha, recursive=recursive))
+        except StopIteration as e:
+            tree = e.value
+        algorithms, self._record_paths = _parse_tree_listing(tree, folder=self.folder)
+        return algorithms
+
+    def _get_tree(self, sha: str, recursive: bool = False) -> dict:
+        url = f"https://api.github.com/repos/{self.owner}/{self.repo}/git/trees/{sha}"
+        if recursive:
+            url += "?recursive=1"
+        return self._get_json(url, headers={"Accept": "application/vnd.github+json"})
+
     def list_algorithms(self) -> List[str]:
         # TODO: method to list names vs method to list parsed Algorithm objects?
-        if self._algorithms is None:
-            self._algorithms = {org: list(self._list_algorithms(org)) for org in self._organizations}
+        with self._listing_lock:
+            if self._algorithms is None:
+                self._algorithms = {org: list(self._list_algorithms(org)) for org in self._organizations}
         return [ algorithm_name for algos in self._algorithms.values() for algorithm_name in algos]
 
-    def get_algorithm(self, name: str) -> Algorithm:
+    def _get_record_url(self, name: str) -> str:
         # TODO: get url from listing from API request, instead of hardcoding this raw url?
         all_algos = self.list_algorithms()
         orgs = [ org for org, algos in self._algorithms.items() if name in algos]
         if len(orgs) != 1:
             raise ValueError(f"Algorithm {name!r} not found in {all_algos}")
-        url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self.branch}/{self.folder}/{orgs[0]}/{name}/records/{name}.json"
+        if self._record_paths is not None:
+            if name not in self._record_paths:
+                raise ValueError(f"No record found for algorithm {name!r}")
+            url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self._commit_sha}/{self._record_paths[name]}"
+        else:
+            url = f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self.branch}/{self.folder}/{orgs[0]}/{name}/records/{name}.json"
+        return url
+
+    def get_algorithm(self, name: str) -> Algorithm:
+        url = self._get_record_url(name)
         # TODO: how to make sure GitHub URL is requested with additional headers?
-        return Algorithm.from_ogc_api_record(url)
+        return Algorithm.from_ogc_api_record(self._get_json(url, headers={}))
+
+    def get_algorithms(self, names: Optional[Iterable[str]] = None, *, max_workers: int = 8) -> AlgorithmsLoadResult:
+        """
+        Load multiple algorithms concurrently (over a shared, pooled HTTP session).
+
+        Failures to load or parse individual records are collected in the result
+        instead of aborting the whole batch.
+
+        :param names: names of the algorithms to load (all algorithms by default).
+        :param max_workers: maximum number of concurrent record requests.
+        """
+        if names is None:
+            names = self.list_algorithms()
+        algorithms = {}
+        errors = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {name: executor.submit(self.get_algorithm, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    algorithms[name] = future.result()
+                except Exception as e:
+                    _log.warning(f"Failed to load algorithm {name!r}: {e!r}")
+                    errors[name] = e
+        return AlgorithmsLoadResult(algorithms=algorithms, errors=errors)
+
+
+class LocalAlgorithmRepository:
+    """
+    Algorithm repository backed by a local checkout of the algorithm catalog
+    (e.g. the ``algorithm_catalog`` folder of the APEx algorithms repository).
+
+    The catalog records (``{root}/*/*/records/*.json``) are scanned once into a compact index,
+    which is persisted as JSON file (by default ``{root}/.algorithm_index.json``)
+    so that later instances can reload it without parsing all records again.
+    When the index can not be written (e.g. read-only checkout), it is only kept in memory.
+    On (re)load, only records that changed (based on file mtime/size, confirmed by content hash)
+    and record directories that changed (e.g. added or removed files) are rescanned.
+    """
+
+    INDEX_VERSION = 1
+    DEFAULT_INDEX_FILENAME = ".algorithm_index.json"
+
+    def __init__(self, root: Union[str, Path], *, index_path: Union[str, Path, None] = None):
+        self.root = Path(root)
+        self.index_path = Path(index_path) if index_path else self.root / self.DEFAULT_INDEX_FILENAME
+        # Mapping of record directory (relative to root) to its mtime (in ns)
+        self._directories: Dict[str, int] = {}
+        # Mapping of algorithm id to index entry
+        self._index: Dict[str, dict] = {}
+        # Memoized parsed algorithms
+        self._algorithms: Dict[str, Algorithm] = {}
+        self._load_index()
+        self.refresh()
+
+    def _load_index(self):
+        try:
+            data = json_backend.load_file(self.index_path)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.INDEX_VERSION:
+            _log.info(f"Ignoring index {self.index_path} with unsupported version {data.get('version')!r}")
+            return
+        self._directories = data["directories"]
+        self._index = data["algorithms"]
+
+    def _write_index(self):
+        data = {
+            "version": self.INDEX_VERSION,
+            "directories": self._directories,
+            "algorithms": self._index,
+        }
+        tmp_path = self.index_path.with_name(f"{self.index_path.name}.tmp-{os.getpid()}")
+        try:
+            with tmp_path.open("w", encoding="utf8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp_path, self.index_path)
+        except OSError as e:
+            # E.g. read-only checkout: just work with the in-memory index.
+            _log.warning(f"Failed to persist algorithm index to {self.index_path}: {e!r}")
+            try:
+                tmp_path.unlink(missing_ok=True)
+            except OSError:
+                pass
+
+    @staticmethod
+    def _index_entry(path: Path, rel_path: str, content: bytes, stat: os.stat_result) -> Optional[dict]:
+        """Extract index entry from a record file."""
+        try:
+            data = json_backend.loads(content)
+        except ValueError as e:
+            _log.warning(f"Skipping invalid record {path}: {e!r}")
+            return None
+        if not isinstance(data, dict) or "id" not in data:
+            _log.warning(f"Skipping record without id {path}")
+            return None
+        links = data.get("links", [])
+        udp_hrefs = [link.get("href") for link in links if link.get("rel") == LINK_REL.UDP]
+        return {
+            "id": data["id"],
+            "path": rel_path,
+            "org": rel_path.split("/")[0],
+            "udp": udp_hrefs[0] if udp_hrefs else None,
+            "services": [link.get("href") for link in links if link.get("rel") == LINK_REL.SERVICE],
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": hashlib.sha256(content).hexdigest(),
+        }
+
+    def _drop_entry(self, entry: dict):
+        # Note: entry might already be replaced by a record with the same (duplicate) id.
+        if self._index.get(entry["id"]) is entry:
+            del self._index[entry["id"]]
+            self._algorithms.pop(entry["id"], None)
+
+    def refresh(self) -> bool:
+        """
+        Update the index with changes on disk (and persist it when changed).
+        Returns whether the index changed.
+        """
+        changed = False
+        entries_by_path = {e["path"]: e for e in self._index.values()}
+        known_paths_by_dir = {}
+        for rel_path in entries_by_path:
+            known_paths_by_dir.setdefault(rel_path.rsplit("/", 1)[0], []).append(rel_path)
+
+        directories = {}
+        for directory in sorted(self.root.glob("*/*/records")):
+            rel_dir = directory.relative_to(self.root).as_posix()
+            directories[rel_dir] = directory.stat().st_mtime_ns
+            known_paths = known_paths_by_dir.get(rel_dir, [])
+            if directories[rel_dir] == self._directories.get(rel_dir):
+                # Directory listing unchanged: only check known records in this directory.
+                rel_paths = known_paths
+            else:
+                rel_paths = [p.relative_to(self.root).as_posix() for p in sorted(directory.glob("*.json"))]
+                rel_paths.extend(p for p in known_paths if p not in rel_paths)
+
+            for rel_path in rel_paths:
+                path = self.root / rel_path
+                existing = entries_by_path.get(rel_path)
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    if existing:
+                        self._drop_entry(existing)
+                        changed = True
+                    continue
+                if existing and (existing["mtime"], existing["size"]) == (stat.st_mtime_ns, stat.st_size):
+                    continue
+                content = path.read_bytes()
+                if existing and existing["sha256"] == hashlib.sha256(content).hexdigest():
+                    existing["mtime"] = stat.st_mtime_ns
+                    changed = True
+                    continue
+                entry = self._index_entry(path=path, rel_path=rel_path, content=content, stat=stat)
+                if existing:
+                    self._drop_entry(existing)
+                if entry:
+                    duplicate = self._index.get(entry["id"])
+                    if duplicate and duplicate["path"] != rel_path:
+                        _log.warning(
+                            f"Duplicate algorithm id {entry['id']!r} in {rel_path} (already in {duplicate['path']}):"
+                            f" using {rel_path}"
+                        )
+                    self._index[entry["id"]] = entry
+                    self._algorithms.pop(entry["id"], None)
+                changed = True
+
+        # Drop records from directories that disappeared
+        for rel_dir in set(known_paths_by_dir).difference(directories):
+            for rel_path in known_paths_by_dir[rel_dir]:
+                self._drop_entry(entries_by_path[rel_path])
+            changed = True
+
+        if directories != self._directories:
+            self._directories = directories
+            changed = True
+        if changed:
+            self._write_index()
+        return changed
+
+    def list_algorithms(self) -> List[str]:
+        return sorted(self._index.keys())
+
+    def get_index_entry(self, name: str) -> dict:
+        """Get raw index entry (path, org, udp href, service hrefs, ...) of an algorithm."""
+        if name not in self._index:
+            raise ValueError(f"Algorithm {name!r} not found in {self.list_algorithms()}")
+        return self._index[name]
+
+    def get_algorithm(self, name: str) -> Algorithm:
+        if name not in self._algorithms:
+            entry = self.get_index_entry(name)
+            self._algorithms[name] = Algorithm.from_ogc_api_record(self.root / entry["path"])
+        return self._algorithms[name]
@@ -0,0 +1,161 @@
+"""
+Asyncio based algorithm repository client.
+
+Requires the optional `httpx` dependency (e.g. install with `pip install esa-apex-algorithms[async]`).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Iterable, List, Optional
+
+import httpx
+
+from esa_apex_toolbox import json_backend
+from esa_apex_toolbox.algorithms import (
+    Algorithm,
+    AlgorithmsLoadResult,
+    _parse_tree_listing,
+    _walk_tree_listing,
+)
+
+_log = logging.getLogger(__name__)
+
+
+class AsyncGithubAlgorithmRepository:
+    """
+    GitHub based algorithm repository, for usage in asyncio applications.
+
+    Mirrors :py:class:`~esa_apex_toolbox.algorithms.GithubAlgorithmRepository`,
+    using its Git Trees listing mode (pinned to the commit SHA of the branch,
+    with a per-organization fallback for truncated listings), which is resolved lazily on first use.
+
+    Requests go through a shared ``httpx.AsyncClient`` (with connection keep-alive)
+    and the number of concurrent requests is bounded by ``max_concurrency``.
+
+    Usage as async context manager to properly close the HTTP client::
+
+        async with AsyncGithubAlgorithmRepository(owner="ESA-APEx", repo="apex_algorithms", folder="algorithm_catalog") as repo:
+            algorithm = await repo.get_algorithm("max_ndvi_composite")
+    """
+
+    def __init__(
+        self,
+        owner: str,
+        repo: str,
+        folder: str = "",
+        branch: str = "main",
+        *,
+        max_concurrency: int = 16,
+        client: Optional[httpx.AsyncClient] = None,
+    ):
+        self.owner = owner
+        self.repo = repo
+        self.folder = folder
+        self.branch = branch
+        self._client = client or httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_concurrency, max_keepalive_connections=max_concurrency),
+            follow_redirects=True,
+        )
+        self._owns_client = client is None
+        self._max_concurrency = max_concurrency
+        # Note: asyncio primitives are created lazily, inside the running event loop
+        # (on Python < 3.10 they bind to the current loop at construction time).
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._listing_lock: Optional[asyncio.Lock] = None
+        self._commit_sha: Optional[str] = None
+        self._algorithms: Optional[dict] = None
+        self._record_paths: Optional[dict] = None
+
+    async def __aenter__(self) -> AsyncGithubAlgorithmRepository:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+
+    async def aclose(self):
+        if self._owns_client:
+            await self._client.aclose()
+
+    def _ensure_primitives(self):
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+            self._listing_lock = asyncio.Lock()
+
+    async def _get(self, url: str, headers: Optional[dict] = None) -> httpx.Response:
+        self._ensure_primitives()
+        async with self._semaphore:
+            resp = await self._client.get(url, headers=headers)
+        resp.raise_for_status()
+        return resp
+
+    async def _ensure_listing(self):
+        self._ensure_primitives()
+        async with self._listing_lock:
+            if self._algorithms is not None:
+                return
+            resp = await self._get(
+                f"https://api.github.com/repos/{self.owner}/{self.repo}/commits/{self.branch}",
+                headers={"Accept": "application/vnd.github.sha"},
+            )
+            commit_sha = resp.text.strip()
+            walk = _walk_tree_listing(commit_sha, folder=self.folder, repo=f"{self.owner}/{self.repo}")
+            try:
+                sha, recursive = next(walk)
+                while True:
+                    sha, recursive = walk.send(await self._get_tree(sha, recursive=recursive))
+            except StopIteration as e:
+                tree = e.value
+            self._algorithms, self._record_paths = _parse_tree_listing(tree, folder=self.folder)
+            self._commit_sha = commit_sha
+
+    async def _get_tree(self, sha: str, recursive: bool = False) -> dict:
+        url = f"https://api.github.com/repos/{self.owner}/{self.repo}/git/trees/{sha}"
+        if recursive:
+            url += "?recursive=1"
+        resp = await self._get(url, headers={"Accept": "application/vnd.github+json"})
+        return json_backend.loads(resp.content)
+
+    async def list_algorithms(self) -> List[str]:
+        await self._ensure_listing()
+        return [algorithm_name for algos in self._algorithms.values() for algorithm_name in algos]
+
+    async def get_algorithm(self, name: str) -> Algorithm:
+        all_algos = await self.list_algorithms()
+        if name not in all_algos:
+            raise ValueError(f"Algorithm {name!r} not found in {all_algos}")
+        if name not in self._record_paths:
+            raise ValueError(f"No record found for algorithm {name!r}")
+        url = (
+            f"https://raw.githubusercontent.com/{self.owner}/{self.repo}/{self._commit_sha}/{self._record_paths[name]}"
+        )
+        resp = await self._get(url)
+        return Algorithm.from_ogc_api_record(json_backend.loads(resp.content))
+
+    async def get_algorithms(self, names: Optional[Iterable[str]] = None) -> AlgorithmsLoadResult:
+        """
+        Load multiple algorithms concurrently (bounded by ``max_concurrency``).
+
+        Failures to load or parse individual records are collected in the result
+        instead of aborting the whole batch.
+        """
+        if names is None:
+            names = await self.list_algorithms()
+        names = list(names)
+        results = await asyncio.gather(*(self.get_algorithm(name) for name in names), return_exceptions=True)
+        algorithms = {}
+        errors = {}
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                _log.warning(f"Failed to load algorithm {name!r}: {result!r}")
+                errors[name] = result
+            elif isinstance(result, BaseException):
+                # Not a load failure (e.g. `asyncio.CancelledError`): propagate.
+                raise result
+            else:
+                algorithms[name] = result
+        return AlgorithmsLoadResult(algorithms=algorithms, errors=errors)
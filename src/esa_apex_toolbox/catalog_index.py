@@ -0,0 +1,278 @@
+"""
+Searchable index of the algorithm catalog, stored as a single SQLite database.
+
+The index compiles the algorithm records (``{catalog_root}/*/*/records/*.json``)
+into a compact table of algorithms and an inverted index of search terms
+(keywords, themes, platforms and interfaces),
+so that queries can be answered without parsing the individual record files.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import sqlite3
+from pathlib import Path
+from typing import Iterable, List, Optional, Union
+
+from esa_apex_toolbox import json_backend
+
+_log = logging.getLogger(__name__)
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    algorithm_id TEXT
+);
+CREATE TABLE IF NOT EXISTS algorithms (
+    id TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    organization TEXT,
+    title TEXT,
+    license TEXT,
+    private INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS terms (
+    kind TEXT NOT NULL,
+    term TEXT NOT NULL,
+    algorithm_id TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS terms_lookup ON terms (kind, term);
+CREATE INDEX IF NOT EXISTS terms_algorithm ON terms (algorithm_id);
+"""
+
+
+class TERM_KIND:
+    KEYWORD = "keyword"
+    # Individual words of keywords
+    TOKEN = "token"
+    THEME = "theme"
+    PLATFORM = "platform"
+    INTERFACE = "interface"
+
+
+def _normalize(term: str) -> str:
+    return " ".join(term.lower().split())
+
+
+def _tokenize(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9]+", text.lower())
+
+
+def normalize_interface(conforms_to: Iterable[str]) -> List[str]:
+    """Map 'conformsTo' URIs to interface names (e.g. "openEO UDP")."""
+    interfaces = []
+    for value in conforms_to:
+        if not isinstance(value, str):
+            continue
+        if "openeo-udp" in value:
+            interfaces.append("openEO UDP")
+        elif "ogc-api-processes" in value:
+            interfaces.append("OGC API - Processes")
+    return list(dict.fromkeys(interfaces))
+
+
+def _extract_terms(data: dict) -> List[tuple]:
+    """Extract (kind, term) search terms from an algorithm record."""
+    properties = data.get("properties") or {}
+    terms = []
+    for keyword in properties.get("keywords", []):
+        if isinstance(keyword, str) and keyword.strip():
+            terms.append((TERM_KIND.KEYWORD, _normalize(keyword)))
+            terms.extend((TERM_KIND.TOKEN, token) for token in _tokenize(keyword))
+    for theme in properties.get("themes", []):
+        for concept in theme.get("concepts", []) if isinstance(theme, dict) else []:
+            if isinstance(concept, dict) and isinstance(concept.get("id"), str):
+                terms.append((TERM_KIND.THEME, _normalize(concept["id"])))
+    for link in data.get("links", []):
+        if isinstance(link, dict) and link.get("rel") == "platform":
+            title = link.get("title") or Path(link.get("href", "")).stem
+            if title:
+                terms.append((TERM_KIND.PLATFORM, _normalize(title)))
+    for interface in normalize_interface(data.get("conformsTo", [])):
+        terms.append((TERM_KIND.INTERFACE, _normalize(interface)))
+    return list(dict.fromkeys(terms))
+
+
+class CatalogIndex:
+    """
+    SQLite based search index of the algorithm catalog.
+
+    Usage::
+
+        index = CatalogIndex("catalog.sqlite")
+        index.update(catalog_root="algorithm_catalog")
+        index.search(keywords=["ndvi"], interface="openEO UDP")
+    """
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self.path = path
+        self._db = sqlite3.connect(str(path))
+        self._db.executescript(_SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    def __enter__(self) -> CatalogIndex:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _remove_file(self, rel_path: str) -> Optional[str]:
+        """Remove the rows of given record file and return its algorithm id (if any)."""
+        row = self._db.execute("SELECT algorithm_id FROM files WHERE path = ?", (rel_path,)).fetchone()
+        if row and row[0]:
+            self._db.execute("DELETE FROM terms WHERE algorithm_id = ?", (row[0],))
+            self._db.execute("DELETE FROM algorithms WHERE id = ?", (row[0],))
+        self._db.execute("DELETE FROM files WHERE path = ?", (rel_path,))
+        return row[0] if row else None
+
+    def _reindex_duplicates(self, catalog_root: Path, algorithm_id: str):
+        """
+        Make sure the algorithm rows of given id come from the right record file,
+        as multiple record files might share the same id (last path wins, like a full update).
+        """
+        paths = [row[0] for row in self._db.execute("SELECT path FROM files WHERE algorithm_id = ?", (algorithm_id,))]
+        if not paths:
+            return
+        if len(paths) > 1:
+            _log.warning(f"Duplicate algorithm id {algorithm_id!r} in {sorted(paths)}: using {max(paths)}")
+        row = self._db.execute("SELECT path FROM algorithms WHERE id = ?", (algorithm_id,)).fetchone()
+        if row is None or row[0] != max(paths):
+            content = (catalog_root / max(paths)).read_bytes()
+            self._add_file(max(paths), content=content, sha256=hashlib.sha256(content).hexdigest())
+
+    def _add_file(self, rel_path: str, content: bytes, sha256: str) -> Optional[str]:
+        """Index given record file and return its algorithm id (if any)."""
+        algorithm_id = None
+        try:
+            data = json_backend.loads(content)
+        except ValueError as e:
+            _log.warning(f"Skipping invalid record {rel_path}: {e!r}")
+            data = None
+        if isinstance(data, dict) and "id" in data:
+            algorithm_id = data["id"]
+            properties = data.get("properties") or {}
+            pis = [c for c in properties.get("contacts", []) if "principal investigator" in c.get("roles", [])]
+            visibility = properties.get("visibility")
+            # A record with the same id might have been indexed from another path
+            self._db.execute("DELETE FROM terms WHERE algorithm_id = ?", (algorithm_id,))
+            self._db.execute(
+                "INSERT OR REPLACE INTO algorithms (id, path, provider, organization, title, license, private) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    algorithm_id,
+                    rel_path,
+                    rel_path.split("/")[0],
+                    pis[0].get("organization") if pis else None,
+                    properties.get("title"),
+                    properties.get("license") or data.get("license"),
+                    int(isinstance(visibility, str) and visibility.strip().lower() == "private"),
+                ),
+            )
+            self._db.executemany(
+                "INSERT INTO terms (kind, term, algorithm_id) VALUES (?, ?, ?)",
+                [(kind, term, algorithm_id) for kind, term in _extract_terms(data)],
+            )
+        self._db.execute(
+            "INSERT OR REPLACE INTO files (path, sha256, algorithm_id) VALUES (?, ?, ?)",
+            (rel_path, sha256, algorithm_id),
+        )
+        return algorithm_id
+
+    def update(self, catalog_root: Union[str, Path]) -> int:
+        """
+        (Incrementally) update the index from the algorithm records under given catalog root:
+        only records with a changed content hash are (re)indexed.
+
+        :return: number of added, changed or removed record files.
+        """
+        catalog_root = Path(catalog_root)
+        known = dict(self._db.execute("SELECT path, sha256 FROM files"))
+        seen = set()
+        changes = 0
+        # Ids of changed records, which might also be used by other (unchanged) records
+        changed_ids = set()
+        with self._db:
+            for path in sorted(catalog_root.glob("*/*/records/*.json")):
+                rel_path = path.relative_to(catalog_root).as_posix()
+                seen.add(rel_path)
+                content = path.read_bytes()
+                sha256 = hashlib.sha256(content).hexdigest()
+                if known.get(rel_path) == sha256:
+                    continue
+                changed_ids.add(self._remove_file(rel_path))
+                changed_ids.add(self._add_file(rel_path, content=content, sha256=sha256))
+                changes += 1
+            for rel_path in set(known).difference(seen):
+                changed_ids.add(self._remove_file(rel_path))
+                changes += 1
+            for algorithm_id in sorted(changed_ids.difference([None])):
+                self._reindex_duplicates(catalog_root, algorithm_id)
+        _log.info(f"Updated catalog index {self.path} from {catalog_root}: {changes} changes")
+        return changes
+
+    def search(
+        self,
+        *,
+        keywords: Optional[Iterable[str]] = None,
+        themes: Optional[Iterable[str]] = None,
+        org: Optional[str] = None,
+        platform: Optional[str] = None,
+        interface: Optional[str] = None,
+        license: Optional[str] = None,
+        include_private: bool = False,
+    ) -> List[str]:
+        """
+        Search algorithms (matching all given criteria) and return their ids.
+
+        :param keywords: keywords that should all match, either as full keyword or as word within a keyword
+            (case-insensitive).
+        :param themes: theme concept ids that should all match (case-insensitive).
+        :param org: provider (catalog folder name) or principal investigator organization (case-insensitive).
+        :param platform: platform title (case-insensitive).
+        :param interface: interface name, e.g. "openEO UDP" or "OGC API - Processes" (case-insensitive).
+        :param license: license identifier, e.g. "CC-BY-4.0" (case-insensitive).
+        :param include_private: whether to include algorithms with private visibility.
+        """
+        where = []
+        params = []
+        term_filters = [((TERM_KIND.KEYWORD, TERM_KIND.TOKEN), k) for k in keywords or []]
+        term_filters += [((TERM_KIND.THEME,), t) for t in themes or []]
+        if platform:
+            term_filters.append(((TERM_KIND.PLATFORM,), platform))
+        if interface:
+            term_filters.append(((TERM_KIND.INTERFACE,), interface))
+        for kinds, term in term_filters:
+            where.append(
+                f"id IN (SELECT algorithm_id FROM terms WHERE kind IN ({', '.join('?' * len(kinds))}) AND term = ?)"
+            )
+            params.extend([*kinds, _normalize(term)])
+        if org:
+            where.append("(lower(provider) = ? OR lower(organization) = ?)")
+            params.extend([org.lower(), org.lower()])
+        if license:
+            where.append("lower(license) = ?")
+            params.append(license.lower())
+        if not include_private:
+            where.append("private = 0")
+
+        query = "SELECT id FROM algorithms"
+        if where:
+            query += " WHERE " + " AND ".join(where)
+        query += " ORDER BY id"
+        return [row[0] for row in self._db.execute(query, params)]
+
+    def get_entry(self, algorithm_id: str) -> Optional[dict]:
+        """Get indexed summary of an algorithm."""
+        cursor = self._db.execute("SELECT * FROM algorithms WHERE id = ?", (algorithm_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        entry = dict(zip([c[0] for c in cursor.description], row))
+        entry["private"] = bool(entry["private"])
+        return entry
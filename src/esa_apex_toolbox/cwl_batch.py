@@ -0,0 +1,255 @@
+"""
+Batch conversion of CWL application package inputs to openEO UDP parameters.
+
+Conversions are memoized by a content hash of the CWL document
+(optionally persisted to disk, so that unchanged packages are skipped on later runs),
+and documents that need conversion are handled in a process pool.
+
+Usage from the command line (e.g. to convert all packages referenced from the algorithm catalog)::
+
+    python -m esa_apex_toolbox.cwl_batch algorithm_catalog --memo cwl_parameters.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import concurrent.futures
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import urllib.parse
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Union
+
+from esa_apex_toolbox import json_backend
+from esa_apex_toolbox.http_cache import HttpCache
+
+if TYPE_CHECKING:
+    from openeo.api.process import Parameter
+
+_log = logging.getLogger(__name__)
+
+
+def cwl_content_hash(content: str) -> str:
+    """Content hash of a CWL document, used as memoization key."""
+    return hashlib.sha256(content.encode("utf8")).hexdigest()
+
+
+def _convert_cwl_content(content: str) -> List[dict]:
+    """Convert the inputs of a CWL document to (JSON-serializable) UDP parameter dicts."""
+    from esa_apex_toolbox.cwl_package import CwlPackage
+    from esa_apex_toolbox.cwl_to_udp_utils import cwl_input_to_parameters
+
+    return [p.to_dict() for p in cwl_input_to_parameters(CwlPackage.from_string(content).get_inputs())]
+
+
+def _resolve_cwl_href(href: str, record_path: Path) -> Optional[str]:
+    """
+    Resolve CWL link href of an algorithm record to a fetchable source:
+    HTTP(S) URLs as-is, file:// URLs and relative hrefs as local paths.
+    Other schemes (e.g. "oci://" container images) are not supported (None).
+    """
+    parsed = urllib.parse.urlparse(href)
+    if parsed.scheme in {"http", "https"}:
+        return href
+    elif parsed.scheme == "file":
+        return urllib.parse.unquote(parsed.path)
+    elif not parsed.scheme and not parsed.netloc and parsed.path:
+        return str(record_path.parent / urllib.parse.unquote(parsed.path))
+    return None
+
+
+def find_application_packages(catalog_root: Union[str, Path]) -> List[str]:
+    """
+    Find CWL application packages of the algorithm catalog:
+    CWL links (HTTP(S) URLs, or local files) in the algorithm records and local ``.cwl`` files.
+    """
+    catalog_root = Path(catalog_root)
+    sources = set()
+    for path in catalog_root.glob("*/*/records/*.json"):
+        try:
+            data = json_backend.load_file(path)
+        except ValueError as e:
+            _log.warning(f"Skipping invalid record {path}: {e!r}")
+            continue
+        links = data.get("links") if isinstance(data, dict) else None
+        for link in links if isinstance(links, list) else []:
+            if not isinstance(link, dict) or not isinstance(link.get("href"), str):
+                continue
+            href = link["href"]
+            link_type = link.get("type")
+            if (isinstance(link_type, str) and link_type.startswith("application/cwl")) or href.endswith(".cwl"):
+                source = _resolve_cwl_href(href, record_path=path)
+                if source:
+                    sources.add(source)
+                else:
+                    _log.debug(f"Skipping unsupported CWL link {href!r} in {path}")
+    sources.update(str(p) for p in catalog_root.glob("**/*.cwl"))
+    return sorted(sources)
+
+
+@dataclasses.dataclass(frozen=True)
+class CwlConversionResult:
+    """Result of a batch conversion: parameters per source, and failures per source."""
+
+    parameters: Dict[str, List[Parameter]]
+    errors: Dict[str, Exception]
+    # Sources whose conversion was served from the memo
+    memoized: List[str]
+
+
+class BatchCwlConverter:
+    """
+    Convert the inputs of multiple CWL application packages to openEO UDP parameters.
+
+    :param memo_path: optional path of a JSON file to persist the conversion memo (by content hash) in.
+    :param max_workers: maximum number of worker processes for conversion
+        (0 to convert in the current process).
+    :param cache: optional HTTP cache to use when fetching CWL documents from URLs.
+    """
+
+    MEMO_VERSION = 1
+
+    def __init__(
+        self,
+        *,
+        memo_path: Union[str, Path, None] = None,
+        max_workers: Optional[int] = None,
+        cache: Optional[HttpCache] = None,
+    ):
+        self.memo_path = Path(memo_path) if memo_path else None
+        self.max_workers = max_workers
+        self._cache = cache
+        # Mapping of content hash to list of parameter dicts
+        self._memo: Dict[str, List[dict]] = {}
+        if self.memo_path:
+            self._load_memo()
+
+    def _load_memo(self):
+        try:
+            data = json_backend.load_file(self.memo_path)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != self.MEMO_VERSION:
+            _log.info(f"Ignoring memo {self.memo_path} with unsupported version {data.get('version')!r}")
+            return
+        self._memo = data["entries"]
+
+    def _write_memo(self):
+        entries = {}
+        for key, parameters in self._memo.items():
+            try:
+                json.dumps(parameters)
+            except TypeError:
+                # E.g. YAML timestamps as default values: keep in memory only.
+                continue
+            entries[key] = parameters
+        tmp_path = self.memo_path.with_name(f"{self.memo_path.name}.tmp-{os.getpid()}")
+        with tmp_path.open("w", encoding="utf8") as f:
+            json.dump({"version": self.MEMO_VERSION, "entries": entries}, f, separators=(",", ":"))
+        os.replace(tmp_path, self.memo_path)
+
+    def _fetch(self, source: str) -> str:
+        if source.startswith("http://") or source.startswith("https://"):
+            if self._cache:
+                return self._cache.get(source).decode("utf8")
+            from esa_apex_toolbox.cwl_to_udp_utils import load_string_from_any
+
+            return load_string_from_any(source)
+        elif source.startswith("file://"):
+            source = urllib.parse.unquote(urllib.parse.urlparse(source).path)
+        elif "://" in source:
+            raise ValueError(f"Unsupported CWL source URL: {source!r}")
+        return Path(source).read_text(encoding="utf8")
+
+    def convert(self, sources: Iterable[Union[str, Path]], *, fetch_workers: int = 8) -> CwlConversionResult:
+        """
+        Convert the inputs of given CWL documents (URLs or file paths) to UDP parameters.
+
+        :param fetch_workers: maximum number of concurrent document fetches.
+        """
+        from openeo.api.process import Parameter
+
+        sources = [str(s) for s in sources]
+        errors: Dict[str, Exception] = {}
+        hashes: Dict[str, str] = {}
+        contents: Dict[str, str] = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=fetch_workers) as executor:
+            futures = {executor.submit(self._fetch, s): s for s in sources}
+            for future in concurrent.futures.as_completed(futures):
+                source = futures[future]
+                try:
+                    content = future.result()
+                except Exception as e:
+                    _log.warning(f"Failed to fetch CWL document {source!r}: {e!r}")
+                    errors[source] = e
+                    continue
+                hashes[source] = cwl_content_hash(content)
+                contents[hashes[source]] = content
+
+        memoized = [s for s in sources if s in hashes and hashes[s] in self._memo]
+        todo = {h: c for h, c in contents.items() if h not in self._memo}
+        failed: Dict[str, Exception] = {}
+        if todo:
+            _log.info(f"Converting {len(todo)} CWL documents ({len(memoized)} memoized)")
+            if self.max_workers == 0 or len(todo) == 1:
+                for key, content in todo.items():
+                    try:
+                        self._memo[key] = _convert_cwl_content(content)
+                    except Exception as e:
+                        failed[key] = e
+            else:
+                with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                    futures = {executor.submit(_convert_cwl_content, c): h for h, c in todo.items()}
+                    for future in concurrent.futures.as_completed(futures):
+                        try:
+                            self._memo[futures[future]] = future.result()
+                        except Exception as e:
+                            failed[futures[future]] = e
+            if self.memo_path:
+                self._write_memo()
+
+        parameters = {}
+        for source in sources:
+            key = hashes.get(source)
+            if key in failed:
+                _log.warning(f"Failed to convert CWL document {source!r}: {failed[key]!r}")
+                errors[source] = failed[key]
+            elif key is not None:
+                parameters[source] = [Parameter(**d) for d in self._memo[key]]
+        return CwlConversionResult(
+            parameters=parameters,
+            errors={s: errors[s] for s in sources if s in errors},
+            memoized=memoized,
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the inputs of CWL application packages to UDP parameters.")
+    parser.add_argument("catalog_root", type=Path, help="Path to the algorithm catalog root directory.")
+    parser.add_argument("--memo", type=Path, default=None, help="Path of the conversion memo file.")
+    parser.add_argument("--http-cache", type=Path, default=None, help="Directory of the HTTP cache.")
+    parser.add_argument("--max-workers", type=int, default=None, help="Number of worker processes.")
+    parser.add_argument("--output", type=Path, default=None, help="Path to write the parameters (JSON) to.")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO)
+
+    converter = BatchCwlConverter(
+        memo_path=args.memo,
+        max_workers=args.max_workers,
+        cache=HttpCache(args.http_cache) if args.http_cache else None,
+    )
+    result = converter.convert(find_application_packages(args.catalog_root))
+    print(
+        f"Converted {len(result.parameters)} CWL documents"
+        f" ({len(result.memoized)} memoized, {len(result.errors)} failed)"
+    )
+    if args.output:
+        with args.output.open("w", encoding="utf8") as f:
+            json.dump({s: [p.to_dict() for p in ps] for s, ps in result.parameters.items()}, f, indent=2, default=str)
+
+
+if __name__ == "__main__":
+    main()
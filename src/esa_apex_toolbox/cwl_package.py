@@ -0,0 +1,125 @@
+"""
+Parsed CWL (application) package, with all ``$graph`` entries indexed by id.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Union
+
+
+def load_cwl_yaml(content: str) -> Any:
+    """
+    Parse a CWL document (YAML or JSON),
+    using the libyaml based ``CSafeLoader`` when available (much faster for large packages).
+    """
+    import yaml
+
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(content, Loader=loader)
+
+
+def _normalize_id(id: str) -> str:
+    return id[1:] if id.startswith("#") else id
+
+
+class CwlPackage:
+    """
+    CWL package (a single process or a ``$graph`` of processes),
+    with its processes indexed by id for constant time lookup
+    of processes, their inputs and the processes run by workflow steps.
+
+    Usage::
+
+        package = CwlPackage.from_any("app-package.cwl")
+        package.get_inputs()  # inputs of "main"
+        for step_id, step in package.get_steps("main").items():
+            process = package.resolve_run(step)
+    """
+
+    MAIN = "main"
+
+    def __init__(self, document: dict):
+        if not isinstance(document, dict):
+            raise ValueError(f"Expected CWL document object but got {type(document)}")
+        self.document = document
+        graph = document.get("$graph")
+        if graph is None:
+            # A standalone process is always the main process, whatever its id.
+            self._main_id = _normalize_id(document.get("id", self.MAIN))
+            self._processes = {self._main_id: document}
+        else:
+            self._main_id = self.MAIN
+            self._processes = {}
+            for entry in graph:
+                if isinstance(entry, dict) and "id" in entry:
+                    self._processes[_normalize_id(entry["id"])] = entry
+        # Normalized steps per workflow id, built on first access.
+        self._steps: Dict[str, Dict[str, dict]] = {}
+
+    @classmethod
+    def from_string(cls, content: str) -> CwlPackage:
+        return cls(load_cwl_yaml(content))
+
+    @classmethod
+    def from_any(cls, src: Union[str, Path]) -> CwlPackage:
+        """Load from a CWL document, specified as string, file path or URL."""
+        from esa_apex_toolbox.cwl_to_udp_utils import load_string_from_any
+
+        return cls.from_string(load_string_from_any(src))
+
+    @property
+    def ids(self) -> List[str]:
+        """Ids of all processes in the package."""
+        return list(self._processes.keys())
+
+    def _key(self, id: str) -> str:
+        key = _normalize_id(id)
+        return self._main_id if key == self.MAIN else key
+
+    def __contains__(self, id: str) -> bool:
+        return self._key(id) in self._processes
+
+    def get_process(self, id: str = MAIN) -> dict:
+        """Get a process (e.g. "main", "#other", ...) by id."""
+        key = self._key(id)
+        try:
+            return self._processes[key]
+        except KeyError:
+            raise KeyError(f"Process {id!r} not found in CWL package (available: {self.ids})") from None
+
+    @property
+    def main(self) -> dict:
+        return self.get_process(self.MAIN)
+
+    def get_inputs(self, id: str = MAIN) -> Any:
+        """Get the (raw) inputs of a process."""
+        return self.get_process(id).get("inputs", [])
+
+    def get_steps(self, id: str = MAIN) -> Dict[str, dict]:
+        """Get the steps of a workflow, as mapping of step id to step object."""
+        workflow_id = self._key(id)
+        if workflow_id not in self._steps:
+            steps = self.get_process(id).get("steps", {})
+            if isinstance(steps, list):
+                steps = {_normalize_id(s["id"]).split("/")[-1]: s for s in steps}
+            self._steps[workflow_id] = steps
+        return self._steps[workflow_id]
+
+    def resolve_run(self, step: dict) -> dict:
+        """
+        Resolve the process run by a workflow step:
+        an embedded process object or a reference (e.g. ``run: '#other'``) to a process in the package.
+        """
+        run = step.get("run")
+        if isinstance(run, dict):
+            return run
+        elif isinstance(run, str) and run.startswith("#"):
+            return self.get_process(run)
+        raise ValueError(f"Unsupported 'run' reference {run!r} (only in-package '#id' references are supported)")
+
+    def iter_processes(self, cls: Optional[str] = None) -> Iterator[tuple]:
+        """Iterate over (id, process) pairs, optionally filtered on CWL class (e.g. "Workflow")."""
+        for id, process in self._processes.items():
+            if cls is None or process.get("class") == cls:
+                yield id, process
@@ -1,11 +1,31 @@
+from __future__ import annotations
+
+import importlib
 from pathlib import Path
-from typing import Any, Union, List
+from typing import TYPE_CHECKING, Any, Union, List
+
+if TYPE_CHECKING:
+    from openeo.api.process import Parameter
+
+# Heavy dependencies (requests, yaml, openeo) are imported lazily,
+# to keep the import of this module cheap.
+_LAZY_IMPORTS = {
+    "requests": ("requests", None),
+    "yaml": ("yaml", None),
+    "openeo": ("openeo", None),
+    "Parameter": ("openeo.api.process", "Parameter"),
+}
 
-import requests
-import yaml
 
-import openeo
-from openeo.api.process import Parameter
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module_name, attribute = _LAZY_IMPORTS[name]
+        value = importlib.import_module(module_name)
+        if attribute:
+            value = getattr(value, attribute)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def load_string_from_any(content: Union[str, Path]) -> str:
@@ -15,6 +35,8 @@ def load_string_from_any(content: Union[str, Path]) -> str:
 
     # noinspection HttpUrlsUsage
     if content.lower().startswith("http://") or content.lower().startswith("https://"):
+        import requests
+
         resp = requests.get(content)
         resp.raise_for_status()
         return resp.text
@@ -33,6 +55,8 @@ def load_string_from_any(content: Union[str, Path]) -> str:
 
 def get_cwl_main(cwl_yaml):
     if isinstance(cwl_yaml, str):
+        import yaml
+
         cwl_yaml = yaml.safe_load(cwl_yaml)
     cwl_graph = cwl_yaml.get("$graph", None)
     if cwl_graph is None:
@@ -50,6 +74,8 @@ def cwl_input_to_parameter(name: str, cwl_input_yaml: Any) -> Parameter:
     Convert to Parameter object that openEO can use.
     Not all properties are converted. For example enum values are not.
     """
+    from openeo.api.process import Parameter
+
     if isinstance(cwl_input_yaml, list) and len(cwl_input_yaml) > 0:
         # Not sure why this construction is possible, but needs to be supported
         cwl_input_yaml = cwl_input_yaml[0]
@@ -0,0 +1,170 @@
+"""
+Persistent on-disk HTTP cache with conditional request revalidation.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Union
+
+from esa_apex_toolbox import json_backend
+
+if TYPE_CHECKING:
+    import requests
+
+_log = logging.getLogger(__name__)
+
+
+class CacheMissError(LookupError):
+    """Resource is not available in the cache (while in offline mode)."""
+
+    pass
+
+
+class HttpCache:
+    """
+    On-disk cache for HTTP GET responses, shared across processes.
+
+    - Entries younger than ``ttl`` seconds are served without any network request.
+    - Older entries are revalidated with a conditional request
+      (``If-None-Match``/``If-Modified-Since`` based on the stored ETag/Last-Modified),
+      so that a ``304 Not Modified`` response replaces a full download.
+    - The total size of the cached bodies is bounded by ``max_size`` bytes,
+      evicting least recently used entries first.
+    - In ``offline`` mode, no network requests are done at all
+      and (possibly stale) cache entries are served as is.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        *,
+        ttl: float = 3600,
+        max_size: int = 100 * 1024 * 1024,
+        offline: bool = False,
+    ):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_size = max_size
+        self.offline = offline
+        self.root.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key(url: str, headers: Optional[dict] = None) -> str:
+        # Content negotiation matters (e.g. GitHub API media types), so take the Accept header into account.
+        accept = (headers or {}).get("Accept", "")
+        return hashlib.sha256(f"{url}\n{accept}".encode("utf8")).hexdigest()
+
+    def _paths(self, key: str):
+        return self.root / f"{key}.body", self.root / f"{key}.meta.json"
+
+    def _read_entry(self, key: str) -> Optional[tuple]:
+        body_path, meta_path = self._paths(key)
+        try:
+            with meta_path.open("r", encoding="utf8") as f:
+                meta = json.load(f)
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        return meta, body
+
+    def _write_file(self, path: Path, data: bytes):
+        # Write atomically, to play nice with concurrent processes sharing the cache.
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _write_entry(self, key: str, meta: dict, body: Optional[bytes] = None):
+        body_path, meta_path = self._paths(key)
+        if body is not None:
+            self._write_file(body_path, body)
+        self._write_file(meta_path, json.dumps(meta).encode("utf8"))
+
+    def _touch(self, key: str):
+        """Mark entry as recently used (for LRU eviction)."""
+        body_path, _ = self._paths(key)
+        try:
+            os.utime(body_path)
+        except OSError:
+            pass
+
+    def evict(self):
+        """Evict least recently used entries until the total cache size fits within `max_size`."""
+        entries = []
+        for body_path in self.root.glob("*.body"):
+            try:
+                stat = body_path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, body_path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, body_path in sorted(entries):
+            if total <= self.max_size:
+                break
+            _log.debug(f"Evicting {body_path} from HTTP cache")
+            body_path.unlink(missing_ok=True)
+            body_path.with_suffix(".meta.json").unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.root.glob("*.*"):
+            path.unlink(missing_ok=True)
+
+    def get(self, url: str, *, session: Optional[requests.Session] = None, headers: Optional[dict] = None) -> bytes:
+        """Get (cached) response body of a GET request to given URL."""
+        key = self._key(url, headers=headers)
+        entry = self._read_entry(key)
+
+        if entry is not None:
+            meta, body = entry
+            if self.offline or time.time() - meta["fetched"] < self.ttl:
+                self._touch(key)
+                return body
+        elif self.offline:
+            raise CacheMissError(f"No cache entry for {url!r} (offline mode)")
+
+        request_headers = dict(headers or {})
+        if entry is not None:
+            if meta.get("etag"):
+                request_headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                request_headers["If-Modified-Since"] = meta["last_modified"]
+
+        if session is None:
+            import requests
+
+            session = requests
+        resp = session.get(url, headers=request_headers)
+        if resp.status_code == 304 and entry is not None:
+            _log.debug(f"HTTP cache revalidated {url!r}")
+            meta["fetched"] = time.time()
+            self._write_entry(key, meta=meta)
+            self._touch(key)
+            return body
+
+        resp.raise_for_status()
+        body = resp.content
+        meta = {
+            "url": url,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+            "fetched": time.time(),
+        }
+        self._write_entry(key, meta=meta, body=body)
+        self.evict()
+        return body
+
+    def get_json(self, url: str, *, session: Optional[requests.Session] = None, headers: Optional[dict] = None):
+        """Get (cached) JSON response of a GET request to given URL."""
+        return json_backend.loads(self.get(url, session=session, headers=headers))
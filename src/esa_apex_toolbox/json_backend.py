@@ -0,0 +1,89 @@
+"""
+Pluggable JSON decoding backend:
+uses a fast JSON library (orjson or msgspec) when installed, with fallback to the standard library.
+
+Documents that the fast backend rejects (e.g. non-standard ``NaN`` literals)
+are retried with the standard library, so decoding results and errors
+are the same as with plain ``json.loads``.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Callable, Optional, Tuple, Type, Union
+
+_log = logging.getLogger(__name__)
+
+#: Supported backends, in order of preference for auto-detection.
+BACKENDS = ("orjson", "msgspec", "json")
+
+
+def _get_decoder(name: str) -> Tuple[Callable[[Union[str, bytes]], Any], Type[Exception]]:
+    if name == "orjson":
+        import orjson
+
+        return orjson.loads, orjson.JSONDecodeError
+    elif name == "msgspec":
+        import msgspec
+
+        return msgspec.json.decode, msgspec.DecodeError
+    elif name == "json":
+        return json.loads, json.JSONDecodeError
+    else:
+        raise ValueError(f"Unsupported JSON backend {name!r}, expected one of {BACKENDS}")
+
+
+_backend: Optional[str] = None
+_decode: Callable[[Union[str, bytes]], Any] = json.loads
+_decode_error: Type[Exception] = json.JSONDecodeError
+
+
+def set_backend(name: Optional[str] = None) -> str:
+    """
+    Set the JSON decoding backend.
+
+    :param name: backend name ("orjson", "msgspec" or "json"),
+        or ``None`` to use the first available one.
+    :return: name of the selected backend.
+    """
+    global _backend, _decode, _decode_error
+    if name is None:
+        for candidate in BACKENDS:
+            try:
+                decoder = _get_decoder(candidate)
+            except ImportError:
+                continue
+            name = candidate
+            break
+    else:
+        decoder = _get_decoder(name)
+    _decode, _decode_error = decoder
+    _backend = name
+    _log.debug(f"Using JSON backend {name!r}")
+    return name
+
+
+def get_backend() -> str:
+    """Get the name of the active JSON decoding backend."""
+    if _backend is None:
+        set_backend()
+    return _backend
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document (str or bytes)."""
+    if _backend is None:
+        set_backend()
+    try:
+        return _decode(data)
+    except _decode_error:
+        if _decode is json.loads:
+            raise
+        return json.loads(data)
+
+
+def load_file(path: Union[str, Path]) -> Any:
+    """Decode a JSON file."""
+    return loads(Path(path).read_bytes())
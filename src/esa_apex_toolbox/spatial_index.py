@@ -0,0 +1,118 @@
+"""
+Static spatial index over bounding boxes (e.g. of algorithm records),
+implemented as a Sort-Tile-Recursive (STR) packed R-tree.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Generic, Hashable, Iterable, List, Tuple, TypeVar
+
+from esa_apex_toolbox.algorithms import Algorithm, BBox
+
+K = TypeVar("K", bound=Hashable)
+
+
+def _intersects(a: BBox, b: BBox) -> bool:
+    return a[0] <= b[2] and b[0] <= a[2] and a[1] <= b[3] and b[1] <= a[3]
+
+
+def _union(bboxes: List[BBox]) -> BBox:
+    return (
+        min(b[0] for b in bboxes),
+        min(b[1] for b in bboxes),
+        max(b[2] for b in bboxes),
+        max(b[3] for b in bboxes),
+    )
+
+
+def _split_antimeridian(bbox: BBox) -> List[BBox]:
+    """Split a bounding box crossing the antimeridian (west > east) in two."""
+    west, south, east, north = bbox
+    if west > east:
+        return [(west, south, 180.0, north), (-180.0, south, east, north)]
+    return [bbox]
+
+
+class BBoxIndex(Generic[K]):
+    """
+    Immutable spatial index of keys with a bounding box (west, south, east, north),
+    supporting bounding box and point intersection queries.
+
+    The index is bulk loaded as a Sort-Tile-Recursive (STR) packed R-tree:
+    entries are sorted in vertical slices on their center x and then within each slice on center y,
+    and packed in nodes of ``node_capacity`` entries, level by level up to a single root node.
+
+    Bounding boxes crossing the antimeridian (west > east) are supported.
+    """
+
+    def __init__(self, items: Iterable[Tuple[K, BBox]], *, node_capacity: int = 16):
+        if node_capacity < 2:
+            raise ValueError(f"Invalid node capacity {node_capacity}")
+        self._node_capacity = node_capacity
+        self._keys: List[K] = []
+        entries: List[Tuple[BBox, int]] = []
+        for key, bbox in items:
+            self._keys.append(key)
+            for part in _split_antimeridian(tuple(bbox)):
+                entries.append((part, len(self._keys) - 1))
+        # Tree levels, from leaves to root:
+        # each level is a list of nodes, each node is a (bbox, children) tuple,
+        # with children being a list of (bbox, child index) tuples
+        # (pointing to a node in the level below, or to a key for leaf nodes).
+        self._levels: List[List[Tuple[BBox, List[Tuple[BBox, int]]]]] = []
+        while entries:
+            nodes = self._pack(entries)
+            self._levels.append(nodes)
+            if len(nodes) == 1:
+                break
+            entries = [(bbox, i) for i, (bbox, _) in enumerate(nodes)]
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _pack(self, entries: List[Tuple[BBox, int]]) -> List[Tuple[BBox, List[Tuple[BBox, int]]]]:
+        capacity = self._node_capacity
+        node_count = math.ceil(len(entries) / capacity)
+        slice_count = math.ceil(math.sqrt(node_count))
+        slice_size = slice_count * capacity
+
+        entries = sorted(entries, key=lambda e: e[0][0] + e[0][2])
+        nodes = []
+        for s in range(0, len(entries), slice_size):
+            vertical_slice = sorted(entries[s : s + slice_size], key=lambda e: e[0][1] + e[0][3])
+            for n in range(0, len(vertical_slice), capacity):
+                children = vertical_slice[n : n + capacity]
+                nodes.append((_union([bbox for bbox, _ in children]), children))
+        return nodes
+
+    def query_bbox(self, bbox: BBox) -> List[K]:
+        """Get keys of all entries intersecting given bounding box (west, south, east, north)."""
+        if not self._levels:
+            return []
+        found = set()
+        for query in _split_antimeridian(tuple(bbox)):
+            leaf_level = 0
+            # Stack of (level, node index)
+            stack = [(len(self._levels) - 1, 0)]
+            while stack:
+                level, index = stack.pop()
+                node_bbox, children = self._levels[level][index]
+                if not _intersects(node_bbox, query):
+                    continue
+                for child_bbox, child in children:
+                    if _intersects(child_bbox, query):
+                        if level == leaf_level:
+                            found.add(child)
+                        else:
+                            stack.append((level - 1, child))
+        return [self._keys[i] for i in sorted(found)]
+
+    def query_point(self, x: float, y: float) -> List[K]:
+        """Get keys of all entries containing given point (e.g. longitude, latitude)."""
+        return self.query_bbox((x, y, x, y))
+
+    @classmethod
+    def from_algorithms(cls, algorithms: Iterable[Algorithm], *, node_capacity: int = 16) -> BBoxIndex[str]:
+        """Build spatial index of algorithm ids, skipping algorithms without bounding box."""
+        return cls(((a.id, a.bbox) for a in algorithms if a.bbox is not None), node_capacity=node_capacity)
@@ -1,15 +1,21 @@
+import json
 import re
+import time
 from pathlib import Path
 
 import pytest
+import requests
 
 from esa_apex_toolbox.algorithms import (
     Algorithm,
+    AlgorithmRecordView,
     GithubAlgorithmRepository,
     InvalidMetadataError,
+    LocalAlgorithmRepository,
     ServiceLink,
     UdpLink,
 )
+from esa_apex_toolbox.http_cache import HttpCache
 
 DATA_ROOT = Path(__file__).parent / "data"
 
@@ -155,6 +161,49 @@ class TestAlgorithm:
         )
         assert algorithm.service_links == [ServiceLink(href="https://openeo.test/", title="openEO service")]
 
+    @pytest.mark.parametrize(
+        ["extra", "expected_bbox"],
+        [
+            ({}, None),
+            ({"geometry": None}, None),
+            (
+                {"geometry": {"type": "Polygon", "coordinates": [[[2, 49], [6, 49], [6, 51], [2, 51], [2, 49]]]}},
+                (2, 49, 6, 51),
+            ),
+            ({"geometry": {"type": "Point", "coordinates": [4.4, 51.2]}}, (4.4, 51.2, 4.4, 51.2)),
+            (
+                {
+                    "geometry": {
+                        "type": "GeometryCollection",
+                        "geometries": [
+                            {"type": "Point", "coordinates": [4, 51]},
+                            {"type": "MultiPoint", "coordinates": [[-3, 40], [10, 45]]},
+                        ],
+                    }
+                },
+                (-3, 40, 10, 51),
+            ),
+            ({"bbox": [1, 2, 3, 4], "geometry": {"type": "Point", "coordinates": [4, 51]}}, (1, 2, 3, 4)),
+            ({"bbox": [1, 2, 0, 3, 4, 100]}, (1, 2, 3, 4)),
+        ],
+    )
+    def test_from_ogc_api_record_geometry(self, extra, expected_bbox):
+        data = {
+            "id": "minimal",
+            "type": "Feature",
+            "conformsTo": ["https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core"],
+            "properties": {
+                "type": "service",
+            },
+            "links": [
+                {"rel": "service", "href": "https://openeo.test/"},
+            ],
+            **extra,
+        }
+        algorithm = Algorithm.from_ogc_api_record(data)
+        assert algorithm.geometry == extra.get("geometry")
+        assert algorithm.bbox == expected_bbox
+
     @pytest.mark.parametrize("path_type", [str, Path])
     def test_from_ogc_api_record_path(self, path_type):
         path = path_type(DATA_ROOT / "ogcapi-records/algorithm01.json")
@@ -195,6 +244,54 @@ class TestAlgorithm:
         assert algorithm.service_links == [ServiceLink(href="https://openeo.test/", title="openEO service")]
 
 
+class TestAlgorithmRecordView:
+    @pytest.mark.parametrize("path_type", [str, Path])
+    def test_from_ogc_api_record_path(self, path_type):
+        path = path_type(DATA_ROOT / "ogcapi-records/algorithm01.json")
+        view = AlgorithmRecordView.from_ogc_api_record(path)
+        assert view.id == "algorithm01"
+        assert view.title == "Algorithm One"
+        assert view.description == "A first algorithm."
+        assert view.udp_link == UdpLink(
+            href="https://esa-apex.test/udp/algorithm01.json",
+            title="UDP One",
+        )
+        assert view.service_links == [ServiceLink(href="https://openeo.test/", title="openEO service")]
+        assert view.to_algorithm() == Algorithm.from_ogc_api_record(path)
+
+    def test_slots(self):
+        view = AlgorithmRecordView.from_ogc_api_record(DATA_ROOT / "ogcapi-records/algorithm01.json")
+        assert not hasattr(view, "__dict__")
+        with pytest.raises(AttributeError):
+            view.foo = "bar"
+
+    def test_wrong_type(self):
+        with pytest.raises(InvalidMetadataError, match="Expected a GeoJSON 'Feature' object"):
+            _ = AlgorithmRecordView({"id": "wrong", "type": "apex_algorithm"})
+
+    def test_lazy_link_validation(self):
+        data = {
+            "id": "nolinks",
+            "type": "Feature",
+            "conformsTo": ["https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core"],
+            "properties": {"type": "service", "title": "No links"},
+            "bbox": [1, 2, 3, 4],
+        }
+        view = AlgorithmRecordView(data)
+        assert view.title == "No links"
+        assert view.bbox == (1, 2, 3, 4)
+        assert view.udp_link is None
+        with pytest.raises(InvalidMetadataError, match="No service links found"):
+            _ = view.service_links
+        with pytest.raises(InvalidMetadataError, match="No service links found"):
+            _ = view.to_algorithm()
+
+    def test_decoded_fields_are_cached(self):
+        view = AlgorithmRecordView.from_ogc_api_record(DATA_ROOT / "ogcapi-records/algorithm01.json")
+        assert view.service_links is view.service_links
+        assert view.udp_link is view.udp_link
+
+
 class TestGithubAlgorithmRepository:
     @pytest.fixture
     def repo(self) -> GithubAlgorithmRepository:
@@ -230,3 +327,279 @@ class TestGithubAlgorithmRepository:
                 )
             ],
         )
+
+
+class TestGithubAlgorithmRepositoryContentsListing:
+    CONTENTS_URL = "https://api.github.com/repos/ESA-APEx/apex_algorithms/contents/algorithm_catalog"
+
+    @pytest.fixture
+    def listings(self, requests_mock) -> list:
+        def dir_listing(*names):
+            def callback(request, context):
+                # Slow listing, to expose concurrent listing
+                time.sleep(0.05)
+                return {"type": "dir", "entries": [{"name": name, "type": "dir"} for name in names]}
+
+            return callback
+
+        return [
+            requests_mock.get(self.CONTENTS_URL, json=dir_listing("foorg", "barorg")),
+            requests_mock.get(f"{self.CONTENTS_URL}/foorg", json=dir_listing("algorithm01", "algorithm03")),
+            requests_mock.get(f"{self.CONTENTS_URL}/barorg", json=dir_listing("algorithm02")),
+        ]
+
+    def test_get_algorithms_concurrent_listing(self, listings, requests_mock):
+        requests_mock.get(
+            "https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/main/algorithm_catalog/foorg/algorithm01/records/algorithm01.json",
+            text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text(),
+        )
+        repo = GithubAlgorithmRepository(owner="ESA-APEx", repo="apex_algorithms", folder="algorithm_catalog")
+        result = repo.get_algorithms(names=["algorithm01", "algorithm02", "algorithm03", "nope"], max_workers=4)
+        assert list(result.algorithms.keys()) == ["algorithm01"]
+        assert sorted(result.errors.keys()) == ["algorithm02", "algorithm03", "nope"]
+        # Each directory is listed only once
+        assert [listing.call_count for listing in listings] == [1, 1, 1]
+
+
+class TestGithubAlgorithmRepositoryTreeListing:
+    COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+    TREES_URL = f"https://api.github.com/repos/ESA-APEx/apex_algorithms/git/trees/{COMMIT_SHA}?recursive=1"
+
+    @pytest.fixture
+    def tree_listing(self, requests_mock):
+        requests_mock.get(
+            "https://api.github.com/repos/ESA-APEx/apex_algorithms/commits/main",
+            text=self.COMMIT_SHA,
+        )
+        return requests_mock.get(
+            self.TREES_URL,
+            json={
+                "sha": self.COMMIT_SHA,
+                "truncated": False,
+                "tree": [
+                    {"path": "README.md", "type": "blob"},
+                    {"path": "algorithm_catalog", "type": "tree"},
+                    {"path": "algorithm_catalog/foorg", "type": "tree"},
+                    {"path": "algorithm_catalog/foorg/record.json", "type": "blob"},
+                    {"path": "algorithm_catalog/foorg/algorithm01", "type": "tree"},
+                    {"path": "algorithm_catalog/foorg/algorithm01/records", "type": "tree"},
+                    {"path": "algorithm_catalog/foorg/algorithm01/records/algorithm01.json", "type": "blob"},
+                    {"path": "algorithm_catalog/foorg/algorithm01/openeo_udp", "type": "tree"},
+                    {"path": "algorithm_catalog/foorg/algorithm01/openeo_udp/algorithm01.json", "type": "blob"},
+                    {"path": "algorithm_catalog/barorg", "type": "tree"},
+                    {"path": "algorithm_catalog/barorg/algorithm02", "type": "tree"},
+                    {"path": "algorithm_catalog/barorg/algorithm02/records", "type": "tree"},
+                    {"path": "algorithm_catalog/barorg/algorithm02/records/algorithm02.json", "type": "blob"},
+                    {"path": "qa", "type": "tree"},
+                    {"path": "qa/tools", "type": "tree"},
+                ],
+            },
+        )
+
+    @pytest.fixture
+    def repo(self, tree_listing) -> GithubAlgorithmRepository:
+        return GithubAlgorithmRepository(
+            owner="ESA-APEx",
+            repo="apex_algorithms",
+            folder="algorithm_catalog",
+            tree_listing=True,
+        )
+
+    def test_list_algorithms(self, repo, tree_listing, requests_mock):
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert tree_listing.call_count == 1
+        assert requests_mock.call_count == 2
+
+    def test_get_algorithm(self, repo, requests_mock):
+        record_url = f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{self.COMMIT_SHA}/algorithm_catalog/foorg/algorithm01/records/algorithm01.json"
+        requests_mock.get(record_url, text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text())
+        algorithm = repo.get_algorithm("algorithm01")
+        assert algorithm.id == "algorithm01"
+        assert algorithm.title == "Algorithm One"
+        assert requests_mock.call_count == 3
+        assert requests_mock.last_request.url == record_url
+
+    def test_get_algorithms(self, repo, requests_mock):
+        requests_mock.get(
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{self.COMMIT_SHA}/algorithm_catalog/foorg/algorithm01/records/algorithm01.json",
+            text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text(),
+        )
+        requests_mock.get(
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{self.COMMIT_SHA}/algorithm_catalog/barorg/algorithm02/records/algorithm02.json",
+            status_code=404,
+        )
+        result = repo.get_algorithms(max_workers=4)
+        assert list(result.algorithms.keys()) == ["algorithm01"]
+        assert result.algorithms["algorithm01"].title == "Algorithm One"
+        assert list(result.errors.keys()) == ["algorithm02"]
+        assert isinstance(result.errors["algorithm02"], requests.HTTPError)
+
+    def test_get_algorithms_subset(self, repo, requests_mock):
+        requests_mock.get(
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{self.COMMIT_SHA}/algorithm_catalog/foorg/algorithm01/records/algorithm01.json",
+            text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text(),
+        )
+        result = repo.get_algorithms(names=["algorithm01", "nope"])
+        assert list(result.algorithms.keys()) == ["algorithm01"]
+        assert list(result.errors.keys()) == ["nope"]
+        assert isinstance(result.errors["nope"], ValueError)
+
+    def test_get_algorithm_unknown(self, repo):
+        with pytest.raises(ValueError, match="Algorithm 'nope' not found"):
+            _ = repo.get_algorithm("nope")
+
+    def test_truncated(self, tree_listing, requests_mock):
+        trees_url = "https://api.github.com/repos/ESA-APEx/apex_algorithms/git/trees"
+        requests_mock.get(self.TREES_URL, json={"sha": self.COMMIT_SHA, "truncated": True, "tree": []})
+        requests_mock.get(
+            f"{trees_url}/{self.COMMIT_SHA}",
+            complete_qs=True,
+            json={
+                "tree": [
+                    {"path": "README.md", "type": "blob", "sha": "r34dm3"},
+                    {"path": "algorithm_catalog", "type": "tree", "sha": "c4t"},
+                    {"path": "qa", "type": "tree", "sha": "q4"},
+                ]
+            },
+        )
+        requests_mock.get(
+            f"{trees_url}/c4t",
+            complete_qs=True,
+            json={
+                "tree": [
+                    {"path": "foorg", "type": "tree", "sha": "f00"},
+                    {"path": "barorg", "type": "tree", "sha": "b4r"},
+                ]
+            },
+        )
+        requests_mock.get(
+            f"{trees_url}/f00?recursive=1",
+            json={
+                "truncated": False,
+                "tree": [
+                    {"path": "algorithm01", "type": "tree"},
+                    {"path": "algorithm01/records", "type": "tree"},
+                    {"path": "algorithm01/records/algorithm01.json", "type": "blob"},
+                ],
+            },
+        )
+        requests_mock.get(f"{trees_url}/b4r?recursive=1", json={"truncated": False, "tree": []})
+        repo = GithubAlgorithmRepository(
+            owner="ESA-APEx", repo="apex_algorithms", folder="algorithm_catalog", tree_listing=True
+        )
+        assert repo.list_algorithms() == ["algorithm01"]
+        assert repo._get_record_url("algorithm01") == (
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{self.COMMIT_SHA}"
+            "/algorithm_catalog/foorg/algorithm01/records/algorithm01.json"
+        )
+
+        requests_mock.get(f"{trees_url}/b4r?recursive=1", json={"truncated": True, "tree": []})
+        with pytest.raises(RuntimeError, match="Truncated Git Trees listing of 'algorithm_catalog/barorg'"):
+            _ = GithubAlgorithmRepository(
+                owner="ESA-APEx", repo="apex_algorithms", folder="algorithm_catalog", tree_listing=True
+            )
+
+    def test_cache(self, tree_listing, requests_mock, tmp_path):
+        repo = GithubAlgorithmRepository(
+            owner="ESA-APEx",
+            repo="apex_algorithms",
+            folder="algorithm_catalog",
+            tree_listing=True,
+            cache=HttpCache(root=tmp_path / "cache"),
+        )
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert requests_mock.call_count == 2
+
+        repo = GithubAlgorithmRepository(
+            owner="ESA-APEx",
+            repo="apex_algorithms",
+            folder="algorithm_catalog",
+            tree_listing=True,
+            cache=HttpCache(root=tmp_path / "cache", offline=True),
+        )
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert requests_mock.call_count == 2
+
+
+class TestLocalAlgorithmRepository:
+    @pytest.fixture
+    def catalog(self, tmp_path) -> Path:
+        root = tmp_path / "algorithm_catalog"
+        record = json.loads((DATA_ROOT / "ogcapi-records/algorithm01.json").read_text())
+        for org, name in [("foorg", "algorithm01"), ("barorg", "algorithm02")]:
+            path = root / org / name / "records" / f"{name}.json"
+            path.parent.mkdir(parents=True)
+            path.write_text(json.dumps({**record, "id": name}))
+        return root
+
+    def test_list_algorithms(self, catalog):
+        repo = LocalAlgorithmRepository(catalog)
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert (catalog / ".algorithm_index.json").exists()
+
+    def test_read_only_index(self, catalog, tmp_path, caplog):
+        index_path = tmp_path / "missing" / "index.json"
+        repo = LocalAlgorithmRepository(catalog, index_path=index_path)
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert not index_path.exists()
+        assert "Failed to persist algorithm index" in caplog.text
+
+    def test_duplicate_id(self, catalog, caplog):
+        path = catalog / "bazorg" / "algorithm03" / "records" / "algorithm03.json"
+        path.parent.mkdir(parents=True)
+        path.write_text((catalog / "foorg" / "algorithm01" / "records" / "algorithm01.json").read_text())
+        repo = LocalAlgorithmRepository(catalog)
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+        assert repo.get_index_entry("algorithm01")["path"] == "foorg/algorithm01/records/algorithm01.json"
+        assert "Duplicate algorithm id 'algorithm01' in foorg/algorithm01/records/algorithm01.json" in caplog.text
+
+    def test_get_algorithm(self, catalog):
+        repo = LocalAlgorithmRepository(catalog)
+        algorithm = repo.get_algorithm("algorithm02")
+        assert algorithm.id == "algorithm02"
+        assert algorithm.title == "Algorithm One"
+        assert algorithm.udp_link == UdpLink(href="https://esa-apex.test/udp/algorithm01.json", title="UDP One")
+
+    def test_get_algorithm_unknown(self, catalog):
+        repo = LocalAlgorithmRepository(catalog)
+        with pytest.raises(ValueError, match="Algorithm 'nope' not found"):
+            _ = repo.get_algorithm("nope")
+
+    def test_get_index_entry(self, catalog):
+        repo = LocalAlgorithmRepository(catalog)
+        entry = repo.get_index_entry("algorithm01")
+        assert entry["path"] == "foorg/algorithm01/records/algorithm01.json"
+        assert entry["org"] == "foorg"
+        assert entry["udp"] == "https://esa-apex.test/udp/algorithm01.json"
+        assert entry["services"] == ["https://openeo.test/"]
+
+    def test_reload_from_index(self, catalog, monkeypatch):
+        LocalAlgorithmRepository(catalog)
+
+        def no_parsing(*args, **kwargs):
+            raise RuntimeError("Should not parse records")
+
+        monkeypatch.setattr(LocalAlgorithmRepository, "_index_entry", no_parsing)
+        repo = LocalAlgorithmRepository(catalog)
+        assert repo.list_algorithms() == ["algorithm01", "algorithm02"]
+
+    def test_refresh_changes(self, catalog):
+        repo = LocalAlgorithmRepository(catalog)
+        assert repo.get_algorithm("algorithm01").title == "Algorithm One"
+
+        path = catalog / "foorg/algorithm01/records/algorithm01.json"
+        data = json.loads(path.read_text())
+        data["properties"]["title"] = "Algorithm Uno!"
+        path.write_text(json.dumps(data))
+        (catalog / "barorg/algorithm02/records/algorithm02.json").unlink()
+        path = catalog / "bazorg/algorithm03/records/algorithm03.json"
+        path.parent.mkdir(parents=True)
+        path.write_text(json.dumps({**data, "id": "algorithm03"}))
+
+        assert repo.refresh() is True
+        assert repo.list_algorithms() == ["algorithm01", "algorithm03"]
+        assert repo.get_algorithm("algorithm01").title == "Algorithm Uno!"
+        assert repo.refresh() is False
+
+        repo = LocalAlgorithmRepository(catalog)
+        assert repo.list_algorithms() == ["algorithm01", "algorithm03"]
@@ -0,0 +1,157 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from esa_apex_toolbox.async_algorithms import AsyncGithubAlgorithmRepository
+
+DATA_ROOT = Path(__file__).parent / "data"
+
+COMMIT_SHA = "0123456789abcdef0123456789abcdef01234567"
+
+
+class TestAsyncGithubAlgorithmRepository:
+    @pytest.fixture
+    def requested_urls(self):
+        return []
+
+    @pytest.fixture
+    def client(self, requested_urls) -> httpx.AsyncClient:
+        responses = {
+            "https://api.github.com/repos/ESA-APEx/apex_algorithms/commits/main": httpx.Response(200, text=COMMIT_SHA),
+            f"https://api.github.com/repos/ESA-APEx/apex_algorithms/git/trees/{COMMIT_SHA}?recursive=1": httpx.Response(
+                200,
+                json={
+                    "sha": COMMIT_SHA,
+                    "truncated": False,
+                    "tree": [
+                        {"path": "algorithm_catalog", "type": "tree"},
+                        {"path": "algorithm_catalog/foorg", "type": "tree"},
+                        {"path": "algorithm_catalog/foorg/algorithm01", "type": "tree"},
+                        {"path": "algorithm_catalog/foorg/algorithm01/records", "type": "tree"},
+                        {"path": "algorithm_catalog/foorg/algorithm01/records/algorithm01.json", "type": "blob"},
+                        {"path": "algorithm_catalog/barorg", "type": "tree"},
+                        {"path": "algorithm_catalog/barorg/algorithm02", "type": "tree"},
+                        {"path": "algorithm_catalog/barorg/algorithm02/records", "type": "tree"},
+                        {"path": "algorithm_catalog/barorg/algorithm02/records/algorithm02.json", "type": "blob"},
+                    ],
+                },
+            ),
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{COMMIT_SHA}/algorithm_catalog/foorg/algorithm01/records/algorithm01.json": httpx.Response(
+                200, text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text()
+            ),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requested_urls.append(str(request.url))
+            return responses.get(str(request.url), httpx.Response(404))
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        yield client
+        asyncio.run(client.aclose())
+
+    @pytest.fixture
+    def repo(self, client) -> AsyncGithubAlgorithmRepository:
+        return AsyncGithubAlgorithmRepository(
+            owner="ESA-APEx",
+            repo="apex_algorithms",
+            folder="algorithm_catalog",
+            client=client,
+        )
+
+    def test_list_algorithms(self, repo, requested_urls):
+        async def main():
+            return await asyncio.gather(repo.list_algorithms(), repo.list_algorithms())
+
+        assert asyncio.run(main()) == [["algorithm01", "algorithm02"], ["algorithm01", "algorithm02"]]
+        assert len(requested_urls) == 2
+
+    def test_get_algorithm(self, repo):
+        algorithm = asyncio.run(repo.get_algorithm("algorithm01"))
+        assert algorithm.id == "algorithm01"
+        assert algorithm.title == "Algorithm One"
+
+    def test_get_algorithm_unknown(self, repo):
+        with pytest.raises(ValueError, match="Algorithm 'nope' not found"):
+            asyncio.run(repo.get_algorithm("nope"))
+
+    def test_get_algorithms(self, repo):
+        async def main():
+            async with repo:
+                return await repo.get_algorithms()
+
+        result = asyncio.run(main())
+        assert list(result.algorithms.keys()) == ["algorithm01"]
+        assert result.algorithms["algorithm01"].title == "Algorithm One"
+        assert list(result.errors.keys()) == ["algorithm02"]
+        assert isinstance(result.errors["algorithm02"], httpx.HTTPStatusError)
+
+    def test_truncated(self):
+        trees_url = "https://api.github.com/repos/ESA-APEx/apex_algorithms/git/trees"
+        responses = {
+            "https://api.github.com/repos/ESA-APEx/apex_algorithms/commits/main": httpx.Response(200, text=COMMIT_SHA),
+            f"{trees_url}/{COMMIT_SHA}?recursive=1": httpx.Response(
+                200, json={"sha": COMMIT_SHA, "truncated": True, "tree": []}
+            ),
+            f"{trees_url}/{COMMIT_SHA}": httpx.Response(
+                200, json={"tree": [{"path": "algorithm_catalog", "type": "tree", "sha": "c4t"}]}
+            ),
+            f"{trees_url}/c4t": httpx.Response(200, json={"tree": [{"path": "foorg", "type": "tree", "sha": "f00"}]}),
+            f"{trees_url}/f00?recursive=1": httpx.Response(
+                200,
+                json={
+                    "truncated": False,
+                    "tree": [
+                        {"path": "algorithm01", "type": "tree"},
+                        {"path": "algorithm01/records", "type": "tree"},
+                        {"path": "algorithm01/records/algorithm01.json", "type": "blob"},
+                    ],
+                },
+            ),
+            f"https://raw.githubusercontent.com/ESA-APEx/apex_algorithms/{COMMIT_SHA}/algorithm_catalog/foorg/algorithm01/records/algorithm01.json": httpx.Response(
+                200, text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text()
+            ),
+        }
+        client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: responses.get(str(request.url), httpx.Response(404)))
+        )
+
+        async def main():
+            async with client:
+                repo = AsyncGithubAlgorithmRepository(
+                    owner="ESA-APEx", repo="apex_algorithms", folder="algorithm_catalog", client=client
+                )
+                return await repo.list_algorithms(), await repo.get_algorithm("algorithm01")
+
+        listing, algorithm = asyncio.run(main())
+        assert listing == ["algorithm01"]
+        assert algorithm.id == "algorithm01"
+
+    def test_get_algorithms_cancelled(self, repo, monkeypatch):
+        get_algorithm = repo.get_algorithm
+
+        async def cancelling_get_algorithm(name):
+            if name == "algorithm02":
+                raise asyncio.CancelledError()
+            return await get_algorithm(name)
+
+        monkeypatch.setattr(repo, "get_algorithm", cancelling_get_algorithm)
+        with pytest.raises(asyncio.CancelledError):
+            asyncio.run(repo.get_algorithms())
+
+    def test_multiple_event_loops(self, repo):
+        # Repository (and its asyncio primitives) is created outside of any event loop
+        # and can be used from subsequent event loops.
+        assert asyncio.run(repo.list_algorithms()) == ["algorithm01", "algorithm02"]
+        algorithm = asyncio.run(repo.get_algorithm("algorithm01"))
+        assert algorithm.id == "algorithm01"
+
+    def test_owned_client(self):
+        async def main():
+            async with AsyncGithubAlgorithmRepository(owner="ESA-APEx", repo="apex_algorithms") as repo:
+                pass
+            return repo
+
+        repo = asyncio.run(main())
+        assert repo._client.is_closed
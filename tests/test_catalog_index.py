@@ -0,0 +1,131 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from esa_apex_toolbox.catalog_index import CatalogIndex
+
+
+def _record(
+    id: str, keywords=(), themes=(), platforms=(), interface="openeo-udp", license="CC-BY-4.0", pi="VITO", **kwargs
+):
+    return {
+        "id": id,
+        "type": "Feature",
+        "conformsTo": [
+            "https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core",
+            f"https://apex.esa.int/core/{interface}",
+        ],
+        "properties": {
+            "type": "service",
+            "title": id.title(),
+            "keywords": list(keywords),
+            "themes": [{"concepts": [{"id": t} for t in themes]}],
+            "contacts": [{"organization": pi, "roles": ["principal investigator"]}],
+            "license": license,
+            **kwargs,
+        },
+        "links": [{"rel": "platform", "title": p, "href": f"../../platform_catalog/{p}.json"} for p in platforms],
+    }
+
+
+class TestCatalogIndex:
+    @pytest.fixture
+    def catalog(self, tmp_path) -> Path:
+        root = tmp_path / "algorithm_catalog"
+        records = {
+            "vito/max_ndvi": _record(
+                "max_ndvi",
+                keywords=["Vegetation", "Normalized Difference Vegetation Index (NDVI)"],
+                themes=["Sentinel-2 MSI"],
+                platforms=["CDSE openEO federation"],
+            ),
+            "vito/biopar": _record("biopar", keywords=["Vegetation", "LAI"], platforms=["Terrascope"]),
+            "terradue/dinsar": _record(
+                "dinsar", keywords=["SAR"], interface="ogc-api-processes", license="proprietary", pi="Terradue"
+            ),
+            "terradue/secret": _record("secret", keywords=["SAR"], visibility="private"),
+        }
+        for rel_dir, data in records.items():
+            path = root / rel_dir / "records" / f"{data['id']}.json"
+            path.parent.mkdir(parents=True)
+            path.write_text(json.dumps(data))
+        return root
+
+    @pytest.fixture
+    def index(self, catalog) -> CatalogIndex:
+        index = CatalogIndex()
+        index.update(catalog)
+        return index
+
+    @pytest.mark.parametrize(
+        ["kwargs", "expected"],
+        [
+            ({}, ["biopar", "dinsar", "max_ndvi"]),
+            ({"include_private": True}, ["biopar", "dinsar", "max_ndvi", "secret"]),
+            ({"keywords": ["vegetation"]}, ["biopar", "max_ndvi"]),
+            ({"keywords": ["NDVI"]}, ["max_ndvi"]),
+            ({"keywords": ["normalized difference vegetation index (ndvi)"]}, ["max_ndvi"]),
+            ({"keywords": ["vegetation", "lai"]}, ["biopar"]),
+            ({"keywords": ["nope"]}, []),
+            ({"themes": ["sentinel-2 msi"]}, ["max_ndvi"]),
+            ({"org": "vito"}, ["biopar", "max_ndvi"]),
+            ({"org": "Terradue"}, ["dinsar"]),
+            ({"platform": "terrascope"}, ["biopar"]),
+            ({"interface": "OGC API - Processes"}, ["dinsar"]),
+            ({"interface": "openEO UDP", "keywords": ["vegetation"]}, ["biopar", "max_ndvi"]),
+            ({"license": "cc-by-4.0"}, ["biopar", "max_ndvi"]),
+        ],
+    )
+    def test_search(self, index, kwargs, expected):
+        assert index.search(**kwargs) == expected
+
+    def test_get_entry(self, index):
+        assert index.get_entry("max_ndvi") == {
+            "id": "max_ndvi",
+            "path": "vito/max_ndvi/records/max_ndvi.json",
+            "provider": "vito",
+            "organization": "VITO",
+            "title": "Max_Ndvi",
+            "license": "CC-BY-4.0",
+            "private": False,
+        }
+        assert index.get_entry("nope") is None
+
+    def test_update_incremental(self, catalog, tmp_path):
+        path = tmp_path / "index.sqlite"
+        with CatalogIndex(path) as index:
+            assert index.update(catalog) == 4
+            assert index.update(catalog) == 0
+
+        (catalog / "vito/biopar/records/biopar.json").write_text(json.dumps(_record("biopar", keywords=["FAPAR"])))
+        (catalog / "terradue/dinsar/records/dinsar.json").unlink()
+
+        with CatalogIndex(path) as index:
+            assert index.update(catalog) == 2
+            assert index.search() == ["biopar", "max_ndvi"]
+            assert index.search(keywords=["vegetation"]) == ["max_ndvi"]
+            assert index.search(keywords=["fapar"]) == ["biopar"]
+
+    def test_update_duplicate_id(self, catalog, index):
+        # Same id as "vito/biopar", in a path that sorts after it
+        duplicate = catalog / "zorg/biopar/records/biopar.json"
+        duplicate.parent.mkdir(parents=True)
+        duplicate.write_text(json.dumps(_record("biopar", keywords=["FAPAR"])))
+        assert index.update(catalog) == 1
+        assert index.get_entry("biopar")["path"] == "zorg/biopar/records/biopar.json"
+        assert index.search(keywords=["fapar"]) == ["biopar"]
+
+        # Changing the other record does not wipe the rows of the duplicate
+        (catalog / "vito/biopar/records/biopar.json").write_text(json.dumps(_record("biopar", keywords=["LAI"])))
+        assert index.update(catalog) == 1
+        assert index.get_entry("biopar")["path"] == "zorg/biopar/records/biopar.json"
+        assert index.search(keywords=["fapar"]) == ["biopar"]
+        assert index.search(keywords=["lai"]) == []
+
+        # Removing the duplicate restores the other record
+        duplicate.unlink()
+        assert index.update(catalog) == 1
+        assert index.get_entry("biopar")["path"] == "vito/biopar/records/biopar.json"
+        assert index.search(keywords=["lai"]) == ["biopar"]
+        assert index.search(keywords=["fapar"]) == []
@@ -0,0 +1,92 @@
+import json
+from pathlib import Path
+
+import pytest
+
+import esa_apex_toolbox.cwl_batch
+from esa_apex_toolbox.cwl_batch import BatchCwlConverter, find_application_packages
+from esa_apex_toolbox.cwl_to_udp_utils import cwl_input_to_parameters, get_cwl_inputs
+
+DATA_ROOT = Path(__file__).parent / "data"
+
+CWL_PATHS = [DATA_ROOT / "hello_world.cwl", DATA_ROOT / "array-inputs.cwl", DATA_ROOT / "optional-union-input.cwl"]
+
+
+def _expected_parameters(path: Path) -> list:
+    return [p.to_dict() for p in cwl_input_to_parameters(get_cwl_inputs(path.read_text()))]
+
+
+class TestBatchCwlConverter:
+    @pytest.mark.parametrize("max_workers", [0, 2])
+    def test_convert(self, max_workers):
+        converter = BatchCwlConverter(max_workers=max_workers)
+        result = converter.convert(CWL_PATHS + [DATA_ROOT / "nope.cwl", "oci://ghcr.io/foorg/algo:1.0"])
+        assert list(result.parameters.keys()) == [str(p) for p in CWL_PATHS]
+        for path in CWL_PATHS:
+            assert [p.to_dict() for p in result.parameters[str(path)]] == _expected_parameters(path)
+        assert sorted(result.errors.keys()) == sorted([str(DATA_ROOT / "nope.cwl"), "oci://ghcr.io/foorg/algo:1.0"])
+        assert isinstance(result.errors[str(DATA_ROOT / "nope.cwl")], FileNotFoundError)
+        assert isinstance(result.errors["oci://ghcr.io/foorg/algo:1.0"], ValueError)
+        assert result.memoized == []
+
+    def test_convert_file_url(self):
+        result = BatchCwlConverter(max_workers=0).convert([CWL_PATHS[0].as_uri()])
+        assert [p.to_dict() for p in result.parameters[CWL_PATHS[0].as_uri()]] == _expected_parameters(CWL_PATHS[0])
+
+    def test_memo(self, tmp_path, monkeypatch):
+        memo_path = tmp_path / "memo.json"
+        result = BatchCwlConverter(memo_path=memo_path, max_workers=0).convert(CWL_PATHS)
+        assert result.memoized == []
+        assert len(json.loads(memo_path.read_text())["entries"]) == 3
+
+        def no_conversion(content):
+            raise RuntimeError("should not be converted")
+
+        monkeypatch.setattr(esa_apex_toolbox.cwl_batch, "_convert_cwl_content", no_conversion)
+        result = BatchCwlConverter(memo_path=memo_path, max_workers=0).convert(CWL_PATHS)
+        assert result.memoized == [str(p) for p in CWL_PATHS]
+        for path in CWL_PATHS:
+            assert [p.to_dict() for p in result.parameters[str(path)]] == _expected_parameters(path)
+
+    def test_memo_changed_content(self, tmp_path):
+        memo_path = tmp_path / "memo.json"
+        path = tmp_path / "app.cwl"
+        path.write_text((DATA_ROOT / "hello_world.cwl").read_text())
+        BatchCwlConverter(memo_path=memo_path, max_workers=0).convert([path])
+
+        path.write_text((DATA_ROOT / "array-inputs.cwl").read_text())
+        result = BatchCwlConverter(memo_path=memo_path, max_workers=0).convert([path])
+        assert result.memoized == []
+        assert result.parameters[str(path)][0].schema == {"type": "array", "items": {"type": "string"}}
+        assert len(json.loads(memo_path.read_text())["entries"]) == 2
+
+
+def test_find_application_packages(tmp_path):
+    record_path = tmp_path / "foorg" / "algo" / "records" / "algo.json"
+    record_path.parent.mkdir(parents=True)
+    record_path.write_text(
+        json.dumps(
+            {
+                "id": "algo",
+                "links": [
+                    {"rel": "application", "type": "application/cwl+yaml", "href": "https://cwl.test/algo.cwl"},
+                    {"rel": "service", "href": "https://openeo.test/"},
+                    {"rel": "application", "type": "application/cwl", "href": "oci://ghcr.io/foorg/algo:1.0"},
+                    {"rel": "application", "type": "application/cwl", "href": "../algo.cwl"},
+                    {"rel": "application", "type": "application/cwl", "href": "file:///data/algo.cwl"},
+                    {"rel": "other", "type": None, "href": "https://foo.test/"},
+                    {"rel": "other", "href": None},
+                    "https://foo.test/",
+                ],
+            }
+        )
+    )
+    (tmp_path / "foorg" / "algo" / "local.cwl").write_text("cwlVersion: v1.2")
+    assert find_application_packages(tmp_path) == sorted(
+        [
+            "https://cwl.test/algo.cwl",
+            str(tmp_path / "foorg" / "algo" / "records" / ".." / "algo.cwl"),
+            "/data/algo.cwl",
+            str(tmp_path / "foorg" / "algo" / "local.cwl"),
+        ]
+    )
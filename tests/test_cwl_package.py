@@ -0,0 +1,81 @@
+from pathlib import Path
+
+import pytest
+
+from esa_apex_toolbox.cwl_package import CwlPackage
+from esa_apex_toolbox.cwl_to_udp_utils import get_cwl_inputs, load_string_from_any
+
+DATA_ROOT = Path(__file__).parent / "data"
+
+MULTI_WORKFLOW = """
+cwlVersion: v1.2
+$graph:
+  - class: Workflow
+    id: main
+    inputs:
+      aoi: string
+    outputs: []
+    steps:
+      preprocess:
+        run: "#preprocess"
+        in: {aoi: aoi}
+        out: [result]
+      inline:
+        run:
+          class: CommandLineTool
+          baseCommand: echo
+          inputs: {}
+          outputs: []
+        in: {}
+        out: []
+  - class: Workflow
+    id: "#preprocess"
+    inputs:
+      aoi: string
+      resolution: int
+    outputs: []
+    steps:
+      - id: "#preprocess/gdal"
+        run: "#gdal"
+        in: {}
+        out: []
+  - class: CommandLineTool
+    id: gdal
+    baseCommand: gdalwarp
+    inputs: []
+    outputs: []
+"""
+
+
+class TestCwlPackage:
+    def test_standalone(self):
+        package = CwlPackage.from_any(DATA_ROOT / "hello_world.cwl")
+        assert "main" in package
+        assert package.main["class"] == "CommandLineTool"
+        assert package.get_inputs() == get_cwl_inputs(load_string_from_any(DATA_ROOT / "hello_world.cwl"))
+
+    def test_graph(self):
+        package = CwlPackage.from_string(MULTI_WORKFLOW)
+        assert package.ids == ["main", "preprocess", "gdal"]
+        assert "#preprocess" in package
+        assert "nope" not in package
+        assert package.get_inputs() == {"aoi": "string"}
+        assert package.get_inputs("#preprocess") == {"aoi": "string", "resolution": "int"}
+        assert [id for id, _ in package.iter_processes(cls="Workflow")] == ["main", "preprocess"]
+
+    def test_resolve_run(self):
+        package = CwlPackage.from_string(MULTI_WORKFLOW)
+        steps = package.get_steps()
+        assert list(steps.keys()) == ["preprocess", "inline"]
+        assert package.resolve_run(steps["preprocess"]) is package.get_process("preprocess")
+        assert package.resolve_run(steps["inline"])["baseCommand"] == "echo"
+        sub_steps = package.get_steps("preprocess")
+        assert list(sub_steps.keys()) == ["gdal"]
+        assert package.resolve_run(sub_steps["gdal"])["baseCommand"] == "gdalwarp"
+
+    def test_resolve_run_unsupported(self):
+        package = CwlPackage.from_string(MULTI_WORKFLOW)
+        with pytest.raises(KeyError, match="Process '#nope' not found"):
+            package.resolve_run({"run": "#nope"})
+        with pytest.raises(ValueError, match="Unsupported 'run' reference 'other.cwl'"):
+            package.resolve_run({"run": "other.cwl"})
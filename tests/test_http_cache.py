@@ -0,0 +1,91 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from esa_apex_toolbox.algorithms import Algorithm
+from esa_apex_toolbox.http_cache import CacheMissError, HttpCache
+
+DATA_ROOT = Path(__file__).parent / "data"
+
+
+class TestHttpCache:
+    URL = "https://esa-apex.test/algorithms/a1.json"
+
+    @pytest.fixture
+    def cache(self, tmp_path) -> HttpCache:
+        return HttpCache(root=tmp_path / "cache", ttl=0)
+
+    def test_get_json_basic(self, cache, requests_mock):
+        requests_mock.get(self.URL, json={"hello": "world"})
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        assert requests_mock.call_count == 1
+
+    def test_ttl(self, tmp_path, requests_mock):
+        cache = HttpCache(root=tmp_path / "cache", ttl=60)
+        requests_mock.get(self.URL, json={"hello": "world"})
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        assert requests_mock.call_count == 1
+
+    def test_revalidate_etag(self, cache, requests_mock):
+        requests_mock.get(self.URL, json={"hello": "world"}, headers={"ETag": '"v1"'})
+        assert cache.get_json(self.URL) == {"hello": "world"}
+
+        mock = requests_mock.get(self.URL, status_code=304)
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        assert mock.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_revalidate_last_modified(self, cache, requests_mock):
+        last_modified = "Wed, 21 Oct 2026 07:28:00 GMT"
+        requests_mock.get(self.URL, json={"hello": "world"}, headers={"Last-Modified": last_modified})
+        assert cache.get_json(self.URL) == {"hello": "world"}
+
+        mock = requests_mock.get(self.URL, status_code=304)
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        assert mock.last_request.headers["If-Modified-Since"] == last_modified
+
+    def test_revalidate_changed(self, cache, requests_mock):
+        requests_mock.get(self.URL, json={"hello": "world"}, headers={"ETag": '"v1"'})
+        assert cache.get_json(self.URL) == {"hello": "world"}
+        requests_mock.get(self.URL, json={"hello": "space"}, headers={"ETag": '"v2"'})
+        assert cache.get_json(self.URL) == {"hello": "space"}
+
+    def test_accept_header_in_key(self, cache, requests_mock):
+        requests_mock.get(self.URL, json={"hello": "world"})
+        cache.get_json(self.URL, headers={"Accept": "application/json"})
+        cache.get_json(self.URL, headers={"Accept": "application/geo+json"})
+        assert requests_mock.call_count == 2
+
+    def test_offline(self, tmp_path, requests_mock):
+        requests_mock.get(self.URL, json={"hello": "world"})
+        HttpCache(root=tmp_path / "cache").get_json(self.URL)
+
+        offline = HttpCache(root=tmp_path / "cache", ttl=0, offline=True)
+        assert offline.get_json(self.URL) == {"hello": "world"}
+        assert requests_mock.call_count == 1
+        with pytest.raises(CacheMissError, match="No cache entry"):
+            offline.get_json("https://esa-apex.test/nope.json")
+
+    def test_lru_eviction(self, tmp_path, requests_mock):
+        cache = HttpCache(root=tmp_path / "cache", ttl=60, max_size=25)
+        for i in range(3):
+            requests_mock.get(f"https://esa-apex.test/{i}.json", text="0123456789")
+        cache.get("https://esa-apex.test/0.json")
+        cache.get("https://esa-apex.test/1.json")
+        # Make entry 1 the least recently used one
+        os.utime(cache.root / f"{cache._key('https://esa-apex.test/1.json')}.body", (1000, 1000))
+        cache.get("https://esa-apex.test/2.json")
+
+        assert len(list(cache.root.glob("*.body"))) == 2
+        assert requests_mock.call_count == 3
+        cache.get("https://esa-apex.test/0.json")
+        assert requests_mock.call_count == 3
+        cache.get("https://esa-apex.test/1.json")
+        assert requests_mock.call_count == 4
+
+    def test_algorithm_from_ogc_api_record(self, cache, requests_mock):
+        requests_mock.get(self.URL, text=(DATA_ROOT / "ogcapi-records/algorithm01.json").read_text())
+        algorithm = Algorithm.from_ogc_api_record(self.URL, cache=cache)
+        assert algorithm.id == "algorithm01"
+        assert list(cache.root.glob("*.body"))
@@ -0,0 +1,62 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Modules that should be cheap to import (e.g. for CLI tools that just parse a local record).
+LIGHTWEIGHT_MODULES = [
+    "esa_apex_toolbox.algorithms",
+    "esa_apex_toolbox.catalog_index",
+    "esa_apex_toolbox.cwl_to_udp_utils",
+    "esa_apex_toolbox.http_cache",
+    "esa_apex_toolbox.json_backend",
+    "esa_apex_toolbox.spatial_index",
+]
+
+# Heavy dependencies that should only be imported when actually needed.
+HEAVY_MODULES = ["requests", "urllib3", "yaml", "openeo", "httpx", "numpy", "pandas"]
+
+# Budget (in milliseconds) of the cold import of all lightweight modules together.
+# Generous compared to typical measurements (~50ms), to avoid flakiness on slow CI workers,
+# but well below the cost of pulling in e.g. `openeo` or `requests`.
+IMPORT_TIME_BUDGET_MS = 150
+
+
+def _import_time(statement: str) -> tuple:
+    """
+    Run given import statement in a fresh interpreter with `-X importtime`
+
+    :return: tuple of total cumulative import time (in milliseconds) of the `esa_apex_toolbox` modules
+        and the set of all imported module names.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    total_us = 0
+    modules = set()
+    for line in proc.stderr.splitlines():
+        match = re.match(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|( *)(\S+)", line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        modules.add(name)
+        if indent == " " and name.split(".")[0] == "esa_apex_toolbox":
+            total_us += int(cumulative_us)
+    return total_us / 1000, modules
+
+
+@pytest.mark.parametrize("module", LIGHTWEIGHT_MODULES)
+def test_no_heavy_imports(module):
+    _, modules = _import_time(f"import {module}")
+    assert modules.intersection(HEAVY_MODULES) == set()
+
+
+def test_import_time_budget():
+    statement = "; ".join(f"import {m}" for m in LIGHTWEIGHT_MODULES)
+    # Take best of a couple of runs to filter out noise.
+    best = min(_import_time(statement)[0] for _ in range(3))
+    assert 0 < best < IMPORT_TIME_BUDGET_MS
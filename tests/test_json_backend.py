@@ -0,0 +1,54 @@
+import json
+import math
+
+import pytest
+
+from esa_apex_toolbox import json_backend
+
+
+def _available_backends():
+    backends = []
+    for name in json_backend.BACKENDS:
+        try:
+            json_backend._get_decoder(name)
+        except ImportError:
+            continue
+        backends.append(name)
+    return backends
+
+
+@pytest.fixture(params=_available_backends())
+def backend(request):
+    original = json_backend.get_backend()
+    yield json_backend.set_backend(request.param)
+    json_backend.set_backend(original)
+
+
+def test_set_backend_auto():
+    assert json_backend.set_backend() == _available_backends()[0]
+    assert json_backend.get_backend() == _available_backends()[0]
+
+
+def test_set_backend_unknown():
+    with pytest.raises(ValueError, match="Unsupported JSON backend 'nope'"):
+        json_backend.set_backend("nope")
+
+
+@pytest.mark.parametrize("data", ['{"id": "foo", "bbox": [1, 2.5, 3, 4]}', b'[1, "\\u00e9", null, true]'])
+def test_loads(backend, data):
+    assert json_backend.loads(data) == json.loads(data)
+
+
+def test_loads_nan(backend):
+    assert math.isnan(json_backend.loads('{"x": NaN}')["x"])
+
+
+def test_loads_invalid(backend):
+    with pytest.raises(json.JSONDecodeError):
+        json_backend.loads('{"id": ')
+
+
+def test_load_file(backend, tmp_path):
+    path = tmp_path / "data.json"
+    path.write_text('{"title": "Caf\\u00e9", "name": "Ünïcode"}', encoding="utf8")
+    assert json_backend.load_file(path) == {"title": "Café", "name": "Ünïcode"}
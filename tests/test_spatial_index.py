@@ -0,0 +1,66 @@
+import random
+
+import pytest
+
+from esa_apex_toolbox.algorithms import Algorithm
+from esa_apex_toolbox.spatial_index import BBoxIndex
+
+
+def _brute_force(items, bbox):
+    w, s, e, n = bbox
+    return [k for k, (bw, bs, be, bn) in items if bw <= e and w <= be and bs <= n and s <= bn]
+
+
+class TestBBoxIndex:
+    def test_empty(self):
+        index = BBoxIndex([])
+        assert len(index) == 0
+        assert index.query_bbox((-180, -90, 180, 90)) == []
+        assert index.query_point(0, 0) == []
+
+    def test_basic(self):
+        index = BBoxIndex(
+            [
+                ("belgium", (2.5, 49.5, 6.4, 51.5)),
+                ("europe", (-25, 34, 45, 72)),
+                ("kenya", (33.9, -4.7, 41.9, 5.0)),
+            ]
+        )
+        assert len(index) == 3
+        assert index.query_point(4.35, 50.85) == ["belgium", "europe"]
+        assert index.query_point(37.0, 0.0) == ["kenya"]
+        assert index.query_point(-100, 40) == []
+        assert index.query_bbox((0, 0, 40, 50)) == ["belgium", "europe", "kenya"]
+        assert index.query_bbox((6.4, 51.5, 10, 52)) == ["belgium", "europe"]
+
+    def test_antimeridian(self):
+        index = BBoxIndex([("fiji", (177, -21, -178, -12)), ("nz", (166, -48, 179, -34))])
+        assert index.query_point(179.5, -17) == ["fiji"]
+        assert index.query_point(-179.5, -17) == ["fiji"]
+        assert index.query_bbox((178, -40, -179, -15)) == ["fiji", "nz"]
+
+    @pytest.mark.parametrize("node_capacity", [2, 4, 16])
+    def test_random_against_brute_force(self, node_capacity):
+        rng = random.Random(42)
+        items = []
+        for i in range(500):
+            x = rng.uniform(-180, 170)
+            y = rng.uniform(-90, 80)
+            items.append((f"item{i:03d}", (x, y, x + rng.uniform(0, 10), y + rng.uniform(0, 10))))
+        index = BBoxIndex(items, node_capacity=node_capacity)
+        for _ in range(100):
+            x = rng.uniform(-180, 160)
+            y = rng.uniform(-90, 70)
+            query = (x, y, x + rng.uniform(0, 20), y + rng.uniform(0, 20))
+            assert index.query_bbox(query) == _brute_force(items, query)
+
+    def test_from_algorithms(self):
+        algorithms = [
+            Algorithm(id="a1", bbox=(0, 0, 10, 10)),
+            Algorithm(id="a2", bbox=(20, 20, 30, 30)),
+            Algorithm(id="a3"),
+        ]
+        index = BBoxIndex.from_algorithms(algorithms)
+        assert len(index) == 2
+        assert index.query_point(5, 5) == ["a1"]
+        assert index.query_bbox((5, 5, 25, 25)) == ["a1", "a2"]
@@ -0,0 +1,87 @@
+"""
+Benchmark: memory footprint and parse time of algorithm records,
+comparing the fully decoded `Algorithm` dataclass with the lazy `AlgorithmRecordView`.
+
+Usage:
+
+    python utils/toolbox_benchmarks/algorithm_records.py --count 10000
+"""
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable
+
+from esa_apex_toolbox.algorithms import Algorithm, AlgorithmRecordView
+
+
+def synthetic_record(i: int) -> dict:
+    x = (i % 360) - 180
+    y = (i % 170) - 85
+    return {
+        "id": f"algorithm{i:05d}",
+        "type": "Feature",
+        "conformsTo": ["https://www.opengis.net/spec/ogcapi-records-1/1.0/req/record-core"],
+        "geometry": {"type": "Polygon", "coordinates": [[[x, y], [x + 1, y], [x + 1, y + 1], [x, y + 1], [x, y]]]},
+        "properties": {
+            "type": "service",
+            "title": f"Algorithm {i}",
+            "description": f"Synthetic algorithm number {i}. " * 10,
+            "keywords": ["vegetation", "synthetic"],
+            "contacts": [{"name": "Jane Doe", "organization": "VITO", "roles": ["principal investigator"]}],
+        },
+        "links": [
+            {
+                "rel": "application",
+                "type": "application/vnd.openeo+json;type=process",
+                "title": "openEO process",
+                "href": f"https://esa-apex.test/udp/algorithm{i:05d}.json",
+            },
+            {"rel": "service", "type": "application/json", "title": "openEO service", "href": "https://openeo.test/"},
+        ],
+        "license": "CC-BY-4.0",
+    }
+
+
+def measure(label: str, sources: list, parse: Callable[[dict], object]):
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    records = [parse(json.loads(s) if isinstance(s, str) else s) for s in sources]
+    parse_time = time.perf_counter() - start
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    fields = [(r.id, r.udp_link) for r in records]
+    access_time = time.perf_counter() - start
+    assert len(fields) == len(sources)
+
+    print(
+        f"{label:>20s}: parse {parse_time * 1000:8.1f} ms, access id+udp_link {access_time * 1000:6.1f} ms,"
+        f" retained {retained / 2**20:7.1f} MiB, peak {peak / 2**20:7.1f} MiB"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="Number of synthetic records")
+    args = parser.parse_args()
+
+    dumps = [json.dumps(synthetic_record(i)) for i in range(args.count)]
+    print(f"{args.count} synthetic records, from JSON strings (memory includes the raw dicts kept by the view)")
+    measure("Algorithm", dumps, Algorithm.from_ogc_api_record)
+    measure("AlgorithmRecordView", dumps, AlgorithmRecordView)
+
+    # Typical mirror use case: the raw record dicts are held in memory anyway.
+    dicts = [json.loads(d) for d in dumps]
+    print(f"{args.count} synthetic records, from already loaded dicts (memory on top of the dicts)")
+    measure("Algorithm", dicts, Algorithm.from_ogc_api_record)
+    measure("AlgorithmRecordView", dicts, AlgorithmRecordView)
+
+
+if __name__ == "__main__":
+    main()
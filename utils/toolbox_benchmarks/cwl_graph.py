@@ -0,0 +1,100 @@
+"""
+Benchmark: resolving all workflow steps of a synthetic CWL package with a large ``$graph``,
+comparing linear ``get_cwl_main``-style scans with the indexed `CwlPackage`.
+
+Usage:
+
+    python utils/toolbox_benchmarks/cwl_graph.py --steps 500
+"""
+
+import argparse
+import time
+
+import yaml
+
+from esa_apex_toolbox.cwl_package import CwlPackage
+from esa_apex_toolbox.cwl_to_udp_utils import get_cwl_main
+
+
+def synthetic_package(steps: int) -> str:
+    graph = [
+        {
+            "class": "Workflow",
+            "id": "main",
+            "inputs": {"aoi": {"type": "string", "doc": "Area of interest"}},
+            "outputs": [],
+            "steps": {
+                f"step{i:04d}": {"run": f"#tool{i:04d}", "in": {"aoi": "aoi"}, "out": ["result"]} for i in range(steps)
+            },
+        }
+    ]
+    for i in range(steps):
+        graph.append(
+            {
+                "class": "CommandLineTool",
+                "id": f"tool{i:04d}",
+                "baseCommand": ["python", f"tool{i:04d}.py"],
+                "inputs": {"aoi": {"type": "string", "inputBinding": {"prefix": "--aoi"}}},
+                "outputs": {"result": {"type": "Directory", "outputBinding": {"glob": "."}}},
+            }
+        )
+    return yaml.safe_dump({"cwlVersion": "v1.2", "$graph": graph}, sort_keys=False)
+
+
+def _timed(label: str, fun):
+    start = time.perf_counter()
+    result = fun()
+    print(f"{label:>48s}: {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def linear_scan(content: str) -> list:
+    """Resolve steps like existing callers do: parse once, linear scans of `$graph` per lookup."""
+    cwl_yaml = yaml.safe_load(content)
+    main = get_cwl_main(cwl_yaml)
+    graph = cwl_yaml["$graph"]
+    resolved = []
+    for step in main["steps"].values():
+        run_id = step["run"].lstrip("#")
+        resolved.append(next(item for item in graph if item.get("id") == run_id))
+    return resolved
+
+
+def linear_scan_reparse(content: str) -> list:
+    """Resolve steps with `get_cwl_main` on the raw string (reparsing YAML for each lookup)."""
+    main = get_cwl_main(content)
+    resolved = []
+    for step in list(main["steps"].values())[:3]:
+        run_id = step["run"].lstrip("#")
+        graph = yaml.safe_load(content)["$graph"]
+        resolved.append(next(item for item in graph if item.get("id") == run_id))
+    return resolved
+
+
+def indexed(content: str) -> list:
+    package = CwlPackage.from_string(content)
+    return [package.resolve_run(step) for step in package.get_steps().values()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--steps", type=int, default=500, help="Number of workflow steps (and tools).")
+    args = parser.parse_args()
+
+    content = synthetic_package(args.steps)
+    print(f"Synthetic CWL package with {args.steps} steps ({len(content) / 1024:.0f} KiB)")
+
+    _timed("YAML parse (SafeLoader)", lambda: yaml.load(content, Loader=yaml.SafeLoader))
+    _timed("YAML parse (CSafeLoader)", lambda: yaml.load(content, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader)))
+    _timed("get_cwl_main + reparse per lookup, 3 steps only", lambda: linear_scan_reparse(content))
+    expected = _timed("safe_load + linear $graph scan per step", lambda: linear_scan(content))
+    package = _timed("CwlPackage.from_string (index build)", lambda: CwlPackage.from_string(content))
+    resolved = _timed(
+        "CwlPackage.resolve_run of all steps", lambda: [package.resolve_run(s) for s in package.get_steps().values()]
+    )
+    _timed("CwlPackage end-to-end", lambda: indexed(content))
+    assert resolved == expected
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Microbenchmark: decoding all JSON files of the algorithm catalog with each available JSON backend
+of `esa_apex_toolbox.json_backend`.
+
+Usage:
+
+    python utils/toolbox_benchmarks/json_decoding.py --catalog-root algorithm_catalog --repeat 20
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+
+from esa_apex_toolbox import json_backend
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--catalog-root",
+        type=Path,
+        default=Path(__file__).parents[2] / "algorithm_catalog",
+        help="Path to the algorithm catalog root directory.",
+    )
+    parser.add_argument("--repeat", type=int, default=20, help="Number of passes over the catalog.")
+    args = parser.parse_args()
+
+    paths = []
+    contents = []
+    for path in sorted(args.catalog_root.glob("**/*.json")):
+        content = path.read_bytes()
+        try:
+            json.loads(content)
+        except ValueError as e:
+            print(f"Skipping invalid JSON file {path}: {e!r}")
+            continue
+        paths.append(path)
+        contents.append(content)
+    size = sum(len(c) for c in contents)
+    print(f"{len(paths)} JSON files ({size / 2**20:.1f} MiB) under {args.catalog_root}, {args.repeat} passes")
+
+    results = {}
+    for name in json_backend.BACKENDS:
+        try:
+            json_backend.set_backend(name)
+        except ImportError:
+            print(f"{name:>8s}: not installed")
+            continue
+        # Decoding from memory only
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for content in contents:
+                json_backend.loads(content)
+        decode_time = (time.perf_counter() - start) / args.repeat
+        # Including file reads (warm page cache)
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            for path in paths:
+                json_backend.load_file(path)
+        load_time = (time.perf_counter() - start) / args.repeat
+        results[name] = (decode_time, load_time)
+
+    baseline = results["json"][0]
+    for name, (decode_time, load_time) in results.items():
+        print(
+            f"{name:>8s}: decode {decode_time * 1000:7.2f} ms/pass ({size / decode_time / 2**20:6.1f} MiB/s),"
+            f" load files {load_time * 1000:7.2f} ms/pass, decode speedup vs stdlib {baseline / decode_time:.2f}x"
+        )
+    json_backend.set_backend()
+
+
+if __name__ == "__main__":
+    main()